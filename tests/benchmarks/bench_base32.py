@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import base32
+from ulid import ULID
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.fixture(params=list(base32.BACKENDS))
+def backend(request: pytest.FixtureRequest) -> tuple[base32.Encoder, base32.Decoder]:
+    return base32.BACKENDS[request.param]
+
+
+def test_encode(
+    benchmark: BenchmarkFixture, backend: tuple[base32.Encoder, base32.Decoder], ulid: ULID
+) -> None:
+    encode, _ = backend
+    assert benchmark(encode, ulid.bytes) == str(ulid)
+
+
+def test_decode(
+    benchmark: BenchmarkFixture, backend: tuple[base32.Encoder, base32.Decoder], ulid: ULID
+) -> None:
+    _, decode = backend
+    assert benchmark(decode, str(ulid)) == ulid.bytes
+
+
+def test_encode_timestamp(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    assert benchmark(base32.encode_timestamp, ulid.bytes[:6]) == str(ulid)[:10]
+
+
+def test_decode_timestamp(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    assert benchmark(base32.decode_timestamp, str(ulid)[:10]) == ulid.bytes[:6]
+
+
+def test_decode_milliseconds(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    assert benchmark(base32.decode_milliseconds, str(ulid)) == ulid.milliseconds
+
+
+def test_decode_milliseconds_from_str(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    # The baseline: decoding the whole ULID to read its timestamp.
+    assert (
+        benchmark(lambda value: ULID.from_str(value).milliseconds, str(ulid)) == ulid.milliseconds
+    )
+
+
+def test_decode_milliseconds_many(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    strs = [str(ulid)] * 100_000
+    assert benchmark(base32.decode_milliseconds_many, strs)[0] == ulid.milliseconds
+
+
+def test_encode_randomness(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    assert benchmark(base32.encode_randomness, ulid.bytes[6:]) == str(ulid)[10:]
+
+
+def test_decode_randomness(benchmark: BenchmarkFixture, ulid: ULID) -> None:
+    assert benchmark(base32.decode_randomness, str(ulid)[10:]) == ulid.bytes[6:]
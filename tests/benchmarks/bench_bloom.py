@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import ULID
+from ulid.bloom import ULIDBloomFilter
+from ulid.set import ULIDSet
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+N = 100_000
+WINDOW = 300
+
+
+@pytest.fixture(scope="module")
+def ulids() -> list[ULID]:
+    # Spread evenly over the window, so that every bucket receives its share of the capacity.
+    start = time.time() - WINDOW
+    return [ULID.from_timestamp(start + i * WINDOW / N) for i in range(N)]
+
+
+@pytest.fixture(scope="module")
+def dedupe(ulids: list[ULID]) -> ULIDBloomFilter:
+    dedupe = ULIDBloomFilter(window=WINDOW, capacity=N, error_rate=0.001)
+    for ulid in ulids:
+        dedupe.add(ulid)
+    return dedupe
+
+
+def test_add(benchmark: BenchmarkFixture) -> None:
+    # A separate filter, so that the benchmark does not fill the buckets of the other tests.
+    dedupe = ULIDBloomFilter(window=WINDOW, capacity=N, error_rate=0.001)
+    benchmark(lambda: dedupe.add(ULID()))
+
+
+@pytest.mark.parametrize("present", [True, False], ids=["hit", "miss"])
+def test_contains(
+    benchmark: BenchmarkFixture,
+    dedupe: ULIDBloomFilter,
+    ulids: list[ULID],
+    present: bool,  # noqa: FBT001
+) -> None:
+    ulid = ulids[N // 2] if present else ULID()
+    assert benchmark(dedupe.__contains__, ulid) is present
+
+
+def test_memory(dedupe: ULIDBloomFilter, ulids: list[ULID]) -> None:
+    # About 2 bytes per ULID for an error rate of 0.1%, compared to about 40 for a ULIDSet
+    assert dedupe.max_nbytes < ULIDSet(ulids).nbytes / 10
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import ULID
+from ulid.array import ULIDArray
+from ulid.file import ULIDFileReader
+from ulid.file import ULIDFileWriter
+from ulid.generator import ULIDGenerator
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+N = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def array() -> ULIDArray:
+    # One ULID per second, so that time ranges select a predictable number of ULIDs.
+    generator = ULIDGenerator()
+    start = int(time.time()) * 1000
+    array = ULIDArray.from_bytes(
+        b"".join([generator.generate_bytes(1, start + i * 1000) for i in range(N)])
+    )
+    array.sort()
+    return array
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory: pytest.TempPathFactory, array: ULIDArray) -> Path:
+    path = tmp_path_factory.mktemp("bench") / "ulids.bin"
+    with ULIDFileWriter(path) as writer:
+        writer.write_many(array)
+    return path
+
+
+@pytest.fixture(scope="module")
+def text_path(tmp_path_factory: pytest.TempPathFactory, array: ULIDArray) -> Path:
+    path = tmp_path_factory.mktemp("bench") / "ulids.txt"
+    path.write_text("\n".join(array.to_strs()) + "\n")
+    return path
+
+
+def test_write(benchmark: BenchmarkFixture, tmp_path: Path, array: ULIDArray) -> None:
+    def write() -> None:
+        with ULIDFileWriter(tmp_path / "ulids.bin") as writer:
+            writer.write_many(array)
+
+    benchmark(write)
+
+
+def test_write_stream(benchmark: BenchmarkFixture, tmp_path: Path, array: ULIDArray) -> None:
+    records = [bytes(array[i]) for i in range(100_000)]
+
+    def write() -> None:
+        with ULIDFileWriter(tmp_path / "ulids.bin") as writer:
+            for record in records:
+                writer.write(record)
+
+    benchmark(write)
+
+
+def test_open(benchmark: BenchmarkFixture, path: Path) -> None:
+    def open_file() -> int:
+        with ULIDFileReader(path) as reader:
+            return len(reader)
+
+    assert benchmark(open_file) == N
+
+
+def test_open_text(benchmark: BenchmarkFixture, text_path: Path) -> None:
+    # The baseline: reading a text file with one ULID per line.
+    def open_file() -> int:
+        with text_path.open() as f:
+            return len({ULID.from_str(line.rstrip("\n")) for line in f})
+
+    assert benchmark.pedantic(open_file, rounds=3) == N
+
+
+def test_contains(benchmark: BenchmarkFixture, path: Path, array: ULIDArray) -> None:
+    ulid = array[N // 3]
+    with ULIDFileReader(path) as reader:
+        assert benchmark(reader.__contains__, ulid)
+
+
+def test_time_range(benchmark: BenchmarkFixture, path: Path, array: ULIDArray) -> None:
+    start = array[N // 2].datetime
+    with ULIDFileReader(path) as reader:
+        result = benchmark(reader.time_range, start, start.timestamp() + 3600)
+        assert len(result) == 3601  # noqa: PLR2004
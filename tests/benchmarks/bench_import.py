@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def import_time() -> int:
+    """Import ``ulid`` in a fresh interpreter and return the cumulative import time in µs as
+    reported by ``-X importtime``.
+    """
+    # Allow the interpreter to cache the bytecode as it would in a regular installation.
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ulid"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "ulid":
+            return int(cumulative)
+    raise AssertionError(f"No import time reported for ulid:\n{result.stderr}")
+
+
+def test_import(benchmark: BenchmarkFixture) -> None:
+    times: list[int] = []
+    benchmark.pedantic(lambda: times.append(import_time()), rounds=10, warmup_rounds=1)
+    benchmark.extra_info["import_time_us"] = statistics.median(times)
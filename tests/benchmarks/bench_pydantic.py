@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from typing import TYPE_CHECKING
+
+import pytest
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+from ulid import ULID
+from ulid.pydantic import BytesULID  # noqa: TCH001
+from ulid.pydantic import StrULID  # noqa: TCH001
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+N = 10000
+
+
+class Model(BaseModel):
+    id: ULID
+    parent: ULID
+
+
+class StrModel(BaseModel):
+    id: StrULID
+    parent: StrULID
+
+
+class BytesModel(BaseModel):
+    id: BytesULID
+    parent: BytesULID
+
+
+@pytest.fixture(scope="module")
+def ulids() -> list[tuple[ULID, ULID]]:
+    return [(ULID(), ULID()) for _ in range(N)]
+
+
+@pytest.mark.parametrize(
+    ("model", "convert"),
+    [
+        pytest.param(Model, str, id="default-str"),
+        pytest.param(Model, int, id="default-int"),
+        pytest.param(Model, lambda ulid: ulid, id="default-ulid"),
+        pytest.param(StrModel, str, id="str"),
+        pytest.param(BytesModel, bytes, id="bytes"),
+    ],
+)
+def test_validate_python(
+    benchmark: BenchmarkFixture,
+    ulids: list[tuple[ULID, ULID]],
+    model: type[BaseModel],
+    convert: Any,
+) -> None:
+    adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+    data = [{"id": convert(a), "parent": convert(b)} for a, b in ulids]
+    assert len(benchmark(adapter.validate_python, data)) == N
+
+
+@pytest.mark.parametrize("model", [Model, StrModel], ids=["default", "str"])
+def test_validate_json(
+    benchmark: BenchmarkFixture, ulids: list[tuple[ULID, ULID]], model: type[BaseModel]
+) -> None:
+    adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+    data = json.dumps([{"id": str(a), "parent": str(b)} for a, b in ulids]).encode()
+    assert len(benchmark(adapter.validate_json, data)) == N
+
+
+def test_dump_json(benchmark: BenchmarkFixture, ulids: list[tuple[ULID, ULID]]) -> None:
+    adapter = TypeAdapter(list[Model])
+    models = [Model(id=a, parent=b) for a, b in ulids]
+    benchmark(adapter.dump_json, models)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import constants
+from ulid import ULID
+from ulid.array import ULIDArray
+from ulid.set import ULIDSet
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+N = 100_000
+
+# Upper bound for the memory per ULID at the highest load before the table grows
+MAX_BYTES_PER_ENTRY = 48
+
+
+@pytest.fixture(scope="module")
+def array() -> ULIDArray:
+    return ULIDArray.from_bytes(os.urandom(N * constants.BYTES_LEN))
+
+
+@pytest.fixture(scope="module")
+def ulid_set(array: ULIDArray) -> ULIDSet:
+    return ULIDSet(array)
+
+
+def test_update(benchmark: BenchmarkFixture, array: ULIDArray) -> None:
+    assert len(benchmark(ULIDSet, array)) == N
+
+
+def test_update_strs(benchmark: BenchmarkFixture, array: ULIDArray) -> None:
+    strs = array.to_strs()
+    assert len(benchmark(ULIDSet, strs)) == N
+
+
+def test_add(benchmark: BenchmarkFixture, ulid_set: ULIDSet) -> None:
+    benchmark(ulid_set.add, ULID())
+
+
+@pytest.mark.parametrize("present", [True, False], ids=["hit", "miss"])
+def test_contains(
+    benchmark: BenchmarkFixture,
+    ulid_set: ULIDSet,
+    array: ULIDArray,
+    present: bool,  # noqa: FBT001
+) -> None:
+    ulid = array[N // 2] if present else ULID()
+    assert benchmark(ulid_set.__contains__, ulid) is present
+
+
+def test_memory_per_entry(array: ULIDArray) -> None:
+    n = int(2**17 * 0.75)
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        values = ULIDSet(array[:n])
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    size = (end - start) / len(values)
+    assert size <= MAX_BYTES_PER_ENTRY, f"ULIDSet uses {size:.1f} bytes per ULID"
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import base32
+from ulid import constants
+from ulid import sqlite
+from ulid.array import ULIDArray
+from ulid.generator import ULIDGenerator
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+N = 1_000_000
+
+# One hour of ULIDs, which are created once per second
+RANGE = 3600
+
+
+@pytest.fixture(scope="module")
+def array() -> ULIDArray:
+    # One ULID per second, so that time ranges select a predictable number of rows.
+    generator = ULIDGenerator()
+    start = int(time.time()) * 1000
+    return ULIDArray.from_bytes(
+        b"".join([generator.generate_bytes(1, start + i * 1000) for i in range(N)])
+    )
+
+
+def _create(column: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute(f"CREATE TABLE events (id {column} PRIMARY KEY) WITHOUT ROWID")
+    return connection
+
+
+def _bounds(array: ULIDArray) -> tuple[bytes, bytes]:
+    timestamp = bytes(array[N // 2])[: constants.TIMESTAMP_LEN]
+    end = (int.from_bytes(timestamp, "big") + RANGE * 1000).to_bytes(constants.TIMESTAMP_LEN, "big")
+    low = timestamp + bytes(constants.RANDOMNESS_LEN)
+    high = end + b"\xff" * constants.RANDOMNESS_LEN
+    return low, high
+
+
+@pytest.fixture(scope="module")
+def blob_table(array: ULIDArray) -> Iterator[sqlite3.Connection]:
+    connection = _create("BLOB")
+    sqlite.insert(connection, "events", array)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def text_table(array: ULIDArray) -> Iterator[sqlite3.Connection]:
+    connection = _create("TEXT")
+    connection.executemany("INSERT INTO events VALUES (?)", ((s,) for s in array.to_strs()))
+    yield connection
+    connection.close()
+
+
+def test_insert_blob(benchmark: BenchmarkFixture, array: ULIDArray) -> None:
+    def insert(connection: sqlite3.Connection) -> None:
+        sqlite.insert(connection, "events", array)
+
+    benchmark.pedantic(insert, setup=lambda: ((_create("BLOB"),), {}), rounds=3)
+
+
+def test_insert_blob_rows(benchmark: BenchmarkFixture, array: ULIDArray) -> None:
+    def insert(connection: sqlite3.Connection) -> None:
+        connection.executemany("INSERT INTO events VALUES (?)", sqlite.rows(array))
+
+    benchmark.pedantic(insert, setup=lambda: ((_create("BLOB"),), {}), rounds=3)
+
+
+def test_insert_text(benchmark: BenchmarkFixture, array: ULIDArray) -> None:
+    # The baseline: storing the ULIDs as base32 strings.
+    strings = array.to_strs()
+
+    def insert(connection: sqlite3.Connection) -> None:
+        connection.executemany("INSERT INTO events VALUES (?)", ((s,) for s in strings))
+
+    benchmark.pedantic(insert, setup=lambda: ((_create("TEXT"),), {}), rounds=3)
+
+
+def test_range_blob(
+    benchmark: BenchmarkFixture, blob_table: sqlite3.Connection, array: ULIDArray
+) -> None:
+    low, high = _bounds(array)
+
+    def query() -> list[tuple[bytes]]:
+        return blob_table.execute(
+            "SELECT id FROM events WHERE id BETWEEN ? AND ?", (low, high)
+        ).fetchall()
+
+    assert len(benchmark(query)) == RANGE + 1
+
+
+def test_range_text(
+    benchmark: BenchmarkFixture, text_table: sqlite3.Connection, array: ULIDArray
+) -> None:
+    low, high = (base32.encode(bound) for bound in _bounds(array))
+
+    def query() -> list[tuple[str]]:
+        return text_table.execute(
+            "SELECT id FROM events WHERE id BETWEEN ? AND ?", (low, high)
+        ).fetchall()
+
+    assert len(benchmark(query)) == RANGE + 1
+
+
+def test_size(blob_table: sqlite3.Connection, text_table: sqlite3.Connection) -> None:
+    def size(connection: sqlite3.Connection) -> int:
+        (pages,) = connection.execute("PRAGMA page_count").fetchone()
+        (page_size,) = connection.execute("PRAGMA page_size").fetchone()
+        return int(pages * page_size)
+
+    assert size(blob_table) < size(text_table)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import random
+import tracemalloc
+from typing import Any
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import base32
+from ulid import cache
+from ulid import IntULID
+from ulid import ULID
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+# Upper bounds for the memory that a single instance occupies, including its `bytes` or `int`
+# value and the empty slot for its cached string, so that additional attributes or caches are
+# noticed.
+MAX_BYTES_PER_INSTANCE = {
+    ULID: 104,
+    IntULID: 104,
+}
+
+SORT_SIZE = 1_000_000
+
+
+def test_generate(benchmark: BenchmarkFixture) -> None:
+    benchmark(ULID)
+
+
+@pytest.mark.parametrize(
+    ("constructor", "value"),
+    [
+        ("from_bytes", lambda ulid: ulid.bytes),
+        ("from_str", str),
+        ("from_hex", lambda ulid: ulid.hex),
+        ("from_int", int),
+        ("from_uuid", lambda ulid: ulid.to_uuid()),
+        ("from_timestamp", lambda ulid: ulid.timestamp),
+        ("from_datetime", lambda ulid: ulid.datetime),
+    ],
+)
+def test_from(
+    benchmark: BenchmarkFixture, ulid: ULID, constructor: str, value: Callable[[ULID], Any]
+) -> None:
+    result = benchmark(getattr(ULID, constructor), value(ulid))
+    assert result.milliseconds == ulid.milliseconds
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(lambda ulid: ulid, id="ULID"),
+        pytest.param(lambda ulid: ulid.to_uuid(), id="UUID"),
+        pytest.param(lambda ulid: ulid.bytes, id="bytes"),
+        pytest.param(str, id="str"),
+        pytest.param(lambda ulid: ulid.hex, id="str-hex"),
+        pytest.param(lambda ulid: str(ulid.to_uuid()), id="str-uuid"),
+        pytest.param(int, id="int"),
+        pytest.param(lambda ulid: ulid.milliseconds, id="int-milliseconds"),
+        pytest.param(lambda ulid: ulid.timestamp, id="float"),
+        pytest.param(lambda ulid: ulid.datetime, id="datetime"),
+    ],
+)
+def test_parse(benchmark: BenchmarkFixture, ulid: ULID, value: Callable[[ULID], Any]) -> None:
+    result = benchmark(ULID.parse, value(ulid))
+    assert result.milliseconds == ulid.milliseconds
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        pytest.param(lambda ulids: [str(ulid) for ulid in ulids], id="str"),
+        pytest.param(lambda ulids: [int(ulid) for ulid in ulids], id="int"),
+        pytest.param(lambda ulids: [ulid.bytes for ulid in ulids], id="bytes"),
+        pytest.param(
+            lambda ulids: [str(ulid) if i % 2 else int(ulid) for i, ulid in enumerate(ulids)],
+            id="mixed",
+        ),
+    ],
+)
+@pytest.mark.parametrize("bulk", [False, True], ids=["parse", "parse_many"])
+def test_parse_column(
+    benchmark: BenchmarkFixture,
+    column: Callable[[list[ULID]], list[Any]],
+    bulk: bool,  # noqa: FBT001
+) -> None:
+    values = column(ULID.generate_many(10000))
+    if bulk:
+        benchmark(ULID.parse_many, values)
+    else:
+        benchmark(lambda: [ULID.parse(value) for value in values])
+
+
+@pytest.mark.parametrize("maxsize", [None, 4096], ids=["uncached", "cached"])
+def test_from_str_hot(benchmark: BenchmarkFixture, maxsize: int | None) -> None:
+    # Parse a working set of a few thousand IDs again and again, like IDs of tenants or resources.
+    values = [str(ULID()) for _ in range(2000)]
+
+    def parse() -> None:
+        for value in values:
+            ULID.from_str(value)
+
+    if maxsize is not None:
+        cache.enable(maxsize)
+        parse()
+    try:
+        benchmark(parse)
+    finally:
+        cache.disable()
+
+
+@pytest.mark.parametrize(
+    "conversion",
+    [
+        # `str` caches the encoded string on the instance, so that the encoding is timed directly.
+        pytest.param(lambda ulid: base32.encode(ulid.bytes), id="str"),
+        pytest.param(int, id="int"),
+        pytest.param(lambda ulid: ulid.hex, id="hex"),
+        pytest.param(lambda ulid: ulid.to_uuid(), id="to_uuid"),
+        pytest.param(lambda ulid: ulid.to_uuid4(), id="to_uuid4"),
+        pytest.param(lambda ulid: ulid.datetime, id="datetime"),
+        pytest.param(lambda ulid: ulid.timestamp, id="timestamp"),
+    ],
+)
+def test_convert(
+    benchmark: BenchmarkFixture, ulid: ULID, conversion: Callable[[ULID], Any]
+) -> None:
+    benchmark(conversion, ulid)
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_lt(benchmark: BenchmarkFixture, cls: type[ULID], ulid: ULID, other: ULID) -> None:
+    a, b = cls.from_bytes(ulid.bytes), cls.from_bytes(other.bytes)
+    assert benchmark(a.__lt__, b)
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_eq(benchmark: BenchmarkFixture, cls: type[ULID], ulid: ULID) -> None:
+    a, b = cls.from_bytes(ulid.bytes), cls.from_bytes(ulid.bytes)
+    assert benchmark(a.__eq__, b)
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_hash(benchmark: BenchmarkFixture, cls: type[ULID], ulid: ULID) -> None:
+    benchmark(hash, cls.from_bytes(ulid.bytes))
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_sort(benchmark: BenchmarkFixture, cls: type[ULID]) -> None:
+    values = [cls() for _ in range(10000)]
+    result = benchmark(sorted, values)
+    assert all(a <= b for a, b in zip(result, result[1:]))
+
+
+def test_sort_mixed(benchmark: BenchmarkFixture) -> None:
+    # Every comparison of a ULID with a string key compares `str(ulid)`.
+    ulids = [ULID() for _ in range(SORT_SIZE)]
+    random.shuffle(ulids)
+    values = [ulid.bytes if i % 2 else str(ulid) for i, ulid in enumerate(ulids)]
+
+    def setup() -> tuple[tuple[list[ULID | str]], dict[str, Any]]:
+        # Fresh objects for every round, so that no string is cached before sorting.
+        return ([ULID(value) if isinstance(value, bytes) else value for value in values],), {}
+
+    result = benchmark.pedantic(sorted, setup=setup, rounds=3)
+    assert [str(value) for value in result] == sorted(map(str, ulids))
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_memory_per_instance(cls: type[ULID]) -> None:
+    n = 10000
+    values: list[ULID | None] = [None] * n
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for i in range(n):
+            values[i] = cls()
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    size = (end - start) / n
+    assert size <= MAX_BYTES_PER_INSTANCE[cls], f"{cls.__name__} uses {size:.1f} bytes"
@@ -0,0 +1,30 @@
+# Benchmarks are collected from `bench_*.py` files, so that they don't run with the regular tests.
+# Run them with `hatch run bench:run`, store a baseline with `hatch run bench:save` and compare
+# against the latest baseline with `hatch run bench:compare`, which fails if the median of a
+# benchmark has regressed by more than `BENCH_THRESHOLD` (default: 10%).
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ulid import ULID
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from uuid import UUID
+
+
+@pytest.fixture(scope="module")
+def ulid() -> ULID:
+    return ULID.from_str("01HASFKBN8SKZTSVVS03K5AMMS")
+
+
+@pytest.fixture(scope="module")
+def other() -> ULID:
+    return ULID.from_str("01HASFKBN8SKZTSVVS03K5AMMT")
+
+
+@pytest.fixture(scope="module")
+def uuid(ulid: ULID) -> UUID:
+    return ulid.to_uuid()
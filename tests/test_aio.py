@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from unittest import mock
+
+import pytest
+from freezegun import freeze_time
+
+from ulid import constants
+from ulid import ULID
+from ulid.aio import AsyncULIDSource
+
+
+def wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_next() -> None:
+    async def main() -> list[ULID]:
+        async with AsyncULIDSource() as source:
+            return [await source.next() for _ in range(100)]
+
+    before = ULID()
+    ulids = asyncio.run(main())
+    assert len(set(ulids)) == 100  # noqa: PLR2004
+    assert all(isinstance(ulid, ULID) for ulid in ulids)
+    assert all(ulid.milliseconds >= before.milliseconds for ulid in ulids)
+
+
+@freeze_time("2024-10-11 12:00:00")
+def test_next_uses_current_time() -> None:
+    async def main() -> ULID:
+        async with AsyncULIDSource() as source:
+            return await source.next()
+
+    assert asyncio.run(main()).milliseconds == ULID.from_timestamp(1728648000000).milliseconds
+
+
+def test_async_iterator() -> None:
+    async def main() -> list[ULID]:
+        ulids = []
+        async with AsyncULIDSource() as source:
+            async for ulid in source:
+                ulids.append(ulid)
+                if len(ulids) == 10:  # noqa: PLR2004
+                    break
+        return ulids
+
+    assert len(set(asyncio.run(main()))) == 10  # noqa: PLR2004
+
+
+def test_refill_watermarks() -> None:
+    source = AsyncULIDSource(low=10, high=50)
+    with mock.patch("ulid.entropy.random_bytes", wraps=lambda n: b"\x01" * n) as urandom:
+        source.start()
+        wait_for(lambda: source.available == 50)  # noqa: PLR2004
+        assert urandom.call_args_list == [mock.call(50 * constants.RANDOMNESS_LEN)]
+
+        async def take(n: int) -> list[ULID]:
+            return [await source.next() for _ in range(n)]
+
+        ulids = asyncio.run(take(40))
+        assert all(ulid.bytes.endswith(b"\x01" * constants.RANDOMNESS_LEN) for ulid in ulids)
+        assert urandom.call_count == 1
+        asyncio.run(take(1))
+        wait_for(lambda: source.available == 50)  # noqa: PLR2004
+        assert urandom.call_args_list[1] == mock.call(41 * constants.RANDOMNESS_LEN)
+    source.close()
+    assert source.available == 0
+
+
+def test_empty_pool_draws_randomness_in_thread() -> None:
+    async def main() -> ULID:
+        async with AsyncULIDSource() as source:
+            source._pool.clear()  # noqa: SLF001
+            with mock.patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+                ulid = await source.next()
+            random_bytes = source._random_bytes  # noqa: SLF001
+            to_thread.assert_called_once_with(random_bytes, constants.RANDOMNESS_LEN)
+            return ulid
+
+    assert isinstance(asyncio.run(main()), ULID)
+
+
+@pytest.mark.parametrize(("low", "high"), [(-1, 10), (10, 10), (20, 10)])
+def test_invalid_watermarks(low: int, high: int) -> None:
+    with pytest.raises(ValueError, match="Watermarks"):
+        AsyncULIDSource(low=low, high=high)
+
+
+def test_closed() -> None:
+    source = AsyncULIDSource()
+    source.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        source.start()
+
+
+def test_aclose_does_not_block_event_loop() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_entropy(n: int) -> bytes:
+        entered.set()
+        release.wait(5)
+        return b"\x01" * n
+
+    async def main() -> None:
+        source = AsyncULIDSource(entropy=slow_entropy)
+        source.start()
+        await asyncio.to_thread(entered.wait, 5)
+        # The refill is still running. A blocking join would stall the loop until it times out.
+        closing = asyncio.ensure_future(source.aclose())
+        await asyncio.sleep(0.01)
+        assert not closing.done()
+        release.set()
+        await asyncio.wait_for(closing, 5)
+        assert source.available == 0
+
+    asyncio.run(main())
+
+
+def test_entropy() -> None:
+    async def main() -> ULID:
+        async with AsyncULIDSource(entropy=lambda n: b"\x01" * n) as source:
+            return await source.next()
+
+    assert asyncio.run(main()).bytes.endswith(b"\x01" * constants.RANDOMNESS_LEN)
+
+
+def test_after_fork() -> None:
+    async def main() -> None:
+        source = AsyncULIDSource()
+        await source.next()
+        wait_for(lambda: source.available > 0)
+        source._after_fork()  # noqa: SLF001
+        assert source.available == 0
+        assert isinstance(await source.next(), ULID)
+        source.close()
+
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+import os
+import pickle
+
+import pytest
+
+from ulid import constants
+from ulid import ULID
+from ulid.array import ULIDArray
+
+
+@pytest.fixture
+def ulids() -> list[ULID]:
+    return [ULID.from_bytes(os.urandom(constants.BYTES_LEN)) for _ in range(100)]
+
+
+def test_array(ulids: list[ULID]) -> None:
+    array = ULIDArray(ulids)
+    assert len(array) == len(ulids)
+    assert array.nbytes == len(ulids) * constants.BYTES_LEN
+    assert list(array) == ulids
+    assert array[0] == ulids[0]
+    assert array[-1] == ulids[-1]
+    assert isinstance(array[0], ULID)
+    assert bytes(array) == b"".join(u.bytes for u in ulids)
+    assert array == ULIDArray(ulids)
+    assert array != ULIDArray(ulids[1:])
+    with pytest.raises(IndexError):
+        array[len(ulids)]
+    with pytest.raises(IndexError):
+        array[-len(ulids) - 1]
+
+
+def test_array_from_bytes(ulids: list[ULID]) -> None:
+    data = b"".join(u.bytes for u in ulids)
+    array = ULIDArray.from_bytes(data)
+    assert list(array) == ulids
+    with pytest.raises(ValueError):  # noqa: PT011
+        ULIDArray.from_bytes(data[:-1])
+
+
+def test_array_strs(ulids: list[ULID]) -> None:
+    strings = [str(u) for u in ulids]
+    array = ULIDArray.from_strs(strings)
+    assert list(array) == ulids
+    assert array.to_strs() == strings
+    assert array[10:20].to_strs() == strings[10:20]
+    assert repr(ULIDArray(ulids[:2])) == f"ULIDArray({strings[:2]!r})"
+
+
+def test_array_append_extend(ulids: list[ULID]) -> None:
+    array = ULIDArray()
+    array.append(ulids[0])
+    array.append(ulids[1].bytes)
+    array.extend(ulids[2:50])
+    array.extend(ULIDArray(ulids[50:]))
+    array.extend([])
+    array.extend(ULIDArray())
+    assert list(array) == ulids
+    with pytest.raises(TypeError):
+        array.append(b"not-enough")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        array.append(str(ulids[0]))  # type: ignore[arg-type]
+
+
+def test_array_slice_is_view(ulids: list[ULID]) -> None:
+    array = ULIDArray(ulids)
+    view = array[10:20]
+    assert list(view) == ulids[10:20]
+    assert list(array[::2]) == ulids[::2]
+    assert list(array[::-1]) == ulids[::-1]
+    assert list(array[20:10]) == []
+    assert list(view[2:4]) == ulids[12:14]
+
+    array.sort()
+    assert list(view) == sorted(ulids)[10:20]
+
+    # Growing a view or the original array does not affect any other array
+    view.append(ulids[0])
+    assert len(array) == len(ulids)
+    assert view[-1] == ulids[0]
+    array.append(ulids[0])
+    assert len(view) == 11  # noqa: PLR2004
+    assert array[-1] == ulids[0]
+
+
+def test_array_grow_exported_buffer(ulids: list[ULID]) -> None:
+    data = bytearray(b"".join(u.bytes for u in ulids))
+    array = ULIDArray.from_bytes(data)
+    with memoryview(data):
+        array.append(ulids[0])
+    assert len(array) == len(ulids) + 1
+    assert len(data) == len(ulids) * constants.BYTES_LEN
+
+
+def test_array_sort(ulids: list[ULID]) -> None:
+    array = ULIDArray(ulids)
+    assert not array.is_sorted
+    array.sort()
+    assert array.is_sorted
+    assert list(array) == sorted(ulids)
+    assert array.to_strs() == sorted(str(u) for u in ulids)
+
+    immutable = ULIDArray.from_bytes(b"".join(u.bytes for u in ulids))
+    immutable.sort()
+    assert list(immutable) == sorted(ulids)
+
+
+def test_array_is_sorted(ulids: list[ULID]) -> None:
+    ulids = sorted(ulids)
+    array = ULIDArray(ulids[:10])
+    assert array.is_sorted
+    array.append(ulids[10])
+    array.extend(ulids[11:20])
+    array.extend(ULIDArray(ulids[20:30]))
+    assert array.is_sorted
+    assert array[5:10].is_sorted
+    array.append(ulids[0])
+    assert not array.is_sorted
+
+    array = ULIDArray(ulids[10:])
+    array.extend(ulids[:10])
+    assert not array.is_sorted
+
+    array = ULIDArray(ulids[10:])
+    array.extend(ULIDArray(ulids[:10]))
+    assert not array.is_sorted
+
+
+@pytest.mark.parametrize("sort", [False, True])
+def test_array_contains(ulids: list[ULID], sort: bool) -> None:  # noqa: FBT001
+    array = ULIDArray(ulids)
+    if sort:
+        array.sort()
+    for ulid in ulids:
+        assert ulid in array
+        assert ulid.bytes in array
+        assert array[array.index(ulid)] == ulid
+    assert ULID() not in array
+    assert "not-a-ulid" not in array
+    assert ULID.from_bytes(ulids[0].bytes[1:] + ulids[1].bytes[:1]) not in array
+    with pytest.raises(ValueError):  # noqa: PT011
+        array.index(ULID())
+    with pytest.raises(ValueError):  # noqa: PT011
+        array.index(array[0], 1)
+
+
+def test_array_contains_unaligned() -> None:
+    first = ULID.from_bytes(b"\x00" * 8 + b"\x01" * 8)
+    second = ULID.from_bytes(b"\x01" * 8 + b"\x02" * 8)
+    array = ULIDArray([first, second, first])
+    assert ULID.from_bytes(b"\x01" * 16) not in array
+    assert array.index(first, 1) == 2  # noqa: PLR2004
+
+
+def test_array_pickle(ulids: list[ULID]) -> None:
+    array = ULIDArray(ulids)[10:20]
+    unpickled = pickle.loads(pickle.dumps(array))  # noqa: S301
+    assert unpickled == array
+    unpickled.append(ulids[0])
+    assert len(unpickled) == 11  # noqa: PLR2004
+
+
+def test_array_parse_many() -> None:
+    ulids = [ULID() for _ in range(100)]
+    values = [str(ulid) for ulid in ulids[:50]] + [int(ulid) for ulid in ulids[50:]]
+    array = ULIDArray.parse_many(values)
+    assert list(array) == ulids
+    assert not array.is_sorted
+
+    errors: list[tuple[int, Exception]] = []
+    assert list(ULIDArray.parse_many(["invalid", *values], errors=errors)) == ulids
+    assert [index for index, _ in errors] == [0]
+
+
+def test_array_milliseconds(ulids: list[ULID]) -> None:
+    array = ULIDArray(ulids)
+    assert array.milliseconds() == [ulid.milliseconds for ulid in ulids]
+    assert array[10:20].milliseconds() == [ulid.milliseconds for ulid in ulids[10:20]]
+    assert ULIDArray.from_bytes(bytes(array)).milliseconds() == array.milliseconds()
+    assert ULIDArray().milliseconds() == []
@@ -1,11 +1,13 @@
 import os
 from collections.abc import Callable
+from collections.abc import Iterator
 from typing import Any
 
 import pytest
 
 from ulid import base32
 from ulid import constants
+from ulid import ULID
 
 
 @pytest.mark.parametrize(
@@ -29,3 +31,109 @@ from ulid import constants
 def test_invalid_input(func: Callable, value: Any) -> None:
     with pytest.raises(ValueError):  # noqa: PT011
         func(value)
+
+
+@pytest.fixture
+def restore_backend() -> Iterator[None]:
+    encode, decode = base32.encode, base32.decode
+    yield
+    base32.encode, base32.decode = encode, decode
+
+
+@pytest.mark.parametrize("backend", sorted(base32.BACKENDS))
+def test_backend_roundtrip(backend: str) -> None:
+    encode, decode = base32.BACKENDS[backend]
+    values = [b"\x00" * constants.BYTES_LEN, b"\xff" * constants.BYTES_LEN]
+    values += [os.urandom(constants.BYTES_LEN) for _ in range(100)]
+    for value in values:
+        encoded = encode(value)
+        assert encoded == base32.encode_timestamp(
+            value[: constants.TIMESTAMP_LEN]
+        ) + base32.encode_randomness(value[constants.TIMESTAMP_LEN :])
+        assert decode(encoded) == value
+
+
+@pytest.mark.parametrize("backend", sorted(base32.BACKENDS))
+@pytest.mark.parametrize(
+    "value",
+    [
+        "A" * (constants.REPR_LEN - 1),
+        "A" * (constants.REPR_LEN + 1),
+        "8" + "0" * (constants.REPR_LEN - 1),
+        "Z" * constants.REPR_LEN,
+        "0" * (constants.REPR_LEN - 1) + "U",
+        "0" * (constants.REPR_LEN - 1) + "a",
+        "0" * (constants.REPR_LEN - 1) + "é",
+        "0" * (constants.REPR_LEN - 1) + " ",
+        "+" + "0" * (constants.REPR_LEN - 1),
+        "0" * (constants.REPR_LEN - 2) + "_0",
+    ],
+)
+def test_backend_decode_invalid_input(backend: str, value: str) -> None:
+    _, decode = base32.BACKENDS[backend]
+    with pytest.raises(ValueError):  # noqa: PT011
+        decode(value)
+
+
+@pytest.mark.usefixtures("restore_backend")
+@pytest.mark.parametrize("backend", sorted(base32.BACKENDS))
+def test_set_backend(backend: str) -> None:
+    base32.set_backend(backend)
+    assert (base32.encode, base32.decode) == base32.BACKENDS[backend]
+    ulid = ULID()
+    assert ULID.from_str(str(ulid)) == ulid
+
+
+@pytest.mark.usefixtures("restore_backend")
+def test_set_unknown_backend() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        base32.set_backend("unknown")
+
+
+@pytest.mark.usefixtures("restore_backend")
+def test_select_backend() -> None:
+    name = base32.select_backend(number=10)
+    assert (base32.encode, base32.decode) == base32.BACKENDS[name]
+
+
+def test_decode_milliseconds() -> None:
+    values = [ULID.from_bytes(os.urandom(constants.BYTES_LEN)) for _ in range(100)]
+    values += [ULID.from_bytes(b"\x00" * 16), ULID.from_bytes(b"\xff" * 16)]
+    for ulid in values:
+        encoded = str(ulid)
+        assert base32.decode_milliseconds(encoded) == ulid.milliseconds
+        assert (
+            base32.decode_milliseconds(encoded[: constants.TIMESTAMP_REPR_LEN]) == ulid.milliseconds
+        )
+        assert base32.decode_milliseconds(encoded.encode()) == ulid.milliseconds
+    strs = [str(ulid) for ulid in values]
+    expected = [ulid.milliseconds for ulid in values]
+    assert base32.decode_milliseconds_many(strs) == expected
+    assert base32.decode_milliseconds_many(s.encode() for s in strs) == expected
+    assert base32.decode_milliseconds_many([]) == []
+
+
+def test_decode_milliseconds_prefix_only() -> None:
+    # The random part is neither validated nor decoded.
+    assert base32.decode_milliseconds("01E75HZVW3" + "!" * 16) == 1588250800003  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0" * (constants.TIMESTAMP_REPR_LEN - 1),
+        "0" * (constants.TIMESTAMP_REPR_LEN + 1),
+        "0" * (constants.REPR_LEN + 1),
+        "8" + "0" * (constants.REPR_LEN - 1),
+        "0" * (constants.TIMESTAMP_REPR_LEN - 1) + "U",
+        "0" * (constants.TIMESTAMP_REPR_LEN - 1) + "é",
+        " " + "0" * (constants.TIMESTAMP_REPR_LEN - 1),
+        "0" * (constants.TIMESTAMP_REPR_LEN - 2) + "_0",
+        b"-" + b"0" * (constants.TIMESTAMP_REPR_LEN - 1),
+    ],
+)
+def test_decode_milliseconds_invalid_input(value: Any) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        base32.decode_milliseconds(value)
+    with pytest.raises(ValueError):  # noqa: PT011
+        base32.decode_milliseconds_many(["0" * constants.REPR_LEN, value])
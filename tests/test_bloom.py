@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from ulid import constants
+from ulid import ULID
+from ulid.bloom import ULIDBloomFilter
+
+
+START = 1_700_000_000_000
+
+
+def make_ulid(milliseconds: int) -> ULID:
+    return ULID(int.to_bytes(milliseconds, constants.TIMESTAMP_LEN, "big") + os.urandom(10))
+
+
+def test_add() -> None:
+    dedupe = ULIDBloomFilter(window=60, capacity=1000, error_rate=0.01, buckets=6)
+    ulids = [make_ulid(START + i * 60) for i in range(1000)]
+    added = [dedupe.add(ulid) for ulid in ulids]
+    # False positives are possible but rare
+    assert sum(added) > 950  # noqa: PLR2004
+    assert not any(dedupe.add(ulid) for ulid in ulids)
+    assert all(ulid in dedupe for ulid in ulids)
+    assert all(str(ulid) in dedupe for ulid in ulids[-10:])
+    assert "not-a-ulid" not in dedupe
+    assert len(dedupe) == sum(added)
+    assert dedupe.hashes == 7  # noqa: PLR2004
+    assert 0 < dedupe.false_positive_rate < 0.02  # noqa: PLR2004
+    assert 0 < dedupe.nbytes <= dedupe.max_nbytes
+
+
+def test_false_positive_rate() -> None:
+    dedupe = ULIDBloomFilter(window=10, capacity=10000, error_rate=0.01, buckets=5)
+    for i in range(10000):
+        dedupe.add(make_ulid(START + i))
+    others = [make_ulid(START + i) for i in range(10000)]
+    rate = sum(ulid in dedupe for ulid in others) / len(others)
+    assert rate < 0.02  # noqa: PLR2004
+
+
+def test_window() -> None:
+    dedupe = ULIDBloomFilter(window=10, capacity=100, buckets=5)
+    old = make_ulid(START)
+    assert dedupe.add(old)
+    assert dedupe.add(make_ulid(START + 9_999))
+    assert old in dedupe
+    assert dedupe.add(make_ulid(START + 10_000))
+    assert old in dedupe  # expired and rejected
+    assert not dedupe.add(old)
+    assert not dedupe.add(make_ulid(START - 1))
+    assert len(dedupe._buckets) == 3  # noqa: SLF001, PLR2004
+    # Advancing by a whole window drops all older buckets
+    assert dedupe.add(make_ulid(START + 30_000))
+    assert len(dedupe._buckets) == 1  # noqa: SLF001
+    assert len(dedupe) == 1
+    assert dedupe.nbytes < dedupe.max_nbytes
+
+    dedupe.clear()
+    assert len(dedupe) == 0
+    assert dedupe.false_positive_rate == 0
+    assert dedupe.add(old)
+
+
+def test_expired_accept() -> None:
+    dedupe = ULIDBloomFilter(window=1, capacity=100, expired="accept")
+    old = make_ulid(START)
+    assert dedupe.add(old)
+    assert dedupe.add(make_ulid(START + 1000))
+    assert old not in dedupe
+    assert dedupe.add(old)
+    assert dedupe.add(old)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"window": 0},
+        {"capacity": 0},
+        {"error_rate": 0},
+        {"error_rate": 1},
+        {"buckets": 0},
+        {"expired": "ignore"},
+    ],
+)
+def test_invalid_arguments(kwargs: dict) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        ULIDBloomFilter(**kwargs)
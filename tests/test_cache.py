@@ -0,0 +1,96 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from ulid import cache
+from ulid import IntULID
+from ulid import ULID
+
+
+@pytest.fixture(autouse=True)
+def disable_cache() -> Iterator[None]:
+    yield
+    cache.disable()
+
+
+def test_disabled() -> None:
+    ulid = ULID()
+    assert ULID.from_str(str(ulid)) == ulid
+    assert cache.info() == cache.CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+    cache.clear()
+
+
+def test_from_str() -> None:
+    cache.enable(maxsize=2)
+    ulid = ULID()
+    first = ULID.from_str(str(ulid))
+    assert first == ulid
+    assert ULID.from_str(str(ulid)) is first
+    assert ULID.parse(str(ulid)) is first
+    assert cache.info() == cache.CacheInfo(hits=2, misses=1, maxsize=2, currsize=1)
+
+    cache.clear()
+    assert cache.info() == cache.CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_eviction() -> None:
+    cache.enable(maxsize=2)
+    a, b, c = (str(ULID()) for _ in range(3))
+    ULID.from_str(a)
+    ULID.from_str(b)
+    ULID.from_str(a)
+    ULID.from_str(c)
+    assert cache.info().currsize == 2  # noqa: PLR2004
+    ULID.from_str(a)
+    ULID.from_str(b)
+    assert cache.info().hits == 2  # noqa: PLR2004
+    assert cache.info().misses == 4  # noqa: PLR2004
+
+
+def test_subclass() -> None:
+    cache.enable()
+    value = str(ULID())
+    ulid = ULID.from_str(value)
+    int_ulid = IntULID.from_str(value)
+    assert type(ulid) is ULID
+    assert type(int_ulid) is IntULID
+    assert ulid == int_ulid
+
+
+def test_invalid() -> None:
+    cache.enable()
+    with pytest.raises(ValueError, match="Encoded ULID can only consist of"):
+        ULID.from_str("Z" * 25 + "U")
+    with pytest.raises(TypeError):
+        ULID.from_str(b"not-a-string")  # type: ignore[arg-type]
+    assert cache.info().currsize == 0
+
+
+def test_invalid_size() -> None:
+    with pytest.raises(ValueError, match="Cache size must be positive"):
+        cache.enable(maxsize=0)
+
+
+def test_threads() -> None:
+    cache.enable(maxsize=64)
+    values = [str(ULID()) for _ in range(128)]
+    errors: list[Exception] = []
+
+    def parse() -> None:
+        try:
+            for _ in range(20):
+                for value in values:
+                    assert str(ULID.from_str(value)) == value
+        except Exception as err:  # noqa: BLE001  # pragma: no cover
+            errors.append(err)
+
+    threads = [threading.Thread(target=parse) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    info = cache.info()
+    assert info.hits + info.misses == 4 * 20 * len(values)
+    assert info.currsize <= 64  # noqa: PLR2004
@@ -1,6 +1,16 @@
+import io
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest import mock
+
 import pytest
 
+import ulid
 import ulid.__main__ as cli
+from ulid import base32
 from ulid import ULID
 
 
@@ -75,3 +85,246 @@ def test_build(option: str):
     ulid_out = ULID.from_str(output)
     if includes_timestamp:
         assert ulid_out.datetime == ulid.datetime
+
+
+@pytest.mark.parametrize("output_format", ["str", "hex", "uuid", "int"])
+def test_build_format(output_format: str) -> None:
+    ulid = ULID()
+    output = cli.main(["build", "--from-str", str(ulid), "--format", output_format])
+    assert (
+        output
+        == {
+            "str": str(ulid),
+            "hex": ulid.hex,
+            "uuid": str(ulid.to_uuid()),
+            "int": str(int(ulid)),
+        }[output_format]
+    )
+
+
+def test_build_format_binary(capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    ulid = ULID()
+    assert cli.main(["build", "--from-str", str(ulid), "--format", "binary"]) is None
+    assert capsysbinary.readouterr().out == ulid.bytes
+
+
+@pytest.mark.parametrize("output_format", ["str", "hex", "uuid", "int"])
+@pytest.mark.parametrize("monotonic", [[], ["--monotonic"]])
+def test_build_count(
+    capsys: pytest.CaptureFixture[str], output_format: str, monotonic: list[str]
+) -> None:
+    count = cli.CHUNK_SIZE + 10
+    argv = ["build", "--count", str(count), "--format", output_format, *monotonic]
+    assert cli.main(argv) is None
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == count
+    ulids = [ULID.parse(int(line) if output_format == "int" else line) for line in lines]
+    assert len(set(ulids)) == count
+    if monotonic:
+        assert ulids == sorted(ulids)
+
+
+@pytest.mark.parametrize("monotonic", [[], ["--monotonic"]])
+def test_build_count_binary(
+    capsysbinary: pytest.CaptureFixture[bytes], monotonic: list[str]
+) -> None:
+    cli.main([
+        "build",
+        "-n",
+        "100",
+        "--format",
+        "binary",
+        "--from-timestamp",
+        "1600000000",
+        *monotonic,
+    ])
+    output = capsysbinary.readouterr().out
+    assert len(output) == 100 * 16
+    ulids = [ULID.from_bytes(output[i : i + 16]) for i in range(0, len(output), 16)]
+    assert all(ulid.milliseconds == 1600000000 for ulid in ulids)  # noqa: PLR2004
+    if monotonic:
+        assert [int(u) for u in ulids] == list(range(int(ulids[0]), int(ulids[0]) + 100))
+
+
+@pytest.mark.parametrize("monotonic", [[], ["--monotonic"]])
+def test_build_count_from_datetime(
+    capsys: pytest.CaptureFixture[str], monotonic: list[str]
+) -> None:
+    ulid = ULID()
+    cli.main(["build", "-n", "10", "--from-datetime", ulid.datetime.isoformat(), *monotonic])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 10  # noqa: PLR2004
+    assert all(ULID.from_str(line).milliseconds == ulid.milliseconds for line in lines)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["build", "--count", "0"],
+        ["build", "--count", "x"],
+        ["build", "--count", "2", "--from-str", str(ULID())],
+        ["build", "--monotonic"],
+        ["build", "--format", "unknown"],
+    ],
+)
+def test_build_invalid_arguments(argv: list[str]) -> None:
+    with pytest.raises(SystemExit):
+        cli.main(argv)
+
+
+@pytest.fixture
+def ulid_file(tmp_path: Path) -> tuple[Path, list[ULID]]:
+    ulids = [ULID() for _ in range(1000)]
+    path = tmp_path / "ulids.txt"
+    path.write_text("".join(f"{u}\n" for u in ulids))
+    return path, ulids
+
+
+@pytest.mark.parametrize("to_format", ["str", "hex", "uuid", "int", "binary"])
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_convert(
+    capsysbinary: pytest.CaptureFixture[bytes],
+    tmp_path: Path,
+    ulid_file: tuple[Path, list[ULID]],
+    to_format: str,
+    jobs: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cli, "CONVERT_CHUNK_BYTES", 1024)
+    path, ulids = ulid_file
+    assert cli.main(["convert", str(path), "--to", to_format, "--jobs", jobs]) is None
+    output = capsysbinary.readouterr().out
+    if to_format == "binary":
+        assert output == b"".join(u.bytes for u in ulids)
+    else:
+        expected = {
+            "str": str,
+            "hex": lambda u: u.hex,
+            "uuid": lambda u: str(u.to_uuid()),
+            "int": lambda u: str(int(u)),
+        }[to_format]
+        assert output.decode().splitlines() == [expected(u) for u in ulids]
+
+    converted = tmp_path / "converted"
+    converted.write_bytes(output)
+    cli.main(["convert", str(converted), "--from", to_format, "--jobs", jobs])
+    assert capsysbinary.readouterr().out == path.read_bytes()
+
+
+def test_convert_stdin(
+    capsysbinary: pytest.CaptureFixture[bytes], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ulid = ULID()
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(f"{ulid}\n\n".encode())))
+    cli.main(["convert", "--to", "hex"])
+    assert capsysbinary.readouterr().out == f"{ulid.hex}\n".encode()
+
+
+@pytest.mark.parametrize("errors", ["skip", "report"])
+def test_convert_errors(
+    capsysbinary: pytest.CaptureFixture[bytes], tmp_path: Path, errors: str
+) -> None:
+    ulid = ULID()
+    path = tmp_path / "ulids.txt"
+    path.write_text(f"{ulid}\nnot-a-ulid\n{'Z' * 26}\n{ulid}\n")
+    cli.main(["convert", str(path), "--errors", errors])
+    captured = capsysbinary.readouterr()
+    assert captured.out == f"{ulid}\n{ulid}\n".encode()
+    if errors == "report":
+        assert captured.err.decode().splitlines()[0].startswith("line 2: ")
+        assert captured.err.decode().splitlines()[1].startswith("line 3: ")
+    else:
+        assert captured.err == b""
+
+
+@pytest.mark.parametrize("from_format", ["str", "hex", "uuid", "int"])
+def test_convert_errors_strict(
+    capsysbinary: pytest.CaptureFixture[bytes], tmp_path: Path, from_format: str
+) -> None:
+    ulid = ULID()
+    value = cli.FORMATTERS[from_format](ulid.bytes)
+    path = tmp_path / "ulids.txt"
+    path.write_text(f"{value}\n{'f' * 40}\n{value}\n")
+    with pytest.raises(SystemExit, match="line 2"):
+        cli.main(["convert", str(path), "--from", from_format])
+    assert capsysbinary.readouterr().out == f"{ulid}\n".encode()
+
+
+def test_convert_incomplete_binary_record(
+    capsysbinary: pytest.CaptureFixture[bytes], tmp_path: Path
+) -> None:
+    ulid = ULID()
+    path = tmp_path / "ulids.bin"
+    path.write_bytes(ulid.bytes + b"\x00" * 4)
+    with pytest.raises(SystemExit, match="record 2"):
+        cli.main(["convert", str(path), "--from", "binary"])
+    assert capsysbinary.readouterr().out == f"{ulid}\n".encode()
+
+
+def test_bench() -> None:
+    output = cli.main(["bench", "--duration", "0", "--number", "10"])
+    assert output is not None
+    lines = output.splitlines()
+    assert lines[0].split()[:2] == ["benchmark", "ops/sec"]
+    assert [line.split()[0] for line in lines[1:]] == list(cli.BENCHMARKS)
+
+
+@pytest.mark.parametrize("backend", list(base32.BACKENDS))
+def test_bench_json(backend: str) -> None:
+    output = cli.main([
+        "bench",
+        "str",
+        "compare",
+        "--json",
+        "--duration",
+        "0",
+        "--backend",
+        backend,
+    ])
+    assert output is not None
+    report = json.loads(output)
+    assert report["backend"] == backend
+    assert list(report["benchmarks"]) == ["str", "compare"]
+    for result in report["benchmarks"].values():
+        assert result["ops_per_sec"] > 0
+        assert result["samples"] >= 2  # noqa: PLR2004
+        assert result["number"] == 1000  # noqa: PLR2004
+        assert result["min_ns"] <= result["p50_ns"] <= result["p90_ns"] <= result["p99_ns"]
+    assert base32.encode is base32.encode_int
+
+
+def test_bench_str_uses_backend() -> None:
+    encode, decode = base32.BACKENDS["table"]
+    with mock.patch.dict(base32.BACKENDS, {"table": (mock.Mock(wraps=encode), decode)}):
+        cli.main(["bench", "str", "--duration", "0", "--number", "10", "--backend", "table"])
+        assert base32.BACKENDS["table"][0].call_count >= 30  # noqa: PLR2004
+
+
+def test_bench_unknown() -> None:
+    with pytest.raises(SystemExit, match="unknown benchmark 'foo'"):
+        cli.main(["bench", "foo"])
+
+
+@pytest.mark.parametrize(("p", "expected"), [(0, 1.0), (50, 2.0), (90, 4.0), (99, 4.0), (100, 4.0)])
+def test_percentile(p: int, expected: float) -> None:
+    assert cli.percentile([1.0, 2.0, 3.0, 4.0], p) == expected
+
+
+def test_version(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit, match="0"):
+        cli.main(["--version"])
+    assert capsys.readouterr().out.strip() == ulid.__version__
+
+
+def test_lazy_imports() -> None:
+    # Modules that are only needed by `convert --jobs` and `bench` are not imported on start.
+    script = textwrap.dedent(
+        """
+        import sys
+        import ulid.__main__
+
+        lazy = ["concurrent.futures.process", "multiprocessing", "json", "timeit"]
+        assert not any(module in sys.modules for module in lazy), sys.modules.keys()
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,107 @@
+import os
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+
+from ulid import constants
+from ulid import entropy
+from ulid import ULID
+from ulid.generator import ULIDGenerator
+
+
+@pytest.fixture
+def restore_source() -> Iterator[None]:
+    random_bytes = entropy.random_bytes
+    yield
+    entropy.set_source(random_bytes)
+
+
+def test_buffered_entropy() -> None:
+    source = mock.Mock(wraps=os.urandom)
+    buffered = entropy.BufferedEntropy(size=105, source=source)
+    values = [buffered(constants.RANDOMNESS_LEN) for _ in range(11)]
+    assert all(len(value) == constants.RANDOMNESS_LEN for value in values)
+    assert len(set(values)) == 11  # noqa: PLR2004
+    assert source.call_args_list == [mock.call(100), mock.call(100)]
+
+
+def test_buffered_entropy_passes_other_sizes() -> None:
+    source = mock.Mock(wraps=os.urandom)
+    buffered = entropy.BufferedEntropy(source=source)
+    assert len(buffered(1000)) == 1000  # noqa: PLR2004
+    source.assert_called_once_with(1000)
+
+
+def test_buffered_entropy_reset() -> None:
+    buffered = entropy.BufferedEntropy(size=100, source=lambda n: bytes(range(n)))
+    assert buffered(constants.RANDOMNESS_LEN) == bytes(range(10))
+    assert buffered(constants.RANDOMNESS_LEN) == bytes(range(10, 20))
+    buffered.reset()
+    assert buffered(constants.RANDOMNESS_LEN) == bytes(range(10))
+
+
+def test_buffered_entropy_invalid_size() -> None:
+    with pytest.raises(ValueError, match="Buffer size"):
+        entropy.BufferedEntropy(size=5)
+
+
+def test_pseudo_random_entropy() -> None:
+    a = entropy.PseudoRandomEntropy(seed=42)
+    b = entropy.PseudoRandomEntropy(seed=42)
+    values = [a(constants.RANDOMNESS_LEN) for _ in range(10)]
+    assert values == [b(constants.RANDOMNESS_LEN) for _ in range(10)]
+    assert all(len(value) == constants.RANDOMNESS_LEN for value in values)
+    assert len(set(values)) == 10  # noqa: PLR2004
+    a.reset()
+    assert a(constants.RANDOMNESS_LEN) != b(constants.RANDOMNESS_LEN)
+
+
+def test_secrets_entropy() -> None:
+    assert len(entropy.secrets_entropy(constants.RANDOMNESS_LEN)) == constants.RANDOMNESS_LEN
+
+
+@pytest.mark.usefixtures("restore_source")
+@pytest.mark.parametrize("name", list(entropy.SOURCES))
+def test_set_source(name: str) -> None:
+    entropy.set_source(name)
+    ulids = [ULID(), ULID.from_timestamp(0), *ULID.generate_many(10), ULIDGenerator().generate()]
+    assert len(set(ulids)) == len(ulids)
+
+
+@pytest.mark.usefixtures("restore_source")
+def test_set_source_callable() -> None:
+    entropy.set_source(lambda n: b"\x01" * n)
+    assert ULID().bytes.endswith(b"\x01" * constants.RANDOMNESS_LEN)
+    assert ULID.from_timestamp(0) == ULID.from_bytes(b"\x00" * 6 + b"\x01" * 10)
+    assert all(u.bytes.endswith(b"\x01" * 10) for u in ULID.generate_many(10))
+
+
+def test_set_source_unknown() -> None:
+    with pytest.raises(ValueError, match="Unknown entropy source"):
+        entropy.set_source("unknown")
+
+
+def test_generator_entropy() -> None:
+    generator = ULIDGenerator(entropy=lambda n: b"\x00" * n)
+    assert generator.generate().bytes.endswith(b"\x00" * constants.RANDOMNESS_LEN)
+    assert entropy.random_bytes is os.urandom
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.parametrize(
+    "source",
+    [entropy.BufferedEntropy(), entropy.PseudoRandomEntropy(seed=42)],
+    ids=["buffered", "fast"],
+)
+def test_reset_after_fork(source: entropy.Entropy) -> None:
+    source(constants.RANDOMNESS_LEN)
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.write(write, source(constants.RANDOMNESS_LEN))
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read, constants.RANDOMNESS_LEN) != source(constants.RANDOMNESS_LEN)
+    os.close(read)
+    os.close(write)
@@ -0,0 +1,122 @@
+import os
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+
+import pytest
+
+from ulid import constants
+from ulid import ULID
+from ulid.array import ULIDArray
+from ulid.file import HEADER
+from ulid.file import ULIDFileReader
+from ulid.file import ULIDFileWriter
+
+
+@pytest.fixture
+def ulids() -> list[ULID]:
+    return sorted(ULID.from_bytes(os.urandom(constants.BYTES_LEN)) for _ in range(100))
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "ulids.bin"
+
+
+def test_write_read(path: Path, ulids: list[ULID]) -> None:
+    with ULIDFileWriter(path) as writer:
+        writer.write(ulids[0])
+        writer.write(ulids[1].bytes)
+        writer.write_many(ulids[2:50])
+        writer.write_many(ULIDArray(ulids[50:]))
+        writer.write_many([])
+        writer.write_many(ULIDArray())
+    assert path.read_bytes() == HEADER + b"".join(ulid.bytes for ulid in ulids)
+
+    with ULIDFileReader(path) as reader:
+        assert len(reader) == len(ulids)
+        assert list(reader) == ulids
+        assert reader[0] == ulids[0]
+        assert reader[-1] == ulids[-1]
+        assert list(reader[10:20]) == ulids[10:20]
+        assert reader.array.is_sorted
+        assert ulids[42] in reader
+        assert reader.index(ulids[42]) == 42  # noqa: PLR2004
+        assert ULID() not in reader
+        assert "not-a-ulid" not in reader
+
+
+def test_empty(path: Path) -> None:
+    ULIDFileWriter(path).close()
+    with ULIDFileReader(path) as reader:
+        assert len(reader) == 0
+        assert list(reader.time_range(0, 1)) == []
+
+
+def test_append(path: Path, ulids: list[ULID]) -> None:
+    with ULIDFileWriter(path, append=True) as writer:
+        writer.write_many(ulids[:50])
+    with ULIDFileWriter(path, append=True) as writer:
+        with pytest.raises(ValueError, match="ascending order"):
+            writer.write(ulids[49 - 1])
+        writer.write_many(ulids[50:])
+    with ULIDFileReader(path) as reader:
+        assert list(reader) == ulids
+
+
+def test_append_empty_file(path: Path, ulids: list[ULID]) -> None:
+    path.touch()
+    with ULIDFileWriter(path, append=True) as writer:
+        writer.write_many(ulids)
+    assert path.read_bytes()[: len(HEADER)] == HEADER
+    with ULIDFileReader(path) as reader:
+        assert list(reader) == ulids
+
+
+def test_unsorted(path: Path, ulids: list[ULID]) -> None:
+    with ULIDFileWriter(path) as writer:
+        writer.write(ulids[1])
+        with pytest.raises(ValueError, match="ascending order"):
+            writer.write(ulids[0])
+        with pytest.raises(ValueError, match="ascending order"):
+            writer.write_many(ulids[:2])
+        with pytest.raises(ValueError, match="ascending order"):
+            writer.write_many(ulids[3:1:-1])
+        with pytest.raises(ValueError, match="ascending order"):
+            writer.write_many(ULIDArray(ulids[:2]))
+        with pytest.raises(TypeError):
+            writer.write("not-a-ulid")  # type: ignore[arg-type]
+    with ULIDFileReader(path) as reader:
+        assert list(reader) == [ulids[1]]
+
+
+def test_time_range(path: Path) -> None:
+    start = datetime(2024, 10, 1, tzinfo=timezone.utc)
+    ulids = [ULID.from_datetime(start + timedelta(hours=i)) for i in range(48)]
+    with ULIDFileWriter(path) as writer:
+        writer.write_many(ulids)
+    with ULIDFileReader(path) as reader:
+        result = reader.time_range(start + timedelta(hours=10), start + timedelta(hours=20))
+        assert isinstance(result, ULIDArray)
+        assert list(result) == ulids[10:21]
+        assert list(reader.time_range(end=start + timedelta(hours=1))) == ulids[:2]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b"ULID\x02" + bytes(11), id="version"),
+        pytest.param(b"DILU\x01" + bytes(11), id="magic"),
+        pytest.param(HEADER + bytes(15), id="truncated"),
+    ],
+)
+def test_invalid_file(path: Path, data: bytes) -> None:
+    path.write_bytes(data)
+    with pytest.raises(ValueError):  # noqa: PT011
+        ULIDFileReader(path)
+    if not data:
+        return  # the writer adds the header to an empty file, see test_append_empty_file
+    with pytest.raises(ValueError):  # noqa: PT011
+        ULIDFileWriter(path, append=True)
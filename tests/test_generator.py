@@ -0,0 +1,176 @@
+import os
+import threading
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest import mock
+
+import pytest
+from freezegun import freeze_time
+
+from ulid import constants
+from ulid import ULID
+from ulid.generator import ULIDGenerator
+
+
+def test_generate() -> None:
+    generator = ULIDGenerator()
+    ulid = generator.generate()
+    assert isinstance(ulid, ULID)
+    assert len(ulid.bytes) == constants.BYTES_LEN
+
+
+@freeze_time()
+def test_generate_monotonic_within_millisecond() -> None:
+    generator = ULIDGenerator()
+    ulids = [generator.generate() for _ in range(100)]
+    assert len({u.milliseconds for u in ulids}) == 1
+    for prev, curr in zip(ulids, ulids[1:]):
+        assert int(curr) == int(prev) + 1
+
+
+def test_generate_new_millisecond_draws_new_randomness() -> None:
+    initial_time = datetime.now(timezone.utc)
+    generator = ULIDGenerator()
+    with freeze_time(initial_time) as frozen_time:
+        ulid1 = generator.generate()
+        frozen_time.move_to(initial_time + timedelta(milliseconds=1))
+        ulid2 = generator.generate()
+    assert ulid2.milliseconds == ulid1.milliseconds + 1
+    assert ulid1 < ulid2
+
+
+def test_generate_clock_moves_backwards() -> None:
+    initial_time = datetime.now(timezone.utc)
+    generator = ULIDGenerator()
+    with freeze_time(initial_time) as frozen_time:
+        ulid1 = generator.generate()
+        frozen_time.move_to(initial_time - timedelta(seconds=1))
+        ulid2 = generator.generate()
+    assert ulid2.milliseconds == ulid1.milliseconds
+    assert int(ulid2) == int(ulid1) + 1
+
+
+@freeze_time()
+def test_generate_overflow() -> None:
+    generator = ULIDGenerator()
+    with mock.patch("ulid.entropy.random_bytes", return_value=b"\xff" * constants.RANDOMNESS_LEN):
+        ulid = generator.generate()
+    assert ulid.bytes.endswith(b"\xff" * constants.RANDOMNESS_LEN)
+    with pytest.raises(OverflowError):
+        generator.generate()
+
+
+@freeze_time()
+def test_generate_thread_safety() -> None:
+    generator = ULIDGenerator()
+    results: list[list[ULID]] = [[] for _ in range(8)]
+
+    def worker(out: list[ULID]) -> None:
+        out.extend(generator.generate() for _ in range(500))
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ulids = [u for out in results for u in out]
+    assert len(set(ulids)) == len(ulids)
+    for out in results:
+        assert out == sorted(out)
+
+
+@freeze_time()
+def test_generate_many() -> None:
+    generator = ULIDGenerator()
+    first = generator.generate()
+    ulids = generator.generate_many(100)
+    assert len(ulids) == 100  # noqa: PLR2004
+    assert all(isinstance(u, ULID) for u in ulids)
+    assert [int(u) for u in ulids] == list(range(int(first) + 1, int(first) + 101))
+    assert generator.generate() > ulids[-1]
+    assert generator.generate_many(0) == []
+    with pytest.raises(ValueError):  # noqa: PT011
+        generator.generate_many(-1)
+
+
+@freeze_time()
+def test_generate_many_overflow() -> None:
+    generator = ULIDGenerator()
+    randomness = (constants.MAX_RANDOMNESS - 1).to_bytes(constants.RANDOMNESS_LEN, "big")
+    with mock.patch("ulid.entropy.random_bytes", return_value=randomness):
+        with pytest.raises(OverflowError):
+            generator.generate_many(3)
+        assert len(generator.generate_many(2)) == 2  # noqa: PLR2004
+
+
+def test_generate_bytes() -> None:
+    generator = ULIDGenerator()
+    data = generator.generate_bytes(10, timestamp=1000)
+    assert len(data) == 10 * constants.BYTES_LEN
+    ulids = [ULID.from_bytes(data[i : i + 16]) for i in range(0, len(data), 16)]
+    assert all(u.milliseconds == 1000 for u in ulids)  # noqa: PLR2004
+    assert [int(u) for u in ulids] == list(range(int(ulids[0]), int(ulids[0]) + 10))
+
+    # Earlier timestamps are replaced by the last one to keep the ULIDs increasing
+    ulid = ULID.from_bytes(generator.generate_bytes(1, timestamp=999))
+    assert ulid.milliseconds == 1000  # noqa: PLR2004
+    assert ulid > ulids[-1]
+    assert generator.generate_bytes(0) == b""
+
+
+@freeze_time()
+def test_reset() -> None:
+    generator = ULIDGenerator(entropy=lambda n: b"\x00" * n)
+    assert int(generator.generate()) + 1 == int(generator.generate())
+    generator.reset()
+    assert generator.generate().bytes.endswith(b"\x00" * constants.RANDOMNESS_LEN)
+
+
+@freeze_time()
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_reset_after_fork() -> None:
+    generator = ULIDGenerator()
+    first = generator.generate()
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.write(write, generator.generate().bytes)
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child = ULID.from_bytes(os.read(read, constants.BYTES_LEN))
+    os.close(read)
+    os.close(write)
+    assert child.milliseconds == first.milliseconds
+    assert int(child) != int(first) + 1
+    assert int(generator.generate()) == int(first) + 1
+
+
+@freeze_time()
+def test_node_bits() -> None:
+    randomness = bytes(range(constants.RANDOMNESS_LEN))
+    generators = [
+        ULIDGenerator(entropy=lambda n: randomness[:n], node_id=node_id, node_bits=4)
+        for node_id in range(16)
+    ]
+    ulids = [[generator.generate() for _ in range(10)] for generator in generators]
+    for node_id, values in enumerate(ulids):
+        assert all(int(ulid) >> 76 & 0xF == node_id for ulid in values)
+        assert [int(ulid) for ulid in values] == list(range(int(values[0]), int(values[0]) + 10))
+    assert len({ulid for values in ulids for ulid in values}) == 160  # noqa: PLR2004
+
+
+@freeze_time()
+def test_node_bits_overflow() -> None:
+    generator = ULIDGenerator(entropy=lambda n: b"\xff" * n, node_id=1, node_bits=8)
+    ulid = generator.generate()
+    assert ulid.bytes[constants.TIMESTAMP_LEN :] == b"\x01" + b"\xff" * 9
+    with pytest.raises(OverflowError):
+        generator.generate()
+
+
+@pytest.mark.parametrize(("node_id", "node_bits"), [(1, 0), (-1, 4), (16, 4), (0, 33), (0, -1)])
+def test_node_bits_invalid(node_id: int, node_bits: int) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        ULIDGenerator(node_id=node_id, node_bits=node_bits)
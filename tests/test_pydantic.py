@@ -0,0 +1,92 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from ulid import IntULID
+from ulid import ULID
+from ulid.pydantic import BytesULID
+from ulid.pydantic import StrULID
+from ulid.pydantic import ULIDValidation
+
+
+class Model(BaseModel):
+    str_ulid: StrULID
+    bytes_ulid: Optional[BytesULID] = None  # noqa: FA100
+
+
+@pytest.mark.parametrize("value", [1.5, None, [], "not-enough", b"not-enough", -1, 1 << 128])
+def test_default_invalid_input(value: object) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(ULID).validate_python(value)
+    assert exc_info.value.errors()[0]["type"] in ("ulid_type", "ulid_format")
+
+
+def test_default_subclass() -> None:
+    ulid = ULID()
+    value = TypeAdapter(IntULID).validate_python(str(ulid))
+    assert isinstance(value, IntULID)
+    assert value == ulid
+
+
+def test_strict_modes() -> None:
+    ulid = ULID()
+    model = Model(str_ulid=str(ulid), bytes_ulid=ulid.bytes)
+    assert model.str_ulid == ulid
+    assert model.bytes_ulid == ulid
+    assert Model(**model.model_dump()) == model
+
+    model_json = model.model_dump_json()
+    assert json.loads(model_json) == {"str_ulid": str(ulid), "bytes_ulid": str(ulid)}
+    assert Model.model_validate_json(model_json) == model
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("str_ulid", "bytes"),
+        ("str_ulid", "int"),
+        ("str_ulid", "invalid"),
+        ("bytes_ulid", "str"),
+        ("bytes_ulid", "int"),
+        ("bytes_ulid", "invalid"),
+    ],
+)
+def test_strict_modes_invalid_input(field: str, value: str) -> None:
+    ulid = ULID()
+    values = {
+        "str": str(ulid),
+        "bytes": ulid.bytes,
+        "int": int(ulid),
+        "invalid": "Z" * 26 if field == "str_ulid" else b"not-enough",
+    }
+    data = {"str_ulid": str(ulid), field: values[value]}
+    with pytest.raises(ValidationError) as exc_info:
+        Model.model_validate(data)
+    expected = "ulid_format" if value == "invalid" else "ulid_type"
+    assert exc_info.value.errors()[0]["type"] == expected
+
+
+@pytest.mark.parametrize("value", ["not-enough", "Z" * 26, "0" * 25 + "U"])
+def test_strict_error_type_matches_default(value: str) -> None:
+    errors = []
+    for annotation in (ULID, StrULID):
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(annotation).validate_python(value)
+        errors.append(exc_info.value.errors()[0]["type"])
+    assert errors == ["ulid_format", "ulid_format"]
+
+
+def test_strict_modes_json_schema() -> None:
+    properties = Model.model_json_schema()["properties"]
+    schema = {"maxLength": 26, "minLength": 26, "pattern": "[A-Z0-9]{26}", "type": "string"}
+    assert properties["str_ulid"] == {**schema, "title": "Str Ulid"}
+    assert schema in properties["bytes_ulid"]["anyOf"]
+
+
+def test_unknown_mode() -> None:
+    with pytest.raises(ValueError, match="Unknown validation mode"):
+        ULIDValidation("int")  # type: ignore[arg-type]
@@ -0,0 +1,62 @@
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+
+import pytest
+
+from ulid import ULID
+from ulid.array import ULIDArray
+from ulid.search import time_range
+
+
+@pytest.fixture
+def ulids() -> list[ULID]:
+    return sorted(ULID.from_timestamp(ms) for ms in range(1000, 2000, 10) for _ in range(3))
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [
+        list,
+        lambda ulids: [u.bytes for u in ulids],
+        lambda ulids: [str(u) for u in ulids],
+        ULIDArray,
+    ],
+)
+def test_time_range(ulids: list[ULID], convert: Callable[[list[ULID]], Any]) -> None:
+    values = convert(ulids)
+    result = time_range(values, 1200, 1300)
+    assert type(result) is type(values)
+    expected = [u for u in ulids if 1200 <= u.milliseconds <= 1300]  # noqa: PLR2004
+    assert [ULID.parse(v) for v in result] == expected
+    assert len(result) == 33  # noqa: PLR2004
+
+    assert list(time_range(values, 1205, 1209)) == []
+    assert time_range(values) == values
+    assert len(time_range(values, start=1990)) == 3  # noqa: PLR2004
+    assert len(time_range(values, end=1000)) == 3  # noqa: PLR2004
+    assert list(time_range(values, 3000)) == []
+
+
+def test_time_range_datetime(ulids: list[ULID]) -> None:
+    start = datetime.fromtimestamp(1.2, timezone.utc)
+    end = datetime.fromtimestamp(1.3, timezone.utc)
+    assert time_range(ulids, start, end) == time_range(ulids, 1200, 1300)
+    assert time_range(ulids, 1.2, 1.3) == time_range(ulids, 1200, 1300)
+
+
+def test_time_range_empty() -> None:
+    assert time_range([], 0, 1) == []
+    assert len(time_range(ULIDArray(), 0, 1)) == 0
+
+
+def test_time_range_invalid_type() -> None:
+    with pytest.raises(TypeError):
+        time_range([1, 2, 3], 0, 1)
+
+
+def test_time_range_memoryview(ulids: list[ULID]) -> None:
+    # memoryviews don't support ordering comparisons, so they can't be searched
+    with pytest.raises(TypeError, match="Cannot search sequence"):
+        time_range([memoryview(u.bytes) for u in ulids], 1200, 1300)
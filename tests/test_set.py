@@ -0,0 +1,134 @@
+import os
+import pickle
+import random
+
+import pytest
+
+from ulid import constants
+from ulid import ULID
+from ulid.array import ULIDArray
+from ulid.set import ULIDSet
+
+
+@pytest.fixture
+def ulids() -> list[ULID]:
+    return [ULID.from_bytes(os.urandom(constants.BYTES_LEN)) for _ in range(1000)]
+
+
+def test_set(ulids: list[ULID]) -> None:
+    values = ULIDSet()
+    for ulid in ulids:
+        values.add(ulid)
+    values.add(ulids[0])
+    assert len(values) == len(ulids)
+    assert set(values) == set(ulids)
+    assert all(ulid in values for ulid in ulids)
+    assert all(ulid.bytes in values for ulid in ulids)
+    assert all(str(ulid) in values for ulid in ulids)
+    assert ULID() not in values
+    assert "not-a-ulid" not in values
+    assert object() not in values
+    assert values == set(ulids)
+    assert values.capacity >= len(ulids)
+    assert values.load_factor <= 0.75  # noqa: PLR2004
+    assert values.nbytes == (values._mask + 1) * constants.BYTES_LEN  # noqa: SLF001
+
+
+def test_update(ulids: list[ULID]) -> None:
+    array = ULIDArray(ulids[:500])
+    values = ULIDSet(array)
+    values.update(str(ulid) for ulid in ulids[250:750])
+    values.update([ulid.bytes for ulid in ulids[700:]])
+    assert values == set(ulids)
+    assert values.to_array() == ULIDArray(sorted(ulids))
+    with pytest.raises(TypeError):
+        values.update([b"too-short"])
+    with pytest.raises(ValueError):  # noqa: PT011
+        values.update(["not-a-ulid"])
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        # Keys that only differ in their last byte, their first byte or in all bytes
+        [bytes(15) + bytes([i]) for i in range(1, 256)],
+        [bytes([i]) + bytes(15) for i in range(1, 256)],
+        [os.urandom(constants.BYTES_LEN) for _ in range(1000)],
+        # Many keys within the same bucket
+        [b"\x01\x02" + os.urandom(constants.BYTES_LEN - 2) for _ in range(1000)],
+        [b"\x01" * constants.BYTES_LEN],
+        [],
+    ],
+)
+@pytest.mark.parametrize("zero", [False, True])
+def test_to_array(keys: list[bytes], zero: bool) -> None:  # noqa: FBT001
+    values = ULIDSet(keys + [bytes(constants.BYTES_LEN)] * zero)
+    array = values.to_array()
+    assert array.is_sorted
+    assert bytes(array) == b"".join(
+        sorted(set(keys) | ({bytes(constants.BYTES_LEN)} if zero else set()))
+    )
+
+
+def test_zero() -> None:
+    zero = ULID.from_int(0)
+    values = ULIDSet([zero, ULID()])
+    assert zero in values
+    assert len(values) == 2  # noqa: PLR2004
+    assert zero in list(values)
+    values.discard(zero)
+    assert zero not in values
+    assert len(values) == 1
+
+
+def test_discard(ulids: list[ULID]) -> None:
+    rng = random.Random(42)  # noqa: S311
+    values = ULIDSet(capacity=len(ulids))
+    expected: set[ULID] = set()
+    for _ in range(20000):
+        ulid = rng.choice(ulids)
+        if rng.random() < 0.5:  # noqa: PLR2004
+            values.add(ulid)
+            expected.add(ulid)
+        else:
+            values.discard(ulid)
+            expected.discard(ulid)
+        assert len(values) == len(expected)
+    assert values == expected
+    assert all((ulid in values) == (ulid in expected) for ulid in ulids)
+    values.discard("not-a-ulid")
+    values.remove(next(iter(expected)))
+    with pytest.raises(KeyError):
+        values.remove(ULID())
+
+
+def test_set_operations(ulids: list[ULID]) -> None:
+    a = ULIDSet(ulids[:600])
+    b = ULIDSet(ulids[400:])
+    assert isinstance(a & b, ULIDSet)
+    assert a & b == set(ulids[400:600])
+    assert a | b == set(ulids)
+    assert a - b == set(ulids[:400])
+    assert ULIDSet(ulids[:10]) <= a
+
+
+def test_clear_reserve(ulids: list[ULID]) -> None:
+    values = ULIDSet(ulids)
+    nbytes = values.nbytes
+    values.clear()
+    assert len(values) == 0
+    assert values.nbytes < nbytes
+    values.reserve(len(ulids))
+    assert values.nbytes == nbytes
+    values.update(ulids)
+    assert values.nbytes == nbytes
+
+
+def test_pickle(ulids: list[ULID]) -> None:
+    values = ULIDSet(ulids)
+    assert pickle.loads(pickle.dumps(values)) == values  # noqa: S301
+
+
+def test_repr() -> None:
+    ulid = ULID()
+    assert repr(ULIDSet([ulid])) == f"ULIDSet([{str(ulid)!r}])"
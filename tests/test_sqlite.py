@@ -0,0 +1,104 @@
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from ulid import IntULID
+from ulid import sqlite
+from ulid import ULID
+from ulid.array import ULIDArray
+from ulid.generator import ULIDGenerator
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    sqlite.register()
+    connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    sqlite.create_functions(connection)
+    connection.execute("CREATE TABLE events (id ULID PRIMARY KEY)")
+    yield connection
+    connection.close()
+
+
+def test_adapter_converter(connection: sqlite3.Connection) -> None:
+    ulid = ULID()
+    int_ulid = IntULID()
+    connection.executemany("INSERT INTO events VALUES (?)", [(ulid,), (int_ulid,)])
+    (stored,) = connection.execute("SELECT id FROM events WHERE id = ?", (ulid,)).fetchone()
+    assert type(stored) is ULID
+    assert stored == ulid
+    (stored,) = connection.execute("SELECT id FROM events WHERE id = ?", (int_ulid,)).fetchone()
+    assert stored == int_ulid
+    (type_,) = connection.execute("SELECT DISTINCT typeof(id) FROM events").fetchone()
+    assert type_ == "blob"
+
+
+def test_converter_text(connection: sqlite3.Connection) -> None:
+    ulid = ULID()
+    connection.execute("INSERT INTO events VALUES (?)", (str(ulid),))
+    assert connection.execute("SELECT id FROM events").fetchone() == (ulid,)
+
+
+def test_functions(connection: sqlite3.Connection) -> None:
+    ulid = ULID()
+    connection.execute("INSERT INTO events VALUES (?)", (ulid,))
+    assert connection.execute("SELECT ulid_str(id) FROM events").fetchone() == (str(ulid),)
+    assert connection.execute(
+        "SELECT count(*) FROM events WHERE id = ulid_blob(?)", (str(ulid),)
+    ).fetchone() == (1,)
+    assert connection.execute("SELECT ulid_str(NULL), ulid_blob(NULL)").fetchone() == (None, None)
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("SELECT ulid_blob('invalid')").fetchone()
+
+
+def test_rows(connection: sqlite3.Connection) -> None:
+    generator = ULIDGenerator()
+    data = [generator.generate_bytes(100) for _ in range(3)]
+    connection.executemany("INSERT INTO events VALUES (?)", sqlite.rows(data[0]))
+    connection.executemany(
+        "INSERT INTO events VALUES (?)", sqlite.rows(ULIDArray.from_bytes(data[1]))
+    )
+    connection.executemany("INSERT INTO events VALUES (?)", sqlite.rows(bytearray(data[2])))
+    stored = [ulid for (ulid,) in connection.execute("SELECT id FROM events ORDER BY id")]
+    assert stored == sorted(ULIDArray.from_bytes(b"".join(data)))
+
+
+def test_rows_array_view() -> None:
+    array = ULIDArray.from_bytes(ULIDGenerator().generate_bytes(10))
+    assert [record for (record,) in sqlite.rows(array[2:5])] == [ulid.bytes for ulid in array[2:5]]
+
+
+def test_rows_invalid_size() -> None:
+    with pytest.raises(ValueError, match="multiple of 16"):
+        list(sqlite.rows(b"\x00" * 17))
+
+
+def test_insert(connection: sqlite3.Connection) -> None:
+    generator = ULIDGenerator()
+    data = generator.generate_bytes(100)
+    array = ULIDArray.from_bytes(generator.generate_bytes(100))
+    sqlite.insert(connection, "events", data, chunk_size=7)
+    sqlite.insert(connection, "events", array[10:90])
+    sqlite.insert(connection, "events", bytearray(generator.generate_bytes(1)), column="id")
+    sqlite.insert(connection, "events", b"")
+    assert connection.execute("SELECT count(*), typeof(min(id)) FROM events").fetchone() == (
+        181,
+        "blob",
+    )
+    stored = [ulid for (ulid,) in connection.execute("SELECT id FROM events ORDER BY id LIMIT 180")]
+    assert stored == list(ULIDArray.from_bytes(data)) + list(array[10:90])
+
+
+def test_insert_quoted(connection: sqlite3.Connection) -> None:
+    connection.execute('CREATE TABLE "my ""table""" ("the id" ULID)')
+    ulid = ULID()
+    sqlite.insert(connection, 'my "table"', ulid.bytes, column="the id")
+    assert connection.execute('SELECT * FROM "my ""table"""').fetchall() == [(ulid,)]
+
+
+def test_insert_invalid(connection: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError, match="multiple of 16"):
+        sqlite.insert(connection, "events", b"\x00" * 17)
+    with pytest.raises(ValueError, match="Chunk size"):
+        sqlite.insert(connection, "events", b"", chunk_size=0)
+    assert connection.execute("SELECT count(*) FROM events").fetchone() == (0,)
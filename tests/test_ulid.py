@@ -1,20 +1,30 @@
+import copy
 import json
+import pickle
+import subprocess
+import sys
+import textwrap
 import time
 import uuid
 from collections.abc import Callable
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from importlib.metadata import version
+from pathlib import Path
 from typing import Optional
 from typing import Union
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
 from pydantic import BaseModel
 from pydantic import ValidationError
 
+import ulid
 from ulid import base32
 from ulid import constants
+from ulid import IntULID
 from ulid import ULID
 
 
@@ -112,6 +122,56 @@ def test_idempotency() -> None:
     assert ULID.parse(ulid.bytes) == ulid
 
 
+def test_parse_int() -> None:
+    # Integers with 37 digits are ULIDs, all others are timestamps in milliseconds
+    assert int(ULID.parse(10**36)) == 10**36
+    assert int(ULID.parse(10**37 - 1)) == 10**37 - 1
+    assert ULID.parse(10**12).milliseconds == 10**12
+    with pytest.raises(OverflowError):
+        ULID.parse(10**36 - 1)
+    with pytest.raises(OverflowError):
+        ULID.parse(10**37)
+
+
+def test_parse_many() -> None:
+    ulid = ULID()
+    values = [
+        ulid,
+        IntULID.from_int(int(ulid)),
+        str(ulid),
+        str(ulid),
+        ulid.hex,
+        str(ulid.to_uuid()),
+        ulid.to_uuid(),
+        int(ulid),
+        ulid.bytes,
+    ]
+    assert ULID.parse_many(values) == [ulid] * len(values)
+    assert ULID.parse_many([]) == []
+
+    ulids = IntULID.parse_many([ulid.milliseconds, ulid.timestamp, ulid.datetime])
+    assert all(type(value) is IntULID for value in ulids)
+    assert [value.milliseconds for value in ulids] == [ulid.milliseconds] * 3
+
+
+def test_parse_many_errors() -> None:
+    ulid = ULID()
+    values = [str(ulid), "not-a-ulid", "Z" * 26, b"short", -1, [], str(ulid)]
+    with pytest.raises(ValueError, match="Cannot parse ULID from string of length 10"):
+        ULID.parse_many(values)
+
+    errors: list[tuple[int, Exception]] = []
+    assert ULID.parse_many(values, errors=errors) == [ulid, ulid]
+    assert [index for index, _ in errors] == [1, 2, 3, 4, 5]
+    assert [type(err) for _, err in errors] == [
+        ValueError,
+        ValueError,
+        ValueError,
+        OverflowError,
+        TypeError,
+    ]
+
+
 def test_to_uuid4() -> None:
     ulid = ULID()
     uuid = ulid.to_uuid4()
@@ -255,3 +315,216 @@ def test_pydantic_protocol() -> None:
     assert {
         "type": "null",
     } in model_json_schema["properties"]["ulid"]["anyOf"]
+
+
+@freeze_time()
+def test_generate_many() -> None:
+    ulids = ULID.generate_many(100)
+    assert len(ulids) == 100  # noqa: PLR2004
+    assert len(set(ulids)) == 100  # noqa: PLR2004
+    assert all(isinstance(u, ULID) for u in ulids)
+    assert all(u.timestamp == pytest.approx(time.time()) for u in ulids)
+    assert ULID.generate_many(0) == []
+    with pytest.raises(ValueError):  # noqa: PT011
+        ULID.generate_many(-1)
+
+
+def test_slots() -> None:
+    ulid = ULID()
+    assert not hasattr(ulid, "__dict__")
+    with pytest.raises(AttributeError):
+        ulid.foo = "bar"  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(cls: type[ULID], protocol: int) -> None:
+    ulid = cls()
+    unpickled = pickle.loads(pickle.dumps(ulid, protocol))  # noqa: S301
+    assert type(unpickled) is cls
+    assert unpickled == ulid
+    assert copy.copy(ulid) == ulid
+    assert copy.deepcopy(ulid) == ulid
+
+
+class TaggedULID(ULID):
+    def __init__(self, value: Optional[bytes] = None, tag: str = "default") -> None:  # noqa: FA100
+        super().__init__(value)
+        self.tag = tag
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_subclass(protocol: int) -> None:
+    ulid = TaggedULID(tag="custom")
+    unpickled = pickle.loads(pickle.dumps(ulid, protocol))  # noqa: S301
+    assert type(unpickled) is TaggedULID
+    assert unpickled == ulid
+    assert unpickled.tag == "custom"
+    assert copy.copy(ulid).tag == "custom"
+    assert copy.deepcopy(ulid).tag == "custom"
+
+
+def test_unpickle_subclass_without_slots() -> None:
+    # Pickled with a version of ULID that didn't define `__slots__`
+    data = (
+        b"\x80\x04\x95O\x00\x00\x00\x00\x00\x00\x00\x8c\x0ftests.test_ulid\x94\x8c\nTaggedULID"
+        b"\x94\x93\x94)\x81\x94}\x94(\x8c\x05bytes\x94C\x10\x01\x8a\xb2\xf9\xae\xa8\xcc\xff\xac"
+        b"\xefy\x00\xe6UR\x99\x94\x8c\x03tag\x94\x8c\x01x\x94ub."
+    )
+    ulid = pickle.loads(data)  # noqa: S301
+    assert type(ulid) is TaggedULID
+    assert ulid == ULID.from_str("01HASFKBN8SKZTSVVS03K5AMMS")
+    assert ulid.tag == "x"
+    assert str(ulid) == "01HASFKBN8SKZTSVVS03K5AMMS"
+
+
+def test_unpickle_without_slots() -> None:
+    # Pickled with a version of ULID that didn't define `__slots__`
+    data = (
+        b"\x80\x04\x953\x00\x00\x00\x00\x00\x00\x00\x8c\x04ulid\x94\x8c\x04ULID\x94\x93\x94)"
+        b"\x81\x94}\x94\x8c\x05bytes\x94C\x10\x01\x8a\xb2\xf9\xae\xa8\xcc\xff\xac\xefy\x00"
+        b"\xe6UR\x99\x94sb."
+    )
+    ulid = pickle.loads(data)  # noqa: S301
+    assert ulid == ULID.from_str("01HASFKBN8SKZTSVVS03K5AMMS")
+    assert str(ulid) == "01HASFKBN8SKZTSVVS03K5AMMS"
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_str_cached(cls: type[ULID]) -> None:
+    ulid = cls.from_int(int(ULID()))
+    with mock.patch("ulid.base32.encode", wraps=base32.encode) as encode:
+        value = str(ulid)
+        assert ulid < value + "0"
+        assert ulid == value
+        assert sorted([value + "0", ulid, value[:-1]]) == [value[:-1], ulid, value + "0"]
+    assert str(ulid) is value
+    encode.assert_called_once_with(ulid.bytes)
+
+
+@pytest.mark.parametrize("cls", [ULID, IntULID])
+def test_str_cache_invalidated(cls: type[ULID]) -> None:
+    ulid = cls()
+    str(ulid)
+    ulid.bytes = bytes(constants.BYTES_LEN)
+    assert str(ulid) == "0" * constants.REPR_LEN
+    assert ulid == "0" * constants.REPR_LEN
+
+
+def test_int_ulid() -> None:
+    ulid = ULID()
+    int_ulid = IntULID.from_int(int(ulid))
+    assert isinstance(int_ulid, ULID)
+    assert not hasattr(int_ulid, "__dict__")
+    assert int_ulid.bytes == ulid.bytes
+    assert int(int_ulid) == int(ulid)
+    assert str(int_ulid) == str(ulid)
+    assert int_ulid.hex == ulid.hex
+    assert int_ulid.milliseconds == ulid.milliseconds
+    assert int_ulid == ulid
+    assert ulid == int_ulid
+    assert int_ulid == int(ulid)
+    assert int_ulid == str(ulid)
+    assert int_ulid == ulid.bytes
+    assert hash(int_ulid) == hash(ulid)
+    assert IntULID.from_str(str(ulid)) == int_ulid
+    assert IntULID.from_bytes(ulid.bytes) == int_ulid
+    assert isinstance(IntULID.from_str(str(ulid)), IntULID)
+
+    larger = IntULID.from_int(int(ulid) + 1)
+    assert int_ulid < larger
+    assert int_ulid < int(larger)
+    assert ulid < larger
+    assert int_ulid < larger.bytes
+    assert int_ulid <= larger
+    assert larger > int_ulid
+    assert (int_ulid == object()) is False
+
+
+@pytest.mark.parametrize("value", [-1, constants.MAX_INT + 1])
+def test_int_ulid_invalid_input(value: int) -> None:
+    with pytest.raises(OverflowError):
+        IntULID.from_int(value)
+    with pytest.raises(OverflowError):
+        ULID.from_int(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [1588257207560, 1588257207.56, datetime(2020, 4, 30, 14, 33, 27, 560000, tzinfo=timezone.utc)],
+)
+def test_min_max_for(value: Union[float, datetime]) -> None:  # noqa: FA100
+    lower = ULID.min_for(value)
+    upper = ULID.max_for(value)
+    assert lower.milliseconds == upper.milliseconds == 1588257207560  # noqa: PLR2004
+    assert lower.bytes.endswith(b"\x00" * constants.RANDOMNESS_LEN)
+    assert upper.bytes.endswith(b"\xff" * constants.RANDOMNESS_LEN)
+    ulid = ULID.from_timestamp(1588257207560)
+    assert lower < ulid < upper
+    assert ULID.max_for(1588257207559) < lower
+    assert upper < ULID.min_for(1588257207561)
+
+
+def test_min_max_for_invalid_input() -> None:
+    with pytest.raises(TypeError):
+        ULID.min_for("2020-04-30")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        ULID.max_for(b"\x00")  # type: ignore[arg-type]
+
+
+def test_version() -> None:
+    assert ulid.__version__ == version("python-ulid")
+    with pytest.raises(AttributeError):
+        ulid.not_an_attribute  # noqa: B018
+
+
+def test_version_from_build_hook(tmp_path: Path) -> None:
+    # Installed builds contain the module `ulid._version`, whose import sets the attribute of the
+    # same name on the package.
+    (tmp_path / "_version.py").write_text('__version__ = "1.2.3"\n')
+    ulid._get_version.cache_clear()  # noqa: SLF001
+    try:
+        with mock.patch.object(ulid, "__path__", [*ulid.__path__, str(tmp_path)]):
+            assert ulid.__version__ == "1.2.3"
+            assert ulid.__version__ == "1.2.3"
+    finally:
+        sys.modules.pop("ulid._version", None)
+        vars(ulid).pop("_version", None)
+        ulid._get_version.cache_clear()  # noqa: SLF001
+
+
+def test_type_error_message() -> None:
+    with pytest.raises(TypeError, match="^Value has to be of type UUID$"):
+        ULID.from_uuid("not-a-uuid")  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match="^Value has to be of type datetime or int or float$"):
+        ULID.min_for("2020-04-30")  # type: ignore[arg-type]
+
+
+def test_lazy_imports() -> None:
+    script = textwrap.dedent(
+        """
+        import sys
+        from ulid import ULID
+
+        lazy = ["uuid", "datetime", "importlib.metadata"]
+        assert not any(module in sys.modules for module in lazy), sys.modules.keys()
+        for constructor in (ULID.from_uuid, ULID.from_datetime, ULID.min_for):
+            try:
+                constructor("not-a-value")
+            except TypeError:
+                pass
+            else:
+                raise AssertionError(constructor)
+        ulid = ULID.parse("0183eb3d-8ba6-d89d-38ca-7fa2e6b4c879")
+        assert str(ulid) == "01GFNKV2X6V2EKHJKZMBKB9J3S"
+        assert ulid.datetime.year == 2022
+
+        import uuid
+        from datetime import datetime
+        assert ULID.parse(ulid.to_uuid()) == ulid
+        assert ULID.from_uuid(ulid.to_uuid()) == ulid
+        assert ULID.from_datetime(datetime.now()) > ulid
+        assert ULID.parse(ulid.datetime).milliseconds == ulid.milliseconds
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
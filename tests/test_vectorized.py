@@ -0,0 +1,75 @@
+import os
+from typing import Any
+
+import pytest
+
+from ulid import base32
+from ulid import constants
+from ulid import ULID
+
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("ulid.vectorized")
+
+
+@pytest.fixture
+def ulids() -> list[ULID]:
+    return [ULID() for _ in range(100)] + [ULID(b"\x00" * 16), ULID(b"\xff" * 16)]
+
+
+def test_encode(ulids: list[ULID]) -> None:
+    binary = np.frombuffer(b"".join(u.bytes for u in ulids), dtype=np.uint8).reshape(-1, 16)
+    encoded = vectorized.encode(binary)
+    assert encoded.shape == (len(ulids), constants.REPR_LEN)
+    assert encoded.dtype == np.dtype("S1")
+    assert [v.decode() for v in encoded.view("S26")[:, 0]] == [str(u) for u in ulids]
+
+
+def test_encode_bytes_array(ulids: list[ULID]) -> None:
+    encoded = vectorized.encode(np.array([u.bytes for u in ulids], dtype="S16"))
+    assert [v.decode() for v in encoded.view("S26")[:, 0]] == [str(u) for u in ulids]
+
+
+@pytest.mark.parametrize("kind", ["str", "array"])
+def test_decode(ulids: list[ULID], kind: str) -> None:
+    values: Any = [str(u) for u in ulids]
+    if kind == "array":
+        values = np.array([v.encode() for v in values], dtype="S26").view("S1").reshape(-1, 26)
+    decoded = vectorized.decode(values)
+    assert decoded.shape == (len(ulids), constants.BYTES_LEN)
+    assert decoded.dtype == np.uint8
+    assert [bytes(row) for row in decoded] == [u.bytes for u in ulids]
+
+
+def test_roundtrip() -> None:
+    binary = np.frombuffer(os.urandom(16 * 1000), dtype=np.uint8).reshape(-1, 16)
+    binary = binary.copy()
+    binary[:, 0] &= 0x7F
+    assert (vectorized.decode(vectorized.encode(binary)) == binary).all()
+    assert [base32.encode(bytes(row)) for row in binary] == [
+        v.decode() for v in vectorized.encode(binary).view("S26")[:, 0]
+    ]
+
+
+def test_empty() -> None:
+    assert vectorized.encode(np.empty((0, 16), dtype=np.uint8)).shape == (0, 26)
+    assert vectorized.decode(np.empty((0, 26), dtype="S1")).shape == (0, 16)
+
+
+@pytest.mark.parametrize(
+    ("func", "value"),
+    [
+        (vectorized.encode, np.zeros((2, 15), dtype=np.uint8)),
+        (vectorized.encode, np.zeros(16, dtype=np.uint8)),
+        (vectorized.encode, np.zeros((2, 16), dtype=np.int64)),
+        (vectorized.encode, np.array([b"a" * 15], dtype="S15")),
+        (vectorized.decode, ["0" * 25]),
+        (vectorized.decode, ["0" * 25 + "U"]),
+        (vectorized.decode, ["0" * 25 + "a"]),
+        (vectorized.decode, ["0" * 25 + "é"]),
+        (vectorized.decode, ["8" + "0" * 25]),
+    ],
+)
+def test_invalid_input(func: Any, value: Any) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        func(value)
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
 import functools
-import os
+import sys
 import time
-import uuid
-from datetime import datetime
-from datetime import timezone
 from typing import Any
 from typing import cast
 from typing import Generic
@@ -13,45 +10,105 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from ulid import base32
+from ulid import cache
 from ulid import constants
+from ulid import entropy
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    import uuid
     from collections.abc import Callable
+    from collections.abc import Iterable
+    from datetime import datetime
 
     from pydantic import GetCoreSchemaHandler
-    from pydantic import ValidatorFunctionWrapHandler
+    from pydantic import GetJsonSchemaHandler
+    from pydantic.json_schema import JsonSchemaValue
     from pydantic_core import CoreSchema
 
-try:
-    from importlib.metadata import version
-except ImportError:  # pragma: no cover
-    from importlib_metadata import version  # type: ignore
+    __version__: str
 
 
-__version__ = version("python-ulid")
+def __getattr__(name: str) -> Any:
+    # Looking up the version in the package metadata is slow, so it is deferred until the first
+    # access of `ulid.__version__`.
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Not named `_version`, since importing the submodule `ulid._version` sets the attribute of the
+# same name on the package.
+@functools.cache
+def _get_version() -> str:
+    try:
+        # Written by the build hook of `hatch-vcs`
+        from ulid._version import __version__
+    except ImportError:
+        try:
+            from importlib.metadata import version
+        except ImportError:  # pragma: no cover
+            from importlib_metadata import version  # type: ignore
+
+        return version("python-ulid")
+    return __version__
+
 
 T = TypeVar("T", bound=type)
 R = TypeVar("R")
 
 
+def _lazy_type(name: str) -> type[Any] | None:
+    """Return the type with the given qualified name if its module has already been imported.
+
+    A value can only be an instance of a type whose module is imported, so that modules like
+    :mod:`uuid` and :mod:`datetime` don't have to be imported just to check the type of a value.
+    """
+    module, _, attr = name.rpartition(".")
+    if module not in sys.modules:
+        return None
+    return cast("type[Any]", getattr(sys.modules[module], attr))
+
+
 class validate_type(Generic[T]):  # noqa: N801
-    def __init__(self, *types: T) -> None:
+    """Check that the value passed to a constructor is of one of the given types. Types can also
+    be given by their qualified name, e.g. ``"uuid.UUID"``, to not import their module eagerly.
+    """
+
+    def __init__(self, *types: T | str) -> None:
         self.types = types
 
     def __call__(self, func: Callable[..., R]) -> Callable[..., R]:
+        types: tuple[type[Any], ...] = tuple(t for t in self.types if not isinstance(t, str))
+        names = [t for t in self.types if isinstance(t, str)]
+        message = "Value has to be of type " + " or ".join([
+            t.rpartition(".")[2] if isinstance(t, str) else t.__name__ for t in self.types
+        ])
+
         @functools.wraps(func)
         def wrapped(cls: Any, value: T) -> R:
-            if not isinstance(value, self.types):
-                message = "Value has to be of type "
-                message += " or ".join([t.__name__ for t in self.types])
-                raise TypeError(message)
+            nonlocal types, names
+            if not isinstance(value, types):
+                resolved = [_lazy_type(name) for name in names]
+                if not any(t is not None and isinstance(value, t) for t in resolved):
+                    raise TypeError(message)
+                if all(resolved):
+                    types, names = types + cast("tuple[type[Any], ...]", tuple(resolved)), []
             return func(cls, value)
 
         return wrapped
 
 
+def _milliseconds(value: datetime | float) -> int:
+    if not isinstance(value, (int, float)):
+        value = value.timestamp()
+    if isinstance(value, float):
+        return int(value * constants.MILLISECS_IN_SECS)
+    return value
+
+
 U = TypeVar("U", bound="ULID")
+V = TypeVar("V", bound="IntULID")
 
 
 @functools.total_ordering
@@ -80,15 +137,24 @@ class ULID:
         ValueError: If the provided value is not a valid encoded ULID.
     """
 
+    # The base32 representation is computed on first use and kept in `_str`, because it is used
+    # repeatedly when ULIDs are compared with strings, e.g. when sorted against string keys. It is
+    # kept together with the value it was encoded from, so that reassigning `bytes` invalidates it
+    # without the cost of a property or `__setattr__` on every access.
+    __slots__ = ("bytes", "_str")
+
     def __init__(self, value: bytes | None = None) -> None:
-        if value is not None and len(value) != constants.BYTES_LEN:
+        if value is None:
+            value = int.to_bytes(
+                time.time_ns() // constants.NANOSECS_IN_MILLISECS, constants.TIMESTAMP_LEN, "big"
+            ) + entropy.random_bytes(constants.RANDOMNESS_LEN)
+        elif len(value) != constants.BYTES_LEN:
             raise ValueError("ULID has to be exactly 16 bytes long.")
-        self.bytes: bytes = (
-            value or ULID.from_timestamp(time.time_ns() // constants.NANOSECS_IN_MILLISECS).bytes
-        )
+        self.bytes: bytes = value
+        self._str: tuple[Any, str] | None = None
 
     @classmethod
-    @validate_type(datetime)
+    @validate_type("datetime.datetime")
     def from_datetime(cls: type[U], value: datetime) -> U:
         """Create a new :class:`ULID`-object from a :class:`datetime`. The timestamp part of the
         `ULID` will be set to the corresponding timestamp of the datetime.
@@ -99,7 +165,7 @@ class ULID:
             >>> ULID.from_datetime(datetime.now())
             ULID(01E75QRYCAMM1MKQ9NYMYT6SAV)
         """
-        return cls.from_timestamp(value.timestamp())
+        return cls._from_milliseconds(int(value.timestamp() * constants.MILLISECS_IN_SECS))
 
     @classmethod
     @validate_type(int, float)
@@ -116,12 +182,75 @@ class ULID:
         """
         if isinstance(value, float):
             value = int(value * constants.MILLISECS_IN_SECS)
+        return cls._from_milliseconds(value)
+
+    @classmethod
+    def _from_milliseconds(cls: type[U], value: int) -> U:
         timestamp = int.to_bytes(value, constants.TIMESTAMP_LEN, "big")
-        randomness = os.urandom(constants.RANDOMNESS_LEN)
-        return cls.from_bytes(timestamp + randomness)
+        randomness = entropy.random_bytes(constants.RANDOMNESS_LEN)
+        return cls(timestamp + randomness)
 
     @classmethod
-    @validate_type(uuid.UUID)
+    @validate_type("datetime.datetime", int, float)
+    def min_for(cls: type[U], value: datetime | float) -> U:
+        """Create the smallest possible :class:`ULID` for the given time, which can be a
+        :class:`datetime`, a `float` in seconds or an `int` in milliseconds.
+
+        Any :class:`ULID` of the same millisecond is greater than or equal to it, which makes it
+        suitable as a lower bound for range queries on sorted ULIDs.
+
+        Examples:
+
+            >>> ULID.min_for(1588257207560)
+            ULID(01E75R3D880000000000000000)
+        """
+        timestamp = int.to_bytes(_milliseconds(value), constants.TIMESTAMP_LEN, "big")
+        return cls(timestamp + b"\x00" * constants.RANDOMNESS_LEN)
+
+    @classmethod
+    @validate_type("datetime.datetime", int, float)
+    def max_for(cls: type[U], value: datetime | float) -> U:
+        """Create the largest possible :class:`ULID` for the given time, which can be a
+        :class:`datetime`, a `float` in seconds or an `int` in milliseconds.
+
+        Any :class:`ULID` of the same millisecond is less than or equal to it, which makes it
+        suitable as an upper bound for range queries on sorted ULIDs.
+
+        Examples:
+
+            >>> ULID.max_for(1588257207560)
+            ULID(01E75R3D88ZZZZZZZZZZZZZZZZ)
+        """
+        timestamp = int.to_bytes(_milliseconds(value), constants.TIMESTAMP_LEN, "big")
+        return cls(timestamp + b"\xff" * constants.RANDOMNESS_LEN)
+
+    @classmethod
+    def generate_many(cls: type[U], n: int) -> list[U]:
+        """Create `n` new :class:`ULID`-objects from the current timestamp.
+
+        The clock is read only once and the randomness for all ULIDs is taken from a single call
+        to the entropy source, which makes this considerably faster than calling the default
+        constructor `n` times. Note that all ULIDs share the same timestamp, but are not sorted
+        within that millisecond.
+
+        Examples:
+
+            >>> ULID.generate_many(3)
+            [ULID(01JA9ZK0FN9QW7VSMR7H1PDW0B), ULID(01JA9ZK0FNDVY1EEVE8B6A1VHM), ...]
+        """
+        if n < 0:
+            raise ValueError("Number of ULIDs must not be negative.")
+        timestamp = int.to_bytes(
+            time.time_ns() // constants.NANOSECS_IN_MILLISECS, constants.TIMESTAMP_LEN, "big"
+        )
+        randomness = entropy.random_bytes(constants.RANDOMNESS_LEN * n)
+        return [
+            cls(timestamp + randomness[i : i + constants.RANDOMNESS_LEN])
+            for i in range(0, len(randomness), constants.RANDOMNESS_LEN)
+        ]
+
+    @classmethod
+    @validate_type("uuid.UUID")
     def from_uuid(cls: type[U], value: uuid.UUID) -> U:
         """Create a new :class:`ULID`-object from a :class:`uuid.UUID`. The timestamp part will be
         random in that case.
@@ -144,12 +273,18 @@ class ULID:
     @validate_type(str)
     def from_hex(cls: type[U], value: str) -> U:
         """Create a new :class:`ULID`-object from 32 character string of hex values."""
-        return cls.from_bytes(bytes.fromhex(value))
+        return cls(bytes.fromhex(value))
 
     @classmethod
     @validate_type(str)
     def from_str(cls: type[U], string: str) -> U:
-        """Create a new :class:`ULID`-object from a 26 char long string representation."""
+        """Create a new :class:`ULID`-object from a 26 char long string representation.
+
+        If the parse cache is enabled (see :mod:`ulid.cache`), repeated strings are looked up
+        instead of decoded again.
+        """
+        if cache.lookup is not None:
+            return cast(U, cache.lookup(cls, string))
         return cls(base32.decode(string))
 
     @classmethod
@@ -167,29 +302,67 @@ class ULID:
         """
         if isinstance(value, ULID):
             return cast(U, value)
-        if isinstance(value, uuid.UUID):
-            return cls.from_uuid(value)
+        # The type of the value is known in each branch, so that the constructors are invoked
+        # without the `validate_type` wrapper.
         if isinstance(value, str):
             len_value = len(value)
             if len_value == constants.UUID_REPR_LEN:
-                return cls.from_uuid(uuid.UUID(value))
+                import uuid
+
+                return cls(uuid.UUID(value).bytes)
             if len_value == constants.HEX_REPR_LEN:
-                return cls.from_hex(value)
+                return cls(bytes.fromhex(value))
             if len_value == constants.REPR_LEN:
-                return cls.from_str(value)
+                if cache.lookup is not None:
+                    return cast(U, cache.lookup(cls, value))
+                return cls(base32.decode(value))
             raise ValueError(f"Cannot parse ULID from string of length {len_value}")
         if isinstance(value, int):
-            if len(str(value)) == constants.INT_REPR_LEN:
-                return cls.from_int(value)
-            return cls.from_timestamp(value)
+            # Integers with as many digits as a ULID are ULIDs, all others are timestamps.
+            if constants.MIN_INT_REPR <= value < constants.MIN_INT_REPR * 10:
+                return cls(int.to_bytes(value, constants.BYTES_LEN, "big"))
+            return cls._from_milliseconds(value)
         if isinstance(value, float):
-            return cls.from_timestamp(value)
-        if isinstance(value, datetime):
-            return cls.from_datetime(value)
+            return cls._from_milliseconds(int(value * constants.MILLISECS_IN_SECS))
         if isinstance(value, bytes):
-            return cls.from_bytes(value)
+            return cls(value)
+        # UUIDs and datetimes are checked last to not import their modules for the common types.
+        if (uuid_type := _lazy_type("uuid.UUID")) is not None and isinstance(value, uuid_type):
+            return cls(value.bytes)
+        if (datetime_type := _lazy_type("datetime.datetime")) is not None and isinstance(
+            value, datetime_type
+        ):
+            return cls._from_milliseconds(int(value.timestamp() * constants.MILLISECS_IN_SECS))
         raise TypeError(f"Cannot parse ULID from type {type(value)}")
 
+    @classmethod
+    def parse_many(
+        cls: type[U], values: Iterable[Any], *, errors: list[tuple[int, Exception]] | None = None
+    ) -> list[U]:
+        """Create a list of :class:`ULID`-objects from values of any type supported by
+        :meth:`parse`.
+
+        This is considerably faster than calling :meth:`parse` for each value, since the parser
+        for a value is only looked up if its type differs from the type of the previous value. Use
+        :meth:`.ULIDArray.parse_many` to parse the values into a :class:`.ULIDArray` instead.
+
+        Args:
+            values (Iterable[Any]): The values to parse.
+            errors (list | None): If given, values that cannot be parsed are skipped and their
+                index is appended to the list together with the exception, instead of raising it.
+
+        Examples:
+
+            >>> errors = []
+            >>> ULID.parse_many(
+            ...     ["01E75HZVW36EAKE1X5HQHM4BTB", "invalid", 1588257207560], errors=errors
+            ... )
+            [ULID(01E75HZVW36EAKE1X5HQHM4BTB), ULID(01E75R3D88QTE06GAWJS4RQ6KZ)]
+            >>> errors
+            [(1, ValueError('Cannot parse ULID from string of length 7'))]
+        """
+        return list(map(cls, _parse_records(values, errors)))
+
     @property
     def milliseconds(self) -> int:
         """The timestamp part as epoch time in milliseconds.
@@ -221,6 +394,9 @@ class ULID:
             >>> ulid.datetime
             datetime.datetime(2020, 4, 30, 14, 33, 27, 560000, tzinfo=datetime.timezone.utc)
         """
+        from datetime import datetime
+        from datetime import timezone
+
         return datetime.fromtimestamp(self.timestamp, timezone.utc)
 
     @property
@@ -230,6 +406,8 @@ class ULID:
 
     def to_uuid(self) -> uuid.UUID:
         """Convert the :class:`ULID` to a :class:`uuid.UUID`."""
+        import uuid
+
         return uuid.UUID(bytes=self.bytes)
 
     def to_uuid4(self) -> uuid.UUID:
@@ -246,6 +424,8 @@ class ULID:
             >>> uuid.version
             4
         """
+        import uuid
+
         return uuid.UUID(bytes=self.bytes, version=4)
 
     def __repr__(self) -> str:
@@ -253,7 +433,11 @@ class ULID:
 
     def __str__(self) -> str:
         """Encode this object as a 26 character string sequence."""
-        return base32.encode(self.bytes)
+        cached = self._str
+        binary = self.bytes
+        if cached is None or cached[0] is not binary:
+            cached = self._str = (binary, base32.encode(binary))
+        return cached[1]
 
     def __int__(self) -> int:
         """Encode this object as an integer."""
@@ -288,36 +472,190 @@ class ULID:
     def __hash__(self) -> int:
         return hash(self.bytes)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The attributes of subclasses without `__slots__` are restored by `__setstate__`.
+        return self.__class__, (self.bytes,), getattr(self, "__dict__", None)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Objects that have been pickled before the introduction of `__slots__` carry all of their
+        # attributes including `bytes` as a `dict`.
+        state = dict(state)
+        if "bytes" in state:
+            self.bytes = state.pop("bytes")
+            self._str = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @classmethod
     def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
         from pydantic_core import core_schema
 
-        return core_schema.no_info_wrap_validator_function(
+        # A plain validator is called exactly once per value without any further validation by
+        # pydantic-core. The accepted input types are described by the JSON schema below.
+        return core_schema.no_info_plain_validator_function(
             cls._pydantic_validate,
-            core_schema.union_schema([
-                core_schema.is_instance_schema(ULID),
-                core_schema.no_info_plain_validator_function(ULID),
-                core_schema.str_schema(pattern=r"[A-Z0-9]{26}", min_length=26, max_length=26),
-                core_schema.bytes_schema(min_length=16, max_length=16),
-            ]),
             serialization=core_schema.to_string_ser_schema(
                 when_used="json-unless-none",
             ),
         )
 
     @classmethod
-    def _pydantic_validate(cls, value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
-        from pydantic_core import PydanticCustomError
+    def __get_pydantic_json_schema__(
+        cls, schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        from pydantic_core import core_schema
 
+        return handler(
+            core_schema.union_schema([
+                core_schema.str_schema(pattern=r"[A-Z0-9]{26}", min_length=26, max_length=26),
+                core_schema.bytes_schema(min_length=16, max_length=16),
+            ])
+        )
+
+    @classmethod
+    def _pydantic_validate(cls: type[U], value: Any) -> U:
+        # The type of the value is known in each branch, so that the constructors are invoked
+        # without the `validate_type` wrapper.
         try:
+            if isinstance(value, str):
+                return cls(base32.decode(value))
+            if isinstance(value, ULID):
+                return cast(U, value)
             if isinstance(value, int):
-                ulid = cls.from_int(value)
-            elif isinstance(value, str):
-                ulid = cls.from_str(value)
-            elif isinstance(value, ULID):
-                ulid = value
-            else:
-                ulid = cls.from_bytes(value)
-        except ValueError as err:
+                return cls(int.to_bytes(value, constants.BYTES_LEN, "big"))
+            if isinstance(value, bytes):
+                return cls(value)
+        except (ValueError, OverflowError) as err:
+            from pydantic_core import PydanticCustomError
+
             raise PydanticCustomError("ulid_format", "Unrecognized format") from err
-        return handler(ulid)
+        from pydantic_core import PydanticCustomError
+
+        raise PydanticCustomError("ulid_type", "Input should be a ULID, str, int or bytes")
+
+
+class IntULID(ULID):
+    """A :class:`ULID` that is backed by an `int` instead of `bytes`.
+
+    It behaves exactly like a :class:`ULID`, but :meth:`from_int`, ``int(ulid)`` as well as
+    ordering and equality checks against other :class:`IntULID`-objects or integers work on the
+    stored `int` directly. In turn the :attr:`bytes` attribute has to be computed on every access.
+    Prefer this class if ULIDs are mostly handled as integers, e.g. when they are stored in a
+    database as such.
+
+    Examples:
+
+        >>> ulid = IntULID.from_int(2049395013039097460549394558635823769)
+        >>> ulid
+        ULID(01HASFKBN8SKZTSVVS03K5AMMS)
+        >>> ulid == ULID.from_str("01HASFKBN8SKZTSVVS03K5AMMS")
+        True
+    """
+
+    __slots__ = ("_int",)
+
+    @property
+    def bytes(self) -> bytes:
+        return int.to_bytes(self._int, constants.BYTES_LEN, "big")
+
+    @bytes.setter
+    def bytes(self, value: bytes) -> None:
+        self._int = int.from_bytes(value, "big")
+        self._str = None
+
+    @classmethod
+    @validate_type(int)
+    def from_int(cls: type[V], value: int) -> V:
+        """Create a new :class:`IntULID`-object from an `int`."""
+        if not 0 <= value <= constants.MAX_INT:
+            raise OverflowError("ULID has to be exactly 16 bytes long.")
+        ulid = cls.__new__(cls)
+        ulid._int = value  # noqa: SLF001
+        ulid._str = None  # noqa: SLF001
+        return ulid
+
+    def __int__(self) -> int:
+        return self._int
+
+    def __str__(self) -> str:
+        # The `bytes` are computed on every access, so that the cache is keyed by the `int`.
+        cached = self._str
+        value = self._int
+        if cached is None or cached[0] is not value:
+            cached = self._str = (value, base32.encode(self.bytes))
+        return cached[1]
+
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, IntULID):
+            return self._int < other._int
+        if isinstance(other, int):
+            return self._int < other
+        return super().__lt__(other)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntULID):
+            return self._int == other._int
+        if isinstance(other, int):
+            return self._int == other
+        return super().__eq__(other)
+
+    __hash__ = ULID.__hash__
+
+
+def _parse_records(
+    values: Iterable[Any], errors: list[tuple[int, Exception]] | None = None
+) -> list[bytes]:
+    """Parse all values into 16 byte records, see :meth:`ULID.parse_many`."""
+    records: list[bytes] = []
+    append = records.append
+    last_type: type | None = None
+    parse: Callable[[Any], bytes] = _parse_record
+    for index, value in enumerate(values):
+        if type(value) is not last_type:
+            last_type = type(value)
+            parse = _RECORD_PARSERS.get(last_type, _parse_record)
+        try:
+            append(parse(value))
+        except (TypeError, ValueError, OverflowError) as err:
+            if errors is None:
+                raise
+            errors.append((index, err))
+    return records
+
+
+def _parse_record(value: Any) -> bytes:
+    return ULID.parse(value).bytes
+
+
+def _parse_str_record(value: str) -> bytes:
+    if len(value) == constants.REPR_LEN:
+        return base32.decode(value)
+    return _parse_record(value)
+
+
+def _parse_int_record(value: int) -> bytes:
+    if constants.MIN_INT_REPR <= value < constants.MIN_INT_REPR * 10:
+        return int.to_bytes(value, constants.BYTES_LEN, "big")
+    return int.to_bytes(value, constants.TIMESTAMP_LEN, "big") + entropy.random_bytes(
+        constants.RANDOMNESS_LEN
+    )
+
+
+def _parse_bytes_record(value: bytes) -> bytes:
+    if len(value) != constants.BYTES_LEN:
+        raise ValueError("ULID has to be exactly 16 bytes long.")
+    return value
+
+
+def _parse_ulid_record(value: ULID) -> bytes:
+    return value.bytes
+
+
+# Parsers for the most common types that skip the type checks of `ULID.parse` and the creation of
+# intermediate objects. All other types, including subclasses, are parsed with `ULID.parse`.
+_RECORD_PARSERS: dict[type, Callable[[Any], bytes]] = {
+    str: _parse_str_record,
+    int: _parse_int_record,
+    bytes: _parse_bytes_record,
+    ULID: _parse_ulid_record,
+}
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import math
 import shutil
 import sys
 import textwrap
+import time
+from collections import deque
 from datetime import datetime
 from functools import partial
 from typing import Any
@@ -11,12 +15,88 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 import ulid
+from ulid import base32
+from ulid import constants
+from ulid import entropy
 from ulid import ULID
+from ulid.generator import ULIDGenerator
 
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Sequence
+    from concurrent.futures import Future
+    from typing import BinaryIO
+    from typing import TypeVar
+
+    T = TypeVar("T")
+    R = TypeVar("R")
+
+
+# Number of ULIDs that are generated and written at once when streaming many ULIDs.
+CHUNK_SIZE = 65536
+
+
+def format_uuid(binary: bytes) -> str:
+    h = binary.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+FORMATTERS: dict[str, Callable[[bytes], str]] = {
+    # Look up the encoder on every call to respect the selected base32 backend
+    "str": lambda binary: base32.encode(binary),
+    "hex": bytes.hex,
+    "uuid": format_uuid,
+    "int": lambda binary: str(int.from_bytes(binary, "big")),
+}
+FORMATS = [*FORMATTERS, "binary"]
+
+PARSERS: dict[str, Callable[[str], bytes]] = {
+    "str": lambda value: base32.decode(value),
+    "hex": lambda value: ULID.from_hex(value).bytes,
+    "uuid": lambda value: UUID(value).bytes,
+    "int": lambda value: int.to_bytes(int(value), constants.BYTES_LEN, "big"),
+}
+
+# Approximate number of bytes that are read at once by the convert command.
+CONVERT_CHUNK_BYTES = 1 << 22
+
+# The statements that are timed by the bench command. They are executed in a namespace with a
+# random `value`, its `string` and `binary` representation and a second random ULID `other`.
+# Since `str(value)` is cached after the first call, `str` times the base32 encoding instead.
+BENCHMARKS: dict[str, str] = {
+    "generate": "ULID()",
+    "str": "base32.encode(binary)",
+    "from_str": "ULID.from_str(string)",
+    "from_bytes": "ULID.from_bytes(binary)",
+    "parse": "ULID.parse(string)",
+    "to_uuid": "value.to_uuid()",
+    "datetime": "value.datetime",
+    "compare": "value < other",
+}
+PERCENTILES = (50, 90, 99)
+
+
+class VersionAction(argparse.Action):
+    """Print the version and exit. In contrast to the builtin ``version`` action, the version is
+    only looked up when the option is given, since that is slow.
+    """
+
+    def __init__(self, option_strings: Sequence[str], dest: str = argparse.SUPPRESS) -> None:
+        super().__init__(
+            option_strings,
+            dest=dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help="show program's version number and exit",
+        )
+
+    def __call__(self, parser: argparse.ArgumentParser, *_: Any) -> None:
+        print(ulid.__version__)  # noqa: T201
+        parser.exit()
 
 
 def make_parser(prog: str | None = None) -> argparse.ArgumentParser:
@@ -46,7 +126,7 @@ def make_parser(prog: str | None = None) -> argparse.ArgumentParser:
         ),
     )
     parser.set_defaults(func=lambda _: parser.print_help())
-    parser.add_argument("--version", "-V", action="version", version=ulid.__version__)
+    parser.add_argument("--version", "-V", action=VersionAction)
 
     subparsers = parser.add_subparsers(title="subcommands")
     b = subparsers.add_parser(
@@ -83,6 +163,24 @@ def make_parser(prog: str | None = None) -> argparse.ArgumentParser:
         metavar="<uuid>",
         help="create from given UUID. The timestamp part will be random.",
     )
+    b.add_argument(
+        "--count",
+        "-n",
+        metavar="<n>",
+        type=positive_int,
+        help="generate n ULIDs. Can only be combined with --from-timestamp or --from-datetime",
+    )
+    b.add_argument(
+        "--monotonic",
+        action="store_true",
+        help="generate strictly increasing ULIDs within the same millisecond. Requires --count",
+    )
+    b.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="str",
+        help="output format. The binary format writes 16 bytes per ULID without separators",
+    )
     b.set_defaults(func=build)
 
     s = subparsers.add_parser("show", help="show properties of a ULID")
@@ -94,10 +192,86 @@ def make_parser(prog: str | None = None) -> argparse.ArgumentParser:
     s.add_argument("--timestamp", "--ts", action="store_true", help="show timestamp")
     s.add_argument("--datetime", "--dt", action="store_true", help="show datetime")
     s.set_defaults(func=show)
+
+    c = subparsers.add_parser(
+        "convert",
+        help="convert many ULIDs between formats",
+        description="Convert ULIDs line by line or as 16 byte records between formats",
+    )
+    c.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="the file to read from. The special value - reads from stdin (default)",
+    )
+    c.add_argument(
+        "--from",
+        dest="from_format",
+        choices=FORMATS,
+        default="str",
+        help="input format (default: str)",
+    )
+    c.add_argument(
+        "--to",
+        dest="to_format",
+        choices=FORMATS,
+        default="str",
+        help="output format (default: str)",
+    )
+    c.add_argument(
+        "--errors",
+        choices=["strict", "skip", "report"],
+        default="strict",
+        help="how to handle malformed input. strict aborts, skip ignores it and report writes it"
+        " to stderr before continuing (default: strict)",
+    )
+    c.add_argument(
+        "--jobs",
+        "-j",
+        metavar="<n>",
+        type=positive_int,
+        default=1,
+        help="number of processes that convert the input in parallel. The order is preserved",
+    )
+    c.set_defaults(func=convert)
+
+    m = subparsers.add_parser(
+        "bench",
+        help="measure the performance of common operations on this host",
+        description="Measure the throughput of common operations. Each sample times a batch of "
+        "calls, from which the time per operation is derived.",
+    )
+    m.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="<name>",
+        help=f"the benchmarks to run. One of {', '.join(BENCHMARKS)} (default: all)",
+    )
+    m.add_argument(
+        "--duration",
+        metavar="<secs>",
+        type=float,
+        default=0.5,
+        help="approximate time spent on each benchmark in seconds (default: 0.5)",
+    )
+    m.add_argument(
+        "--number",
+        metavar="<n>",
+        type=positive_int,
+        default=1000,
+        help="number of operations that are timed per sample (default: 1000)",
+    )
+    m.add_argument(
+        "--backend",
+        choices=list(base32.BACKENDS),
+        help="the base32 backend to use (default: the currently selected one)",
+    )
+    m.add_argument("--json", action="store_true", help="write the results as JSON")
+    m.set_defaults(func=bench)
     return parser
 
 
-def main(argv: Sequence[str], prog: str | None = None) -> str:
+def main(argv: Sequence[str], prog: str | None = None) -> str | None:
     args = make_parser(prog).parse_args(argv)
     return args.func(args)
 
@@ -116,7 +290,46 @@ def parse_numeric(s: str) -> int | float:
         return float(s)
 
 
-def build(args: argparse.Namespace) -> str:
+def positive_int(s: str) -> int:
+    value = int(s)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"{s} is not a positive integer")
+    return value
+
+
+def format_records(records: bytes, output_format: str) -> bytes:
+    if output_format == "binary":
+        return records
+    formatter = FORMATTERS[output_format]
+    lines = [
+        formatter(records[i : i + constants.BYTES_LEN])
+        for i in range(0, len(records), constants.BYTES_LEN)
+    ]
+    lines.append("")
+    return "\n".join(lines).encode("ascii")
+
+
+def write_records(out: BinaryIO, records: bytes, output_format: str) -> None:
+    out.write(format_records(records, output_format))
+
+
+def random_records(n: int, timestamp: int | None = None) -> bytes:
+    if timestamp is None:
+        timestamp = time.time_ns() // constants.NANOSECS_IN_MILLISECS
+    prefix = int.to_bytes(timestamp, constants.TIMESTAMP_LEN, "big")
+    randomness = entropy.random_bytes(constants.RANDOMNESS_LEN * n)
+    return b"".join([
+        prefix + randomness[i : i + constants.RANDOMNESS_LEN]
+        for i in range(0, len(randomness), constants.RANDOMNESS_LEN)
+    ])
+
+
+def build(args: argparse.Namespace) -> str | None:
+    if args.count is not None:
+        build_many(args)
+        return None
+    if args.monotonic:
+        raise SystemExit("ulid build: error: --monotonic can only be combined with --count")
     ulid: ULID
     if args.from_int is not None:
         ulid = ULID.from_int(from_value_or_stdin(args.from_int, int))
@@ -132,7 +345,223 @@ def build(args: argparse.Namespace) -> str:
         ulid = ULID.from_uuid(from_value_or_stdin(args.from_uuid, UUID))
     else:
         ulid = ULID()
-    return str(ulid)
+    if args.format == "binary":
+        write_records(sys.stdout.buffer, ulid.bytes, args.format)
+        sys.stdout.buffer.flush()
+        return None
+    return FORMATTERS[args.format](ulid.bytes)
+
+
+def build_many(args: argparse.Namespace) -> None:
+    if any(
+        value is not None for value in (args.from_int, args.from_hex, args.from_str, args.from_uuid)
+    ):
+        raise SystemExit(
+            "ulid build: error: --count can only be combined with --from-timestamp or "
+            "--from-datetime"
+        )
+    timestamp: int | None = None
+    if args.from_timestamp is not None:
+        value = from_value_or_stdin(args.from_timestamp, parse_numeric)
+        timestamp = ULID.min_for(value).milliseconds
+    elif args.from_datetime is not None:
+        value = from_value_or_stdin(args.from_datetime, datetime.fromisoformat)
+        timestamp = ULID.min_for(value).milliseconds
+
+    generator = ULIDGenerator() if args.monotonic else None
+    out = sys.stdout.buffer
+    remaining = args.count
+    while remaining > 0:
+        n = min(remaining, CHUNK_SIZE)
+        if generator is not None:
+            records = generator.generate_bytes(n, timestamp)
+        else:
+            records = random_records(n, timestamp)
+        write_records(out, records, args.format)
+        remaining -= n
+    out.flush()
+
+
+def convert(args: argparse.Namespace) -> None:
+    out = sys.stdout.buffer
+    with contextlib.ExitStack() as stack:
+        stream = (
+            sys.stdin.buffer if args.input == "-" else stack.enter_context(open(args.input, "rb"))
+        )
+        tasks = (
+            (chunk, number, args.from_format, args.to_format, args.errors)
+            for chunk, number in read_chunks(stream, args.from_format)
+        )
+        if args.jobs == 1:
+            results: Iterable[tuple[bytes, list[str]]] = map(convert_chunk, tasks)
+        else:
+            results = stack.enter_context(
+                contextlib.closing(imap_ordered(convert_chunk, tasks, args.jobs))
+            )
+        for output, messages in results:
+            out.write(output)
+            for message in messages:
+                if args.errors == "strict":
+                    out.flush()
+                    raise SystemExit(f"ulid convert: error: {message}")
+                if args.errors == "report":
+                    print(message, file=sys.stderr)  # noqa: T201
+    out.flush()
+
+
+def read_chunks(stream: BinaryIO, input_format: str) -> Iterator[tuple[Any, int]]:
+    """Read the input in chunks of either bytes or lines together with the number of the first
+    record or line of each chunk.
+    """
+    number = 1
+    if input_format == "binary":
+        size = CONVERT_CHUNK_BYTES - CONVERT_CHUNK_BYTES % constants.BYTES_LEN
+        while data := stream.read(size):
+            yield data, number
+            number += len(data) // constants.BYTES_LEN
+    else:
+        while lines := stream.readlines(CONVERT_CHUNK_BYTES):
+            yield lines, number
+            number += len(lines)
+
+
+def convert_chunk(task: tuple[Any, int, str, str, str]) -> tuple[bytes, list[str]]:
+    chunk, number, input_format, output_format, errors = task
+    messages: list[str] = []
+    if input_format == "binary":
+        usable = len(chunk) - len(chunk) % constants.BYTES_LEN
+        if usable < len(chunk):
+            messages.append(f"record {number + usable // constants.BYTES_LEN}: incomplete record")
+        return format_records(chunk[:usable], output_format), messages
+
+    parse = PARSERS[input_format]
+    records = []
+    for line_number, line in enumerate(chunk, number):
+        value = line.strip()
+        if not value:
+            continue
+        try:
+            records.append(parse(value.decode("ascii")))
+        except (ValueError, OverflowError) as err:
+            messages.append(f"line {line_number}: {err}")
+            if errors == "strict":
+                break
+    return format_records(b"".join(records), output_format), messages
+
+
+def imap_ordered(func: Callable[[T], R], tasks: Iterable[T], jobs: int) -> Generator[R, None, None]:
+    """Apply `func` to all tasks in a pool of processes and yield the results in order.
+
+    In contrast to :meth:`concurrent.futures.Executor.map`, tasks are only submitted when there is
+    capacity for them, so that the input is not read into memory at once.
+    """
+    # Imported on demand, since it pulls in `multiprocessing`, which would slow down the start of
+    # every other command.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs) as executor:
+        pending: deque[Future[R]] = deque()
+        try:
+            for task in tasks:
+                pending.append(executor.submit(func, task))
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def bench(args: argparse.Namespace) -> str:
+    # Only needed by this command, so that they are not imported on the start of every command.
+    import json
+    import platform
+
+    names = args.benchmarks or list(BENCHMARKS)
+    if unknown := [name for name in names if name not in BENCHMARKS]:
+        raise SystemExit(f"ulid bench: error: unknown benchmark {unknown[0]!r}")
+    previous = base32_backend()
+    if args.backend is not None:
+        base32.set_backend(args.backend)
+    try:
+        results = {
+            name: run_benchmark(BENCHMARKS[name], args.duration, args.number) for name in names
+        }
+        backend = base32_backend()
+    finally:
+        base32.set_backend(previous)
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "version": ulid.__version__,
+            "backend": backend,
+            "benchmarks": results,
+        }
+        return json.dumps(report, indent=2)
+    header = ["benchmark", "ops/sec", *(f"p{p} ns/op" for p in PERCENTILES)]
+    rows = [
+        [
+            name,
+            f"{result['ops_per_sec']:,.0f}",
+            *(f"{result[f'p{p}_ns']:,.1f}" for p in PERCENTILES),
+        ]
+        for name, result in results.items()
+    ]
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in [header, *rows]
+    )
+
+
+def run_benchmark(stmt: str, duration: float, number: int) -> dict[str, Any]:
+    """Time `stmt` in samples of `number` executions until `duration` seconds have passed."""
+    import timeit
+
+    value = ULID()
+    namespace = {
+        "ULID": ULID,
+        "base32": base32,
+        "value": value,
+        "string": str(value),
+        "binary": value.bytes,
+        "other": ULID(),
+    }
+    timer = timeit.Timer(stmt, globals=namespace)
+    timer.timeit(number)  # warm up
+    samples: list[float] = []
+    total = 0.0
+    while total < duration or len(samples) < 2:  # noqa: PLR2004
+        elapsed = timer.timeit(number)
+        samples.append(elapsed * 1e9 / number)
+        total += elapsed
+    samples.sort()
+    result: dict[str, Any] = {
+        "ops_per_sec": len(samples) * number / total if total else math.inf,
+        "samples": len(samples),
+        "number": number,
+        "min_ns": samples[0],
+        "mean_ns": total * 1e9 / (len(samples) * number),
+    }
+    for p in PERCENTILES:
+        result[f"p{p}_ns"] = percentile(samples, p)
+    return result
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """Return the `p`-th percentile of the sorted `values` using the nearest-rank method."""
+    return values[max(math.ceil(p / 100 * len(values)) - 1, 0)]
+
+
+def base32_backend() -> str:
+    functions = (base32.encode, base32.decode)
+    return next((name for name, backend in base32.BACKENDS.items() if backend == functions), "")
 
 
 def show(args: argparse.Namespace) -> str:
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+from ulid import constants
+from ulid import entropy
+from ulid import ULID
+from ulid.entropy import _register_at_fork
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ulid.entropy import Entropy
+
+
+S = TypeVar("S", bound="AsyncULIDSource")
+
+
+class AsyncULIDSource:
+    """An asynchronous source of :class:`ULID`-objects that keeps drawing randomness off the
+    event loop.
+
+    The randomness parts are taken from a pool that is refilled by a background thread. As soon as
+    the pool holds fewer than `low` values, the thread draws the randomness for up to `high` values
+    with a single call to the entropy source, :func:`os.urandom` by default. The timestamp part is
+    taken from the clock when a ULID is handed out, so that ULIDs from the pool are not older than
+    ULIDs that are created directly. If the pool runs empty, the randomness is drawn in a worker
+    thread instead.
+
+    Examples:
+
+        >>> async with AsyncULIDSource() as source:
+        ...     ulid = await source.next()
+        ...     async for ulid in source:
+        ...         ...
+
+    Args:
+        low (int): The number of pooled values below which the pool is refilled.
+        high (int): The number of values the pool is refilled to.
+        entropy (Callable[[int], bytes] | None): The source of randomness, see
+            :mod:`ulid.entropy`. Defaults to the globally selected source.
+
+    Raises:
+        ValueError: If `low` is negative or not less than `high`.
+    """
+
+    def __init__(self, low: int = 256, high: int = 4096, entropy: Entropy | None = None) -> None:
+        if not 0 <= low < high:
+            raise ValueError("Watermarks must satisfy 0 <= low < high.")
+        self.low = low
+        self.high = high
+        self._entropy = entropy
+        # `deque.append` and `deque.popleft` are thread-safe, so that the event loop can take
+        # values from the pool without acquiring a lock.
+        self._pool: deque[bytes] = deque()
+        self._wanted = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        _register_at_fork(self)
+
+    @property
+    def available(self) -> int:
+        """The number of values that are currently in the pool."""
+        return len(self._pool)
+
+    def start(self) -> None:
+        """Start the refill thread. This is done implicitly by the first call to :meth:`next`."""
+        if self._closed:
+            raise RuntimeError("AsyncULIDSource is closed.")
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refill, name="ulid-refill", daemon=True)
+            self._wanted.set()
+            self._thread.start()
+
+    def _after_fork(self) -> None:
+        # Discard the pool of the parent process, whose refill thread does not exist in the child.
+        # The thread is started again on next use.
+        self._pool.clear()
+        self._wanted = threading.Event()
+        self._thread = None
+
+    def close(self) -> None:
+        """Stop the refill thread and discard the pool.
+
+        This waits for a running refill to finish, so that :meth:`aclose` should be used within
+        the event loop.
+        """
+        thread = self._stop()
+        if thread is not None:
+            thread.join()
+        self._pool.clear()
+
+    async def aclose(self) -> None:
+        """Stop the refill thread and discard the pool without blocking the event loop."""
+        thread = self._stop()
+        if thread is not None:
+            await asyncio.to_thread(thread.join)
+        self._pool.clear()
+
+    def _stop(self) -> threading.Thread | None:
+        self._closed = True
+        self._wanted.set()
+        thread, self._thread = self._thread, None
+        return thread
+
+    async def next(self) -> ULID:
+        """Return a new :class:`ULID` from the current time and pooled randomness."""
+        if self._thread is None:
+            self.start()
+        try:
+            randomness = self._pool.popleft()
+        except IndexError:
+            self._wanted.set()
+            randomness = await asyncio.to_thread(self._random_bytes, constants.RANDOMNESS_LEN)
+        else:
+            if len(self._pool) < self.low and not self._wanted.is_set():
+                self._wanted.set()
+        timestamp = int.to_bytes(
+            time.time_ns() // constants.NANOSECS_IN_MILLISECS, constants.TIMESTAMP_LEN, "big"
+        )
+        return ULID(timestamp + randomness)
+
+    def __aiter__(self: S) -> S:
+        return self
+
+    async def __anext__(self) -> ULID:
+        return await self.next()
+
+    async def __aenter__(self: S) -> S:
+        self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    def _random_bytes(self, n: int) -> bytes:
+        return (self._entropy or entropy.random_bytes)(n)
+
+    def _refill(self) -> None:
+        while True:
+            self._wanted.wait()
+            self._wanted.clear()
+            if self._closed:
+                return
+            missing = self.high - len(self._pool)
+            if missing <= 0:
+                continue
+            randomness = self._random_bytes(constants.RANDOMNESS_LEN * missing)
+            self._pool.extend([
+                randomness[i : i + constants.RANDOMNESS_LEN]
+                for i in range(0, len(randomness), constants.RANDOMNESS_LEN)
+            ])
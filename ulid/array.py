@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import Any
+from typing import overload
+
+from ulid import _parse_records
+from ulid import base32
+from ulid import constants
+from ulid import ULID
+
+
+# The timestamp of a 16 byte record as big-endian 16 and 32 bit integers
+_TIMESTAMP = struct.Struct(">HI10x")
+
+# Any object that supports slicing and `find`, e.g. `bytes`, `bytearray` or `mmap.mmap`
+Buffer = Any
+
+
+class ULIDArray(Sequence[ULID]):
+    """A compact container that stores ULIDs as consecutive 16 byte records in a single buffer.
+
+    In contrast to a `list` of :class:`ULID`-objects, only the 16 bytes of each ULID are stored.
+    The :class:`ULID`-objects are created on demand when the array is indexed or iterated.
+
+    Slicing an array with a step of 1 returns a view on the same buffer without copying it. In
+    place operations like :meth:`sort` are therefore visible in all views of a buffer, while
+    appending to an array never affects other arrays.
+
+    Examples:
+
+        >>> array = ULIDArray([ULID(), ULID()])
+        >>> array.append(ULID())
+        >>> len(array)
+        3
+        >>> array[0]
+        ULID(01JAA4M3QGM8H2Z3R3VJDW0NJH)
+        >>> array.to_strs()
+        ['01JAA4M3QGM8H2Z3R3VJDW0NJH', '01JAA4M3QGPXWC4V3ASJ8KBK8A', '01JAA4M3QGX2XHWJ9T3FSQWD4F']
+
+    Args:
+        values (Iterable[ULID | bytes]): The initial ULIDs of the array.
+    """
+
+    __slots__ = ("_data", "_start", "_stop", "_sorted")
+
+    def __init__(self, values: Iterable[ULID | bytes] = ()) -> None:
+        self._data: Buffer = bytearray()
+        self._start = 0
+        self._stop = 0
+        self._sorted = True
+        self.extend(values)
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> ULIDArray:
+        """Create a new :class:`ULIDArray` from a buffer of concatenated 16 byte records.
+
+        The buffer is not copied. Any object that supports slicing and ``find`` can be used, e.g.
+        `bytes`, `bytearray` or :class:`mmap.mmap`. Note that sorting the array modifies a
+        `bytearray` in place.
+        """
+        if len(data) % constants.BYTES_LEN:
+            raise ValueError("Buffer size has to be a multiple of 16 bytes.")
+        return cls._view(data, 0, len(data), is_sorted=False)
+
+    @classmethod
+    def from_strs(cls, strings: Iterable[str]) -> ULIDArray:
+        """Create a new :class:`ULIDArray` from base32 encoded strings."""
+        decode = base32.decode
+        return cls._view(bytearray().join([decode(s) for s in strings]), is_sorted=False)
+
+    @classmethod
+    def parse_many(
+        cls, values: Iterable[Any], *, errors: list[tuple[int, Exception]] | None = None
+    ) -> ULIDArray:
+        """Create a new :class:`ULIDArray` from values of any type supported by
+        :meth:`.ULID.parse` without creating :class:`ULID`-objects.
+
+        See :meth:`.ULID.parse_many` for the handling of `errors`.
+        """
+        return cls._view(bytearray().join(_parse_records(values, errors)), is_sorted=False)
+
+    @classmethod
+    def _view(
+        cls, data: Buffer, start: int = 0, stop: int | None = None, *, is_sorted: bool
+    ) -> ULIDArray:
+        array = cls.__new__(cls)
+        array._data = data  # noqa: SLF001
+        array._start = start  # noqa: SLF001
+        array._stop = len(data) if stop is None else stop  # noqa: SLF001
+        array._sorted = is_sorted  # noqa: SLF001
+        return array
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes that are used to store the ULIDs."""
+        return self._stop - self._start
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether the array is known to be sorted. This is the case after :meth:`sort` has been
+        called and as long as values are only appended in ascending order.
+        """
+        return self._sorted
+
+    def to_strs(self) -> list[str]:
+        """Encode all ULIDs of the array as base32 strings."""
+        encode = base32.encode
+        data = self._data
+        return [
+            encode(data[i : i + constants.BYTES_LEN])
+            for i in range(self._start, self._stop, constants.BYTES_LEN)
+        ]
+
+    def milliseconds(self) -> list[int]:
+        """Return the timestamps of all ULIDs of the array as epoch time in milliseconds.
+
+        The timestamps are read directly from the records without creating any
+        :class:`ULID`-objects, e.g. to bucket the ULIDs of a buffer by time with
+        ``ULIDArray.from_bytes(data).milliseconds()``.
+        """
+        with memoryview(self._data) as view:
+            # Each timestamp is unpacked as its upper 16 and lower 32 bits.
+            return [
+                (high << 32) | low
+                for high, low in _TIMESTAMP.iter_unpack(view[self._start : self._stop])
+            ]
+
+    def append(self, value: ULID | bytes) -> None:
+        """Append a single ULID to the end of the array."""
+        record = _to_record(value)
+        if self._sorted and self._stop > self._start and record < self._record(len(self) - 1):
+            self._sorted = False
+        self._grow(record)
+
+    def extend(self, values: Iterable[ULID | bytes]) -> None:
+        """Append all ULIDs from the given iterable to the end of the array."""
+        if isinstance(values, ULIDArray):
+            if len(values) == 0:
+                return
+            self._sorted = (
+                self._sorted
+                and values.is_sorted
+                and (len(self) == 0 or values[0].bytes >= self._record(len(self) - 1))
+            )
+            self._grow(bytes(values))
+            return
+        records = [_to_record(value) for value in values]
+        if not records:
+            return
+        if self._sorted:
+            if len(self) > 0:
+                records.insert(0, self._record(len(self) - 1))
+                self._sorted = all(a <= b for a, b in zip(records, records[1:]))
+                del records[0]
+            else:
+                self._sorted = all(a <= b for a, b in zip(records, records[1:]))
+        self._grow(b"".join(records))
+
+    def sort(self) -> None:
+        """Sort the array in place. Since the timestamp is stored in the most significant bytes,
+        this sorts the ULIDs by their creation time.
+        """
+        if self._sorted:
+            return
+        records = sorted(self._records())
+        if not isinstance(self._data, bytearray):
+            self._data = bytearray(self.nbytes)
+            self._start, self._stop = 0, len(self._data)
+        self._data[self._start : self._stop] = b"".join(records)
+        self._sorted = True
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Return the first index of `value`. Uses a binary search if the array is sorted.
+
+        Raises:
+            ValueError: If the value is not present.
+        """
+        length = len(self)
+        start, stop, _ = slice(start, stop).indices(length)
+        try:
+            record = _to_record(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{value!r} is not in ULIDArray") from None
+        if self._sorted:
+            index = self._bisect_left(record, start, stop)
+            if index < stop and self._record(index) == record:
+                return index
+        else:
+            data = self._data
+            offset = self._start + start * constants.BYTES_LEN
+            end = self._start + stop * constants.BYTES_LEN
+            while (offset := data.find(record, offset, end)) != -1:
+                if (offset - self._start) % constants.BYTES_LEN == 0:
+                    return (offset - self._start) // constants.BYTES_LEN
+                offset += 1
+        raise ValueError(f"{value!r} is not in ULIDArray")
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return (self._stop - self._start) // constants.BYTES_LEN
+
+    @overload
+    def __getitem__(self, index: int) -> ULID: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ULIDArray: ...
+
+    def __getitem__(self, index: int | slice) -> ULID | ULIDArray:
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step == 1:
+                stop = max(start, stop)
+                return self._view(
+                    self._data,
+                    self._start + start * constants.BYTES_LEN,
+                    self._start + stop * constants.BYTES_LEN,
+                    is_sorted=self._sorted,
+                )
+            records = [self._record(i) for i in range(start, stop, step)]
+            return self._view(bytearray().join(records), is_sorted=False)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("ULIDArray index out of range")
+        return ULID(self._record(index))
+
+    def __iter__(self) -> Iterator[ULID]:
+        for record in self._records():
+            yield ULID(record)
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._data[self._start : self._stop])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ULIDArray):
+            return bytes(self) == bytes(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ULIDArray({self.to_strs()!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__.from_bytes, (bytearray(bytes(self)),)
+
+    def _record(self, index: int) -> bytes:
+        offset = self._start + index * constants.BYTES_LEN
+        return bytes(self._data[offset : offset + constants.BYTES_LEN])
+
+    def _records(self) -> Iterator[bytes]:
+        data = self._data
+        for offset in range(self._start, self._stop, constants.BYTES_LEN):
+            yield bytes(data[offset : offset + constants.BYTES_LEN])
+
+    def _bisect_left(self, record: bytes, lo: int, hi: int) -> int:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid) < record:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _grow(self, records: bytes) -> None:
+        # Only an array that owns the end of a bytearray can grow it in place. Views and arrays
+        # that are backed by immutable buffers copy their records before.
+        data = self._data
+        if isinstance(data, bytearray) and self._start == 0 and self._stop == len(data):
+            try:
+                data += records
+            except BufferError:
+                # The buffer is exported, e.g. as memoryview, and cannot be resized.
+                pass
+            else:
+                self._stop = len(data)
+                return
+        self._data = bytearray(data[self._start : self._stop]) + records
+        self._start, self._stop = 0, len(self._data)
+
+
+def _to_record(value: ULID | bytes) -> bytes:
+    if isinstance(value, ULID):
+        return value.bytes
+    if isinstance(value, (bytes, bytearray)) and len(value) == constants.BYTES_LEN:
+        return bytes(value)
+    raise TypeError("Value has to be of type ULID or bytes of length 16")
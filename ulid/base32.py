@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Sequence
 
 from ulid import constants
@@ -141,7 +146,7 @@ DECODE: Sequence[int] = [
 ]
 
 
-def encode(binary: bytes) -> str:
+def encode_table(binary: bytes) -> str:
     if len(binary) != constants.BYTES_LEN:
         raise ValueError("ULID has to be exactly 16 bytes long")
     return encode_timestamp(binary[: constants.TIMESTAMP_LEN]) + encode_randomness(
@@ -191,7 +196,7 @@ def encode_randomness(binary: bytes) -> str:
     ])
 
 
-def decode(encoded: str) -> bytes:
+def decode_table(encoded: str) -> bytes:
     if len(encoded) != constants.REPR_LEN:
         raise ValueError("Encoded ULID has to be exactly 26 characters long.")
     if any((c not in ENCODE) for c in encoded):
@@ -236,3 +241,158 @@ def decode_randomness(encoded: str) -> bytes:
         ((lut[values[12]] << 7) | (lut[values[13]] << 2) | (lut[values[14]] >> 3)) & 0xFF,
         ((lut[values[14]] << 5) | (lut[values[15]])) & 0xFF,
     ])
+
+
+# Lookup table for all 1024 combinations of two characters, so that the 128 bit integer value of a
+# ULID can be encoded in 13 steps of 10 bits each. The first pair only covers the top 8 bits.
+ENCODE_PAIRS: Sequence[str] = [a + b for a in ENCODE for b in ENCODE]
+
+# Translation table that maps every character of the alphabet to the digit with the same value
+# that is understood by Python's `int(value, 32)`. All other characters are mapped to `!` which is
+# rejected by `int`, so that validation and decoding happen in a single pass.
+DECODE_INT: bytes = bytes(
+    ord("0123456789abcdefghijklmnopqrstuv"[ENCODE.index(chr(i))]) if chr(i) in ENCODE else ord("!")
+    for i in range(256)
+)
+
+
+def encode_int(binary: bytes) -> str:
+    if len(binary) != constants.BYTES_LEN:
+        raise ValueError("ULID has to be exactly 16 bytes long")
+    value = int.from_bytes(binary, "big")
+    lut = ENCODE_PAIRS
+    return "".join([
+        lut[value >> 120],
+        lut[(value >> 110) & 0x3FF],
+        lut[(value >> 100) & 0x3FF],
+        lut[(value >> 90) & 0x3FF],
+        lut[(value >> 80) & 0x3FF],
+        lut[(value >> 70) & 0x3FF],
+        lut[(value >> 60) & 0x3FF],
+        lut[(value >> 50) & 0x3FF],
+        lut[(value >> 40) & 0x3FF],
+        lut[(value >> 30) & 0x3FF],
+        lut[(value >> 20) & 0x3FF],
+        lut[(value >> 10) & 0x3FF],
+        lut[value & 0x3FF],
+    ])
+
+
+def decode_int(encoded: str) -> bytes:
+    if len(encoded) != constants.REPR_LEN:
+        raise ValueError("Encoded ULID has to be exactly 26 characters long.")
+    try:
+        value = int(encoded.encode("ascii", "replace").translate(DECODE_INT), 32)
+    except ValueError:
+        raise ValueError(f"Encoded ULID can only consist of letters in {ENCODE}.") from None
+    # https://github.com/ulid/spec?tab=readme-ov-file#overflow-errors-when-parsing-base32-strings
+    if value > constants.MAX_INT:
+        raise ValueError(
+            f"Timestamp value {encoded[: constants.TIMESTAMP_REPR_LEN]} is too large and will "
+            "overflow 128-bits."
+        )
+    return int.to_bytes(value, constants.BYTES_LEN, "big")
+
+
+def decode_milliseconds(encoded: str | bytes) -> int:
+    """Decode only the timestamp of an encoded ULID to epoch time in milliseconds.
+
+    Only the first 10 characters are validated and decoded, so that this is considerably faster
+    than decoding the whole ULID for jobs that only need its time, e.g. bucketing or routing by
+    time. The ULID can be given as 26 character string, as its 10 character timestamp prefix or
+    as either of both encoded as ASCII `bytes`.
+
+    Examples:
+
+        >>> decode_milliseconds("01E75HZVW36EAKE1X5HQHM4BTB")
+        1588257207560
+
+    Raises:
+        ValueError: If the value has an invalid length, the timestamp contains characters that
+            are not in the alphabet or it would overflow 48 bits.
+    """
+    if len(encoded) != constants.REPR_LEN and len(encoded) != constants.TIMESTAMP_REPR_LEN:
+        raise ValueError("Encoded ULID has to be exactly 26 or 10 characters long.")
+    prefix = encoded[: constants.TIMESTAMP_REPR_LEN]
+    if isinstance(prefix, str):
+        prefix = prefix.encode("ascii", "replace")
+    try:
+        value = int(prefix.translate(DECODE_INT), 32)
+    except ValueError:
+        raise ValueError(f"Encoded ULID can only consist of letters in {ENCODE}.") from None
+    # https://github.com/ulid/spec?tab=readme-ov-file#overflow-errors-when-parsing-base32-strings
+    if value > constants.MAX_TIMESTAMP:
+        raise ValueError(
+            f"Timestamp value {prefix.decode()} is too large and will overflow 48-bits."
+        )
+    return value
+
+
+def decode_milliseconds_many(values: Iterable[str | bytes]) -> list[int]:
+    """Decode only the timestamps of many encoded ULIDs. See :func:`decode_milliseconds`.
+
+    Raises:
+        ValueError: If any of the values is invalid.
+    """
+    lut = DECODE_INT
+    result: list[int] = []
+    append = result.append
+    for encoded in values:
+        if len(encoded) != constants.REPR_LEN and len(encoded) != constants.TIMESTAMP_REPR_LEN:
+            raise ValueError("Encoded ULID has to be exactly 26 or 10 characters long.")
+        prefix = encoded[: constants.TIMESTAMP_REPR_LEN]
+        if isinstance(prefix, str):
+            prefix = prefix.encode("ascii", "replace")
+        try:
+            append(int(prefix.translate(lut), 32))
+        except ValueError:
+            raise ValueError(f"Encoded ULID can only consist of letters in {ENCODE}.") from None
+    # The overflow check of all values at once is cheaper than a check per value.
+    if result and max(result) > constants.MAX_TIMESTAMP:
+        raise ValueError("Timestamp value is too large and will overflow 48-bits.")
+    return result
+
+
+Encoder = Callable[[bytes], str]
+Decoder = Callable[[str], bytes]
+
+BACKENDS: dict[str, tuple[Encoder, Decoder]] = {
+    "table": (encode_table, decode_table),
+    "int": (encode_int, decode_int),
+}
+
+# The `int` backend has been the fastest for encoding and decoding on all supported CPython
+# versions. Use `select_backend` to measure the backends on the host.
+encode: Encoder = encode_int
+decode: Decoder = decode_int
+
+
+def set_backend(name: str) -> None:
+    """Use the backend with the given name for :func:`encode` and :func:`decode`.
+
+    Note that the module functions are replaced, so that references obtained via
+    ``from ulid.base32 import encode`` are not affected.
+    """
+    global encode, decode
+    try:
+        encode, decode = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown base32 backend {name!r}.") from None
+
+
+def select_backend(number: int = 1000) -> str:
+    """Measure the speed of all backends, switch to the fastest one and return its name."""
+    import timeit
+
+    binary = os.urandom(constants.BYTES_LEN)
+    encoded = encode_table(binary)
+
+    def duration(name: str) -> float:
+        encoder, decoder = BACKENDS[name]
+        return timeit.timeit(lambda: encoder(binary), number=number) + timeit.timeit(
+            lambda: decoder(encoded), number=number
+        )
+
+    name = min(BACKENDS, key=duration)
+    set_backend(name)
+    return name
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+from typing import Literal
+
+from ulid import constants
+from ulid import ULID
+from ulid.set import _to_key
+
+
+class ULIDBloomFilter:
+    """A probabilistic filter that detects duplicate ULIDs within a sliding time window.
+
+    The filter is partitioned into `buckets` Bloom filters, each of which covers an equal share of
+    the `window`. A ULID is only ever stored in and looked up in the bucket of its own timestamp.
+    The window ends at the newest timestamp that has been added so far. Whenever it advances,
+    buckets that fall out of it are dropped as a whole, so that the memory stays bounded no matter
+    how long the stream is.
+
+    ULIDs that are older than the window are handled without a lookup according to the
+    `expired` policy: they are either rejected as if they were duplicates or accepted as new.
+
+    Like any Bloom filter it never misses a duplicate within the window, but it reports a new ULID
+    as duplicate with a probability of about `error_rate`, as long as no bucket receives more than
+    its share of `capacity`.
+
+    Examples:
+
+        >>> dedupe = ULIDBloomFilter(window=300, capacity=1_000_000, error_rate=0.001)
+        >>> dedupe.add(ulid)
+        True
+        >>> dedupe.add(ulid)
+        False
+        >>> ulid in dedupe
+        True
+
+    Args:
+        window (float): The length of the window in seconds.
+        capacity (int): The expected number of ULIDs per window.
+        error_rate (float): The targeted probability of false positives.
+        buckets (int): The number of buckets the window is divided into.
+        expired (str): Either ``"reject"`` or ``"accept"`` ULIDs that are older than the window.
+
+    Raises:
+        ValueError: If any of the arguments is out of range.
+    """
+
+    def __init__(
+        self,
+        window: float = 300,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        buckets: int = 10,
+        expired: Literal["reject", "accept"] = "reject",
+    ) -> None:
+        if window <= 0:
+            raise ValueError("Window has to be positive.")
+        if capacity <= 0:
+            raise ValueError("Capacity has to be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate has to be between 0 and 1.")
+        if buckets <= 0:
+            raise ValueError("Number of buckets has to be positive.")
+        if expired not in ("reject", "accept"):
+            raise ValueError(f"Unknown policy {expired!r} for expired ULIDs.")
+        self.window = window
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.expired = expired
+        self._window = max(1, int(window * constants.MILLISECS_IN_SECS))
+        self._span = -(-self._window // buckets)
+        # Each bucket is sized for its share of the capacity with the optimal number of bits and
+        # hash functions for the targeted error rate.
+        per_bucket = -(-capacity // buckets)
+        bits = math.ceil(-per_bucket * math.log(error_rate) / math.log(2) ** 2)
+        self._bits = -(-bits // 8) * 8
+        self._hashes = max(1, round(self._bits / per_bucket * math.log(2)))
+        self._buckets: dict[int, bytearray] = {}
+        self._counts: dict[int, int] = {}
+        self._newest = -1
+
+    @property
+    def hashes(self) -> int:
+        """The number of bits that are set per ULID."""
+        return self._hashes
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes that are currently used by the buckets."""
+        return len(self._buckets) * self._bits // 8
+
+    @property
+    def max_nbytes(self) -> int:
+        """The number of bytes that are used at most. Besides the buckets of the window, the
+        oldest bucket might still be partially within the window.
+        """
+        return (-(-self._window // self._span) + 1) * self._bits // 8
+
+    @property
+    def false_positive_rate(self) -> float:
+        """The estimated probability of false positives for the fullest bucket of the window."""
+        if not self._counts:
+            return 0.0
+        n = max(self._counts.values())
+        return (1 - math.exp(-self._hashes * n / self._bits)) ** self._hashes
+
+    def add(self, value: ULID | bytes | str) -> bool:
+        """Add a ULID to the filter.
+
+        Returns:
+            bool: ``False`` if the ULID has probably been added before or is expired and rejected,
+                otherwise ``True``.
+        """
+        key = _to_key(value)
+        milliseconds = int.from_bytes(key[: constants.TIMESTAMP_LEN], "big")
+        if milliseconds > self._newest:
+            self._advance(milliseconds)
+        elif milliseconds <= self._newest - self._window:
+            return self.expired == "accept"
+        index = milliseconds // self._span
+        bits = self._buckets.get(index)
+        if bits is None:
+            bits = self._buckets[index] = bytearray(self._bits // 8)
+            self._counts[index] = 0
+        new = False
+        for position in self._positions(key):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        if new:
+            self._counts[index] += 1
+        return new
+
+    def clear(self) -> None:
+        """Remove all ULIDs from the filter and reset the window."""
+        self._buckets.clear()
+        self._counts.clear()
+        self._newest = -1
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            key = _to_key(value)
+        except (TypeError, ValueError):
+            return False
+        milliseconds = int.from_bytes(key[: constants.TIMESTAMP_LEN], "big")
+        if milliseconds <= self._newest - self._window:
+            return self.expired == "reject"
+        bits = self._buckets.get(milliseconds // self._span)
+        if bits is None:
+            return False
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        """The number of ULIDs that have been added to the buckets of the window."""
+        return sum(self._counts.values())
+
+    def _positions(self, key: bytes) -> list[int]:
+        # Double hashing with both halves of the hash of the key, which is computed in C and
+        # cached by the bytes object.
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        bits = self._bits
+        return [(h1 + i * h2) % bits for i in range(self._hashes)]
+
+    def _advance(self, milliseconds: int) -> None:
+        self._newest = milliseconds
+        oldest = (milliseconds - self._window) // self._span
+        for index in [index for index in self._buckets if index < oldest]:
+            del self._buckets[index]
+            del self._counts[index]
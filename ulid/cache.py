@@ -0,0 +1,83 @@
+"""An opt-in cache for parsing ULID strings.
+
+Applications that parse the same ULIDs again and again, e.g. the IDs of tenants or resources in
+request handlers, can enable a bounded cache that maps base32 strings to :class:`ulid.ULID`
+objects. It is used by :meth:`ulid.ULID.from_str` and for strings of 26 characters by
+:meth:`ulid.ULID.parse`, e.g.
+
+    >>> from ulid import cache
+    >>> cache.enable(maxsize=4096)
+    >>> ULID.from_str("01E75HZVW36EAKE1X5HQHM4BTB")
+    ULID(01E75HZVW36EAKE1X5HQHM4BTB)
+    >>> cache.info()
+    CacheInfo(hits=0, misses=1, maxsize=4096, currsize=1)
+
+The least recently used entries are evicted once the cache holds `maxsize` entries. Invalid
+strings are never cached. The cache is thread-safe and returns the same object for repeated
+lookups, so that the returned ULIDs must not be modified.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+from typing import cast
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from ulid import base32
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from functools import _lru_cache_wrapper
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the parse cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# The cached `cls(base32.decode(string))` if the cache is enabled
+lookup: Callable[[type[Any], str], Any] | None = None
+_cached: _lru_cache_wrapper[Any] | None = None
+
+
+def _from_str(cls: type[Any], string: str) -> Any:
+    return cls(base32.decode(string))
+
+
+def enable(maxsize: int = 4096) -> None:
+    """Cache up to `maxsize` parsed ULIDs. Enabling the cache again discards its content."""
+    global lookup, _cached  # noqa: PLW0603
+    if maxsize <= 0:
+        raise ValueError("Cache size must be positive.")
+    _cached = functools.lru_cache(maxsize=maxsize)(_from_str)
+    lookup = cast("Callable[[type[Any], str], Any]", _cached)
+
+
+def disable() -> None:
+    """Discard the cache and parse every string again."""
+    global lookup, _cached  # noqa: PLW0603
+    lookup = _cached = None
+
+
+def clear() -> None:
+    """Discard all cached ULIDs and reset the statistics."""
+    if _cached is not None:
+        _cached.cache_clear()
+
+
+def info() -> CacheInfo:
+    """Return the number of hits and misses as well as the maximum and current size of the cache.
+
+    All values are zero if the cache is disabled.
+    """
+    if _cached is None:
+        return CacheInfo(0, 0, 0, 0)
+    hits, misses, maxsize, currsize = _cached.cache_info()
+    return CacheInfo(hits, misses, maxsize or 0, currsize)
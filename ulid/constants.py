@@ -10,6 +10,12 @@ RANDOMNESS_REPR_LEN = 16
 REPR_LEN = TIMESTAMP_REPR_LEN + RANDOMNESS_REPR_LEN
 
 INT_REPR_LEN = 37
+# The smallest integer with `INT_REPR_LEN` decimal digits
+MIN_INT_REPR = 10 ** (INT_REPR_LEN - 1)
 
 HEX_REPR_LEN = 32
 UUID_REPR_LEN = 36  # UUID with dash-separated segments
+
+MAX_TIMESTAMP = (1 << (TIMESTAMP_LEN * 8)) - 1
+MAX_RANDOMNESS = (1 << (RANDOMNESS_LEN * 8)) - 1
+MAX_INT = (1 << (BYTES_LEN * 8)) - 1
@@ -0,0 +1,171 @@
+"""Sources for the random part of ULIDs.
+
+An entropy source is any callable that takes a number of bytes and returns as many random bytes,
+like :func:`os.urandom`, which is the default. The source that is used by :class:`ulid.ULID` and
+by generators without an explicit source can be changed with :func:`set_source`, e.g.
+
+    >>> from ulid import entropy
+    >>> entropy.set_source("buffered")
+
+Sources with internal state, like :class:`BufferedEntropy` and :class:`PseudoRandomEntropy`,
+discard it in child processes after a :func:`os.fork`, so that the child never repeats the
+random values of its parent.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable
+from typing import Protocol
+from typing import TYPE_CHECKING
+
+from ulid import constants
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    import random
+    from weakref import WeakSet
+
+
+# A callable that returns the given number of random bytes
+Entropy = Callable[[int], bytes]
+
+
+class BufferedEntropy:
+    """A cryptographically secure source that reads `size` bytes at once from `source` and hands
+    them out in slices.
+
+    This replaces one system call per ULID with one per ``size // 10`` ULIDs. Requests for
+    another number of bytes than `chunk_size`, e.g. for many ULIDs at once, are passed on to
+    `source` directly, since they already amortize the system call.
+
+    Args:
+        size (int): The number of bytes that are read from `source` at once.
+        source (Callable[[int], bytes]): The underlying source of randomness.
+        chunk_size (int): The number of bytes that is served from the buffer.
+    """
+
+    def __init__(
+        self,
+        size: int = 65536,
+        source: Entropy = os.urandom,
+        chunk_size: int = constants.RANDOMNESS_LEN,
+    ) -> None:
+        if size < chunk_size:
+            raise ValueError("Buffer size must not be smaller than the chunk size.")
+        self.size = size - size % chunk_size
+        self.source = source
+        self.chunk_size = chunk_size
+        # Taking a chunk with `deque.popleft` is thread-safe without a lock.
+        self._chunks: deque[bytes] = deque()
+        _register_at_fork(self)
+
+    def __call__(self, n: int) -> bytes:
+        if n != self.chunk_size:
+            return self.source(n)
+        while True:
+            try:
+                return self._chunks.popleft()
+            except IndexError:
+                self._refill()
+
+    def reset(self) -> None:
+        """Discard all buffered random bytes."""
+        self._chunks.clear()
+
+    _after_fork = reset
+
+    def _refill(self) -> None:
+        data = self.source(self.size)
+        size = self.chunk_size
+        self._chunks.extend([data[i : i + size] for i in range(0, len(data), size)])
+
+
+class PseudoRandomEntropy:
+    """A fast source that is **not** cryptographically secure.
+
+    The bytes are drawn from a :class:`random.Random` generator, which avoids system calls
+    entirely. ULIDs with such randomness are still unique with high probability, but they are
+    predictable. Only use it for IDs that don't have to be unguessable, e.g. internal IDs.
+
+    Args:
+        seed (int | None): The seed for the generator. By default it is seeded from
+            :func:`os.urandom`. Child processes are always reseeded.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        import random
+
+        self._random: random.Random = random.Random(seed)  # noqa: S311
+        _register_at_fork(self)
+
+    def __call__(self, n: int) -> bytes:
+        return self._random.getrandbits(n * 8).to_bytes(n, "big")
+
+    def reset(self) -> None:
+        """Reseed the generator from :func:`os.urandom`."""
+        self._random.seed()
+
+    _after_fork = reset
+
+
+def secrets_entropy(n: int) -> bytes:
+    """Draw `n` bytes with :func:`secrets.token_bytes`."""
+    import secrets
+
+    return secrets.token_bytes(n)
+
+
+SOURCES: dict[str, Callable[[], Entropy]] = {
+    "os": lambda: os.urandom,
+    "buffered": BufferedEntropy,
+    "secrets": lambda: secrets_entropy,
+    "fast": PseudoRandomEntropy,
+}
+
+random_bytes: Entropy = os.urandom
+
+
+def set_source(source: str | Entropy) -> None:
+    """Use the given source for all ULIDs that are not created by a generator with its own source.
+
+    The source can be given either by one of the names in :data:`SOURCES`, which creates a new
+    instance of it, or as any callable that returns the requested number of random bytes.
+
+    Note that the module attribute :data:`random_bytes` is replaced, so that references obtained
+    via ``from ulid.entropy import random_bytes`` are not affected.
+    """
+    global random_bytes  # noqa: PLW0603
+    if isinstance(source, str):
+        try:
+            source = SOURCES[source]()
+        except KeyError:
+            raise ValueError(f"Unknown entropy source {source!r}.") from None
+    random_bytes = source
+
+
+class _ForkAware(Protocol):
+    def _after_fork(self) -> None: ...
+
+
+_stateful: WeakSet[_ForkAware] | None = None
+
+
+def _register_at_fork(obj: _ForkAware) -> None:
+    """Call ``obj._after_fork()`` in the child process after each :func:`os.fork` for as long as
+    `obj` is alive. This is also used by the generators to discard their state.
+    """
+    global _stateful  # noqa: PLW0603
+    if _stateful is None:
+        from weakref import WeakSet
+
+        _stateful = WeakSet()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_after_fork)
+    _stateful.add(obj)
+
+
+def _after_fork() -> None:
+    for obj in list(_stateful or ()):
+        obj._after_fork()  # noqa: SLF001
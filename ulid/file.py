@@ -0,0 +1,224 @@
+"""A binary file format for large sorted sets of ULIDs.
+
+A file consists of a 16 byte header followed by the 16 byte representations of the ULIDs in
+ascending order. The header holds the magic bytes ``ULID``, the format version and zero padding,
+so that all records are aligned to 16 bytes.
+
+:class:`ULIDFileWriter` appends ULIDs to a file as they arrive, while :class:`ULIDFileReader` maps
+the file into memory, so that opening even files of several gigabytes is instantaneous and only
+the pages that are actually accessed are read from disk.
+
+Examples:
+
+    >>> with ULIDFileWriter("ulids.bin") as writer:
+    ...     writer.write_many(sorted(ulids))
+    >>> with ULIDFileReader("ulids.bin") as reader:
+    ...     ulids[0] in reader
+    ...     reader.time_range(datetime(2024, 10, 1), datetime(2024, 10, 2))
+    True
+    ULIDArray(['01J8ZE6PB0AW0M8P3ZAMXGHBPW', '01J8ZNR4S7G2X7QQ21MW6DVBS9'])
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Sequence
+from typing import Any
+from typing import BinaryIO
+from typing import overload
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+from ulid import constants
+from ulid import search
+from ulid import ULID
+from ulid.array import _to_record
+from ulid.array import ULIDArray
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from datetime import datetime
+
+    StrPath = str | os.PathLike[str]
+
+
+MAGIC = b"ULID"
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION]) + bytes(constants.BYTES_LEN - len(MAGIC) - 1)
+
+W = TypeVar("W", bound="ULIDFileWriter")
+R = TypeVar("R", bound="ULIDFileReader")
+
+
+class ULIDFileWriter:
+    """Write ULIDs in ascending order to a file.
+
+    The records are written through a buffered file, so that writing them one by one is cheap.
+    Since readers rely on the order of the records, every ULID must not be less than the ULID that
+    was written before it.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+        append (bool): Append to an existing file instead of replacing it. A missing file is
+            created, as is the header of an empty file.
+
+    Raises:
+        ValueError: If the existing file is not a valid ULID file.
+    """
+
+    def __init__(self, path: StrPath, *, append: bool = False) -> None:
+        self._last = b""
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            self._file: BinaryIO = open(path, "r+b")  # noqa: SIM115
+            try:
+                size = _check_file(self._file)
+                if size > len(HEADER):
+                    self._file.seek(size - constants.BYTES_LEN)
+                    self._last = self._file.read(constants.BYTES_LEN)
+                self._file.seek(size)
+            except BaseException:
+                self._file.close()
+                raise
+        else:
+            self._file = open(path, "wb")  # noqa: SIM115
+            self._file.write(HEADER)
+
+    def write(self, value: ULID | bytes) -> None:
+        """Append a single ULID to the file.
+
+        Raises:
+            ValueError: If the ULID is less than the previously written ULID.
+        """
+        record = _to_record(value)
+        if record < self._last:
+            raise ValueError("ULIDs have to be written in ascending order.")
+        self._file.write(record)
+        self._last = record
+
+    def write_many(self, values: Iterable[ULID | bytes]) -> None:
+        """Append all ULIDs of the given iterable to the file.
+
+        A sorted :class:`.ULIDArray` is written as a whole without creating any objects.
+
+        Raises:
+            ValueError: If the ULIDs are not in ascending order. In that case nothing is written.
+        """
+        if isinstance(values, ULIDArray) and values.is_sorted:
+            if len(values) == 0:
+                return
+            first = bytes(values[0])
+            last = bytes(values[-1])
+            data = bytes(values)
+        else:
+            records = [_to_record(value) for value in values]
+            if not records:
+                return
+            if not all(a <= b for a, b in zip(records, records[1:])):
+                raise ValueError("ULIDs have to be written in ascending order.")
+            first, last = records[0], records[-1]
+            data = b"".join(records)
+        if first < self._last:
+            raise ValueError("ULIDs have to be written in ascending order.")
+        self._file.write(data)
+        self._last = last
+
+    def flush(self) -> None:
+        """Write all buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self: W) -> W:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class ULIDFileReader(Sequence[ULID]):
+    """A read-only, memory-mapped view on a file that was written by :class:`ULIDFileWriter`.
+
+    The reader is a sequence of :class:`ULID`-objects, which are created on demand. Membership
+    tests and :meth:`index` use a binary search and :meth:`time_range` selects all ULIDs within a
+    time range with two binary searches. Slices and the result of :meth:`time_range` are
+    :class:`.ULIDArray` views on the mapped file that must not be used after the reader is closed.
+    ULIDs that are appended to the file after it has been opened are not visible.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+
+    Raises:
+        ValueError: If the file is not a valid ULID file.
+    """
+
+    def __init__(self, path: StrPath) -> None:
+        with open(path, "rb") as f:
+            size = _check_file(f)
+            self._mmap = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        self._array = ULIDArray._view(self._mmap, len(HEADER), size, is_sorted=True)  # noqa: SLF001
+
+    @property
+    def array(self) -> ULIDArray:
+        """All ULIDs of the file as :class:`.ULIDArray` view."""
+        return self._array
+
+    def time_range(
+        self, start: datetime | float | None = None, end: datetime | float | None = None
+    ) -> ULIDArray:
+        """Select all ULIDs that have been created between `start` and `end`.
+
+        See :func:`ulid.search.time_range` for the supported bounds.
+        """
+        return search.time_range(self._array, start, end)
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """Return the index of `value` with a binary search.
+
+        Raises:
+            ValueError: If the value is not present.
+        """
+        return self._array.index(value, start, stop)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    def __enter__(self: R) -> R:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    @overload
+    def __getitem__(self, index: int) -> ULID: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ULIDArray: ...
+
+    def __getitem__(self, index: int | slice) -> ULID | ULIDArray:
+        return self._array[index]
+
+    def __iter__(self) -> Iterator[ULID]:
+        return iter(self._array)
+
+
+def _check_file(f: BinaryIO) -> int:
+    """Validate the header and size of the file and return its size."""
+    size = os.fstat(f.fileno()).st_size
+    f.seek(0)
+    if f.read(len(HEADER)) != HEADER:
+        raise ValueError("Not a ULID file or unsupported format version.")
+    if size % constants.BYTES_LEN:
+        raise ValueError("File size has to be a multiple of 16 bytes.")
+    return size
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ulid import constants
+from ulid import entropy
+from ulid import ULID
+from ulid.entropy import _register_at_fork
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ulid.entropy import Entropy
+
+
+# At least 48 bits of the random part are left random.
+MAX_NODE_BITS = 32
+
+
+class ULIDGenerator:
+    """A thread-safe generator for monotonically increasing :class:`ULID`-objects.
+
+    The randomness part is drawn only once per millisecond. All further ULIDs that are created
+    within the same millisecond reuse it and increment it by one, as described in the
+    `monotonicity section <https://github.com/ulid/spec#monotonicity>`_ of the specification.
+    Thus ULIDs from the same generator are strictly ordered by their creation even if they share
+    the same timestamp. If the system clock moves backwards, the generator keeps using the last
+    timestamp it has seen.
+
+    The state of the generator is discarded in child processes after a :func:`os.fork`, so that
+    a child draws new randomness instead of continuing the sequence of its parent.
+
+    Multiple processes or hosts can reserve the highest `node_bits` bits of the random part for a
+    distinct `node_id`. Their ULIDs can then never collide, even if they are created within the same
+    millisecond, without any coordination between the generators. In a pre-forking server, create
+    the generator in each worker, e.g. with the index of the worker as `node_id`.
+
+    Examples:
+
+        >>> generator = ULIDGenerator()
+        >>> generator.generate()
+        ULID(01JA9YAFDZ1QFMGY2Q8B0W3T7A)
+        >>> generator.generate()
+        ULID(01JA9YAFDZ1QFMGY2Q8B0W3T7B)
+        >>> ULIDGenerator(node_id=5, node_bits=4).generate()
+        ULID(01JA9YAFE0AJVXBNPC9PGVRTMR)
+
+    Args:
+        entropy (Callable[[int], bytes] | None): The source of randomness, see
+            :mod:`ulid.entropy`. Defaults to the globally selected source.
+        node_id (int): The value of the reserved bits.
+        node_bits (int): The number of reserved bits, at most 32.
+
+    Raises:
+        OverflowError: If more than 2^(80 - `node_bits`) ULIDs are requested within the same
+            millisecond.
+    """
+
+    def __init__(
+        self, entropy: Entropy | None = None, *, node_id: int = 0, node_bits: int = 0
+    ) -> None:
+        if not 0 <= node_bits <= MAX_NODE_BITS:
+            raise ValueError(f"Number of node bits must be between 0 and {MAX_NODE_BITS}.")
+        if not 0 <= node_id < 1 << node_bits:
+            raise ValueError(f"Node ID must be between 0 and {(1 << node_bits) - 1}.")
+        self._entropy = entropy
+        self.node_id = node_id
+        self.node_bits = node_bits
+        random_bits = constants.RANDOMNESS_LEN * 8 - node_bits
+        self._node = node_id << random_bits
+        self._mask = (1 << random_bits) - 1
+        self._lock = threading.Lock()
+        self._milliseconds = -1
+        self._randomness = 0
+        _register_at_fork(self)
+
+    def reset(self) -> None:
+        """Discard the state of the generator, so that the next ULID draws new randomness.
+
+        This happens automatically in child processes after a :func:`os.fork`.
+        """
+        with self._lock:
+            self._milliseconds = -1
+            self._randomness = 0
+
+    def _after_fork(self) -> None:
+        # The lock might have been held by another thread of the parent process.
+        self._lock = threading.Lock()
+        self.reset()
+
+    def generate(self) -> ULID:
+        """Create a new :class:`ULID` from the current time that is greater than all ULIDs
+        previously returned by this generator.
+        """
+        milliseconds, randomness = self._reserve(
+            time.time_ns() // constants.NANOSECS_IN_MILLISECS, 1
+        )
+        return ULID.from_bytes(
+            int.to_bytes(milliseconds, constants.TIMESTAMP_LEN, "big")
+            + int.to_bytes(randomness, constants.RANDOMNESS_LEN, "big")
+        )
+
+    def generate_many(self, n: int) -> list[ULID]:
+        """Create `n` new strictly increasing :class:`ULID`-objects from the current time.
+
+        The clock is read only once and at most one random value is drawn for the whole batch.
+        """
+        data = self.generate_bytes(n)
+        return [
+            ULID(data[i : i + constants.BYTES_LEN])
+            for i in range(0, len(data), constants.BYTES_LEN)
+        ]
+
+    def generate_bytes(self, n: int, timestamp: int | None = None) -> bytes:
+        """Create `n` new strictly increasing ULIDs and return them as concatenated 16 byte
+        records without creating any :class:`ULID`-objects.
+
+        If `timestamp` is given in milliseconds it is used instead of the current time. As for
+        the clock, a timestamp that is lower than a previously used one is replaced by the latter.
+
+        Examples:
+
+            >>> data = generator.generate_bytes(1000)
+            >>> len(data)
+            16000
+        """
+        if n < 0:
+            raise ValueError("Number of ULIDs must not be negative.")
+        if n == 0:
+            return b""
+        if timestamp is None:
+            timestamp = time.time_ns() // constants.NANOSECS_IN_MILLISECS
+        milliseconds, randomness = self._reserve(timestamp, n)
+        prefix = int.to_bytes(milliseconds, constants.TIMESTAMP_LEN, "big")
+        return b"".join([
+            prefix + int.to_bytes(value, constants.RANDOMNESS_LEN, "big")
+            for value in range(randomness, randomness + n)
+        ])
+
+    def _reserve(self, milliseconds: int, count: int) -> tuple[int, int]:
+        """Reserve `count` consecutive random values and return the timestamp together with the
+        first of them.
+        """
+        with self._lock:
+            if milliseconds <= self._milliseconds:
+                milliseconds = self._milliseconds
+                randomness = self._randomness + 1
+            else:
+                random_bytes = self._entropy or entropy.random_bytes
+                randomness = self._node | (
+                    int.from_bytes(random_bytes(constants.RANDOMNESS_LEN), "big") & self._mask
+                )
+            last = randomness + count - 1
+            if last > self._node | self._mask:
+                raise OverflowError("Randomness of ULID overflowed within the same millisecond.")
+            self._milliseconds = milliseconds
+            self._randomness = last
+        return milliseconds, randomness
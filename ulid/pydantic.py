@@ -0,0 +1,113 @@
+"""Strict Pydantic types for ULIDs.
+
+By default a :class:`ulid.ULID` field accepts ULID objects, strings, integers and bytes. The
+annotated types of this module restrict the accepted input to a single representation, e.g.
+
+    >>> from pydantic import BaseModel
+    >>> from ulid.pydantic import StrULID
+    >>> class Model(BaseModel):
+    ...     id: StrULID
+    >>> Model(id="01E75HZVW36EAKE1X5HQHM4BTB")
+    Model(id=ULID(01E75HZVW36EAKE1X5HQHM4BTB))
+
+Already validated :class:`ulid.ULID` objects are accepted in Python mode as well, so that models
+can be copied and re-validated from :meth:`pydantic.BaseModel.model_dump`. This module requires
+the optional dependency ``pydantic``, which can be installed with
+``pip install python-ulid[pydantic]``.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+from typing import Any
+from typing import Literal
+from typing import TYPE_CHECKING
+
+from pydantic_core import core_schema
+from pydantic_core import PydanticCustomError
+
+from ulid import base32
+from ulid import constants
+from ulid import ULID
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydantic import GetCoreSchemaHandler
+    from pydantic import GetJsonSchemaHandler
+    from pydantic.json_schema import JsonSchemaValue
+    from pydantic_core import CoreSchema
+
+
+class ULIDValidation:
+    """Annotation that selects the input that is accepted for a :class:`ulid.ULID` field.
+
+    Input from JSON is always expected as a base32 string.
+
+    Args:
+        mode (str): Either ``"str"`` to only accept 26 character base32 strings or ``"bytes"``
+            to only accept 16 bytes.
+    """
+
+    def __init__(self, mode: Literal["str", "bytes"]) -> None:
+        if mode not in ("str", "bytes"):
+            raise ValueError(f"Unknown validation mode {mode!r}.")
+        self.mode = mode
+
+    def __get_pydantic_core_schema__(
+        self, source: type[ULID], handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        # Like the default schema of `ULID` these are plain validators, which are called exactly
+        # once per value without any further validation by pydantic-core. They report the same
+        # error types as the default schema.
+        def validate_str(value: Any) -> ULID:
+            if isinstance(value, str):
+                try:
+                    return source(base32.decode(value))
+                except (ValueError, OverflowError) as err:
+                    raise PydanticCustomError("ulid_format", "Unrecognized format") from err
+            if isinstance(value, source):
+                return value
+            raise PydanticCustomError("ulid_type", "Input should be a valid ULID string")
+
+        def validate_bytes(value: Any) -> ULID:
+            if isinstance(value, bytes):
+                try:
+                    return source(value)
+                except (ValueError, OverflowError) as err:
+                    raise PydanticCustomError("ulid_format", "Unrecognized format") from err
+            if isinstance(value, source):
+                return value
+            raise PydanticCustomError("ulid_type", "Input should be 16 bytes")
+
+        serialization = core_schema.to_string_ser_schema(when_used="json-unless-none")
+        if self.mode == "str":
+            return core_schema.no_info_plain_validator_function(
+                validate_str, serialization=serialization
+            )
+        # JSON has no binary type, so that ULIDs are always read from JSON as strings.
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_plain_validator_function(validate_str),
+            python_schema=core_schema.no_info_plain_validator_function(validate_bytes),
+            serialization=serialization,
+        )
+
+    def __get_pydantic_json_schema__(
+        self, schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return handler(
+            core_schema.str_schema(
+                pattern=r"[A-Z0-9]{26}",
+                min_length=constants.REPR_LEN,
+                max_length=constants.REPR_LEN,
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"ULIDValidation({self.mode!r})"
+
+
+#: A :class:`ulid.ULID` that only accepts its base32 string representation.
+StrULID = Annotated[ULID, ULIDValidation("str")]
+
+#: A :class:`ulid.ULID` that only accepts its 16 byte representation, or a string in JSON.
+BytesULID = Annotated[ULID, ULIDValidation("bytes")]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+from typing import Any
+from typing import cast
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+from ulid import ULID
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datetime import datetime
+
+
+S = TypeVar("S", bound=Sequence[Any])
+
+
+def time_range(
+    values: S, start: datetime | float | None = None, end: datetime | float | None = None
+) -> S:
+    """Select all ULIDs of a sorted sequence that have been created between `start` and `end`.
+
+    The bounds can be given as :class:`datetime`, as `float` in seconds or as `int` in
+    milliseconds. Both bounds are inclusive with millisecond precision and can be omitted to
+    select an open range. The sequence can hold :class:`ULID`-objects, their 16 byte
+    representation or their canonical 26 character string representation. Since ULIDs sort by
+    their timestamp, the range is found with two binary searches without decoding any of the
+    values. The result is a slice of the given sequence, which is a view for a
+    :class:`.ULIDArray`.
+
+    Examples:
+
+        >>> ulids = sorted(ulids)
+        >>> time_range(ulids, datetime(2024, 10, 1), datetime(2024, 10, 2))
+        [ULID(01J8ZE6PB0AW0M8P3ZAMXGHBPW), ULID(01J8ZNR4S7G2X7QQ21MW6DVBS9)]
+    """
+    if len(values) == 0:
+        return cast(S, values[0:0])
+    lo = 0 if start is None else bisect.bisect_left(values, _bound(ULID.min_for(start), values))
+    hi = (
+        len(values)
+        if end is None
+        else bisect.bisect_right(values, _bound(ULID.max_for(end), values), lo)
+    )
+    return cast(S, values[lo:hi])
+
+
+def _bound(ulid: ULID, values: Sequence[Any]) -> Any:
+    sample = values[0]
+    if isinstance(sample, ULID):
+        return ulid
+    if isinstance(sample, (bytes, bytearray)):
+        return ulid.bytes
+    if isinstance(sample, str):
+        return str(ulid)
+    raise TypeError(f"Cannot search sequence of type {type(sample)}")
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import MutableSet
+from typing import Any
+
+from ulid import base32
+from ulid import constants
+from ulid import ULID
+from ulid.array import ULIDArray
+
+
+# Slots are empty if all their bytes are zero. The ULID with the value 0 is tracked separately.
+EMPTY = bytes(constants.BYTES_LEN)
+
+# The maximum ratio of used slots before the table is doubled in size
+MAX_LOAD = 0.75
+
+MIN_SLOTS = 8
+
+
+class ULIDSet(MutableSet[ULID]):
+    """A memory efficient set of ULIDs for the deduplication of large numbers of IDs.
+
+    The ULIDs are stored as 16 byte keys in an open addressing hash table that is backed by a
+    single `bytearray`, which takes about 21 to 43 bytes per ULID depending on the load of the
+    table, instead of about 150 bytes in a `set` of :class:`ULID`-objects. The
+    :class:`ULID`-objects are created on demand when the set is iterated.
+
+    Values can be given as :class:`ULID`-objects, as their 16 byte representation or as their
+    26 character string representation.
+
+    Examples:
+
+        >>> seen = ULIDSet()
+        >>> seen.add(ULID.from_str("01JAA4M3QGM8H2Z3R3VJDW0NJH"))
+        >>> "01JAA4M3QGM8H2Z3R3VJDW0NJH" in seen
+        True
+        >>> seen.update(ULIDArray.from_bytes(data))
+        >>> seen.load_factor
+        0.546875
+
+    Args:
+        values (Iterable[ULID | bytes | str]): The initial ULIDs of the set.
+        capacity (int): The number of ULIDs that can be stored without growing the table.
+    """
+
+    __slots__ = ("_table", "_mask", "_used", "_zero")
+
+    def __init__(self, values: Iterable[ULID | bytes | str] = (), capacity: int = 0) -> None:
+        self._table = bytearray(_slots_for(capacity) * constants.BYTES_LEN)
+        self._mask = len(self._table) // constants.BYTES_LEN - 1
+        self._used = 0
+        self._zero = False
+        self.update(values)
+
+    @property
+    def capacity(self) -> int:
+        """The number of ULIDs that can be stored without growing the table."""
+        return int((self._mask + 1) * MAX_LOAD)
+
+    @property
+    def load_factor(self) -> float:
+        """The ratio of used slots of the table."""
+        return self._used / (self._mask + 1)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes that are used by the table."""
+        return len(self._table)
+
+    def add(self, value: ULID | bytes | str) -> None:
+        """Add a single ULID to the set."""
+        self._add(_to_key(value))
+
+    def update(self, values: Iterable[ULID | bytes | str]) -> None:
+        """Add all ULIDs of the given iterable to the set.
+
+        A :class:`.ULIDArray` is added without creating any :class:`ULID`-objects.
+        """
+        if isinstance(values, ULIDArray):
+            self.reserve(len(self) + len(values))
+            add = self._add
+            for key in values._records():  # noqa: SLF001
+                add(key)
+            return
+        if isinstance(values, (list, tuple)):
+            self.reserve(len(self) + len(values))
+        add = self._add
+        for value in values:
+            add(_to_key(value))
+
+    def discard(self, value: Any) -> None:
+        """Remove a ULID from the set if it is present."""
+        try:
+            key = _to_key(value)
+        except (TypeError, ValueError):
+            return
+        if key == EMPTY:
+            self._zero = False
+            return
+        index = self._find(key)
+        if index < 0:
+            return
+        # Shift the following keys of the same cluster backwards instead of leaving a tombstone,
+        # so that lookups never have to probe deleted slots.
+        table, mask = self._table, self._mask
+        size = constants.BYTES_LEN
+        hole = index
+        while True:
+            index = (index + 1) & mask
+            offset = index * size
+            if table.startswith(EMPTY, offset):
+                break
+            home = hash(bytes(table[offset : offset + size])) & mask
+            # Keys whose home slot is cyclically within (hole, index] stay where they are.
+            if (hole < index and hole < home <= index) or (
+                hole > index and (home > hole or home <= index)
+            ):
+                continue
+            table[hole * size : hole * size + size] = table[offset : offset + size]
+            hole = index
+        table[hole * size : hole * size + size] = EMPTY
+        self._used -= 1
+
+    def clear(self) -> None:
+        """Remove all ULIDs from the set and shrink the table to its minimum size."""
+        self._table = bytearray(MIN_SLOTS * constants.BYTES_LEN)
+        self._mask = MIN_SLOTS - 1
+        self._used = 0
+        self._zero = False
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the table so that `capacity` ULIDs can be stored without growing it again."""
+        slots = _slots_for(capacity)
+        if slots > self._mask + 1:
+            self._resize(slots)
+
+    def to_array(self) -> ULIDArray:
+        """Return all ULIDs of the set in ascending order as :class:`.ULIDArray`."""
+        size = constants.BYTES_LEN
+        table = self._table
+        # Copy the keys into a compact buffer and find the smallest and the largest of them.
+        keys = bytearray(self._used * size)
+        position = 0
+        low, high = b"\xff" * size, b""
+        for offset in range(0, len(table), size):
+            if table.startswith(EMPTY, offset):
+                continue
+            key = table[offset : offset + size]
+            keys[position : position + size] = key
+            position += size
+            if key < low:
+                low = key
+            if key > high:
+                high = key
+        # The keys are sorted without creating objects for all of them at once: a counting sort
+        # distributes them into buckets by the two bytes at which the smallest and the largest key
+        # start to differ, so that only the keys of one bucket at a time are sorted as a list.
+        data = bytearray(len(self) * size)
+        start = size if self._zero else 0
+        if keys:
+            prefix = next((i for i in range(size) if low[i] != high[i]), size - 1)
+            second = min(prefix + 1, size - 1)
+            counts = [0] * 65536
+            for offset in range(0, len(keys), size):
+                counts[(keys[offset + prefix] << 8) | keys[offset + second]] += 1
+            positions = []
+            position = start
+            for count in counts:
+                positions.append(position)
+                position += count * size
+            with memoryview(keys) as view:
+                for offset in range(0, len(keys), size):
+                    bucket = (keys[offset + prefix] << 8) | keys[offset + second]
+                    position = positions[bucket]
+                    data[position : position + size] = view[offset : offset + size]
+                    positions[bucket] = position + size
+            del keys
+            # `positions` now holds the end of every bucket.
+            end = start
+            for count, stop in zip(counts, positions):
+                begin, end = end, stop
+                if count > 1:
+                    records = sorted([bytes(data[i : i + size]) for i in range(begin, end, size)])
+                    data[begin:end] = b"".join(records)
+        return ULIDArray._view(data, is_sorted=True)  # noqa: SLF001
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            key = _to_key(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        if key == EMPTY:
+            return self._zero
+        return self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return self._used + self._zero
+
+    def __iter__(self) -> Iterator[ULID]:
+        for key in self._keys():
+            yield ULID(key)
+
+    def __repr__(self) -> str:
+        return f"ULIDSet({[str(ulid) for ulid in self]!r})"
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._table.__sizeof__()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.to_array(),)
+
+    def _add(self, key: bytes) -> None:
+        if key == EMPTY:
+            self._zero = True
+            return
+        table, mask = self._table, self._mask
+        # The hash of the key is computed in C and cached by the bytes object, which is cheaper
+        # than deriving the slot from the random part in Python. It also spreads the keys of
+        # monotonic generators, whose random parts are consecutive.
+        index = hash(key) & mask
+        while True:
+            offset = index * constants.BYTES_LEN
+            if table.startswith(EMPTY, offset):
+                break
+            if table.startswith(key, offset):
+                return
+            index = (index + 1) & mask
+        table[offset : offset + constants.BYTES_LEN] = key
+        self._used += 1
+        if self._used > (mask + 1) * MAX_LOAD:
+            self._resize((mask + 1) * 2)
+
+    def _find(self, key: bytes) -> int:
+        table, mask = self._table, self._mask
+        index = hash(key) & mask
+        while True:
+            offset = index * constants.BYTES_LEN
+            if table.startswith(key, offset):
+                return index
+            if table.startswith(EMPTY, offset):
+                return -1
+            index = (index + 1) & mask
+
+    def _keys(self) -> Iterator[bytes]:
+        if self._zero:
+            yield EMPTY
+        table = self._table
+        size = constants.BYTES_LEN
+        for offset in self._offsets():
+            yield bytes(table[offset : offset + size])
+
+    def _offsets(self) -> Iterator[int]:
+        table = self._table
+        for offset in range(0, len(table), constants.BYTES_LEN):
+            if not table.startswith(EMPTY, offset):
+                yield offset
+
+    def _resize(self, slots: int) -> None:
+        # Walk the old table by offset, so that only one key at a time exists as an object.
+        old = self._table
+        self._table = bytearray(slots * constants.BYTES_LEN)
+        self._mask = slots - 1
+        self._used = 0
+        add = self._add
+        size = constants.BYTES_LEN
+        for offset in range(0, len(old), size):
+            if not old.startswith(EMPTY, offset):
+                add(bytes(old[offset : offset + size]))
+
+
+def _slots_for(capacity: int) -> int:
+    slots = MIN_SLOTS
+    while slots * MAX_LOAD < capacity:
+        slots *= 2
+    return slots
+
+
+def _to_key(value: ULID | bytes | str) -> bytes:
+    if isinstance(value, ULID):
+        return value.bytes
+    if isinstance(value, str):
+        return base32.decode(value)
+    if isinstance(value, (bytes, bytearray)) and len(value) == constants.BYTES_LEN:
+        return bytes(value)
+    raise TypeError("Value has to be of type ULID, str or bytes of length 16")
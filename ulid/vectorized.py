@@ -0,0 +1,117 @@
+"""Vectorized base32 encoding and decoding of many ULIDs at once using NumPy.
+
+This module requires the optional dependency ``numpy``, which can be installed with
+``pip install python-ulid[numpy]``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ulid import base32
+from ulid import constants
+
+
+ENCODE: npt.NDArray[np.bytes_] = np.frombuffer(base32.ENCODE.encode("ascii"), dtype="S1")
+DECODE: npt.NDArray[np.uint8] = np.full(256, 0xFF, dtype=np.uint8)
+DECODE[ENCODE.view(np.uint8)] = np.arange(len(ENCODE), dtype=np.uint8)
+
+# Every character of the encoded representation covers 5 bits of the 130 bit wide stream that
+# consists of the 128 bits of the ULID prefixed with two zero bits. For each character we select
+# the two adjacent bytes of the (zero-padded) binary input that contain its bits and the amount
+# by which the resulting 16 bit window has to be shifted to the right.
+_ENCODE_OFFSETS = np.arange(constants.REPR_LEN) * 5 + 6
+_ENCODE_INDEX = _ENCODE_OFFSETS // 8
+_ENCODE_SHIFT = (11 - _ENCODE_OFFSETS % 8).astype(np.uint16)
+
+# Every output byte is contained in a window of three adjacent characters of the (zero-padded)
+# encoded input.
+_DECODE_OFFSETS = np.arange(constants.BYTES_LEN) * 8 + 2
+_DECODE_INDEX = _DECODE_OFFSETS // 5
+_DECODE_SHIFT = (7 - _DECODE_OFFSETS % 5).astype(np.uint16)
+
+
+def encode(binary: npt.ArrayLike) -> npt.NDArray[np.bytes_]:
+    """Encode an array of binary ULIDs into their base32 representation.
+
+    Args:
+        binary: An array of shape `(N, 16)` and type `uint8` or a one-dimensional array of type
+            `S16`. A raw buffer of concatenated ULIDs can be passed with
+            ``np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 16)``.
+
+    Returns:
+        An array of shape `(N, 26)` and type `S1`. Use ``.view("S26")[:, 0]`` on the result to get
+        a one-dimensional array of encoded values.
+
+    Raises:
+        ValueError: If the input does not have the expected shape.
+
+    Examples:
+
+        >>> encode(np.zeros((1, 16), dtype=np.uint8)).view("S26")[:, 0]
+        array([b'00000000000000000000000000'], dtype='|S26')
+    """
+    data = _as_records(binary, constants.BYTES_LEN)
+    padded = np.zeros((len(data), constants.BYTES_LEN + 2), dtype=np.uint16)
+    padded[:, 1:-1] = data
+    window = (padded[:, _ENCODE_INDEX] << 8) | padded[:, _ENCODE_INDEX + 1]
+    return np.ascontiguousarray(ENCODE[(window >> _ENCODE_SHIFT) & 0x1F])
+
+
+def decode(encoded: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    """Decode an array of base32 encoded ULIDs into their binary representation.
+
+    Args:
+        encoded: An array of shape `(N, 26)` and type `S1` or `uint8`, or a one-dimensional array
+            (or sequence) of 26 character strings or bytes.
+
+    Returns:
+        An array of shape `(N, 16)` and type `uint8`.
+
+    Raises:
+        ValueError: If the input does not have the expected shape, contains characters outside
+            of the base32 alphabet or encodes a timestamp that would overflow 128 bits.
+    """
+    codes = _as_records(encoded, constants.REPR_LEN)
+    values = DECODE[codes]
+    invalid = np.flatnonzero((values == 0xFF).any(axis=1))  # noqa: PLR2004
+    if len(invalid) > 0:
+        raise ValueError(
+            f"Encoded ULID at index {invalid[0]} can only consist of letters in {base32.ENCODE}."
+        )
+    overflow = np.flatnonzero(values[:, 0] > 7)  # noqa: PLR2004
+    if len(overflow) > 0:
+        raise ValueError(
+            f"Timestamp value at index {overflow[0]} is too large and will overflow 128-bits."
+        )
+    padded = np.zeros((len(values), constants.REPR_LEN + 2), dtype=np.uint16)
+    padded[:, :-2] = values
+    window = (
+        (padded[:, _DECODE_INDEX] << 10)
+        | (padded[:, _DECODE_INDEX + 1] << 5)
+        | padded[:, _DECODE_INDEX + 2]
+    )
+    return np.ascontiguousarray((window >> _DECODE_SHIFT) & 0xFF, dtype=np.uint8)
+
+
+def _as_records(value: Any, length: int) -> npt.NDArray[np.uint8]:
+    array = np.asarray(value)
+    if array.dtype.kind == "U":
+        try:
+            array = np.char.encode(array, "ascii")
+        except UnicodeEncodeError as err:
+            raise ValueError(
+                f"Encoded ULID can only consist of letters in {base32.ENCODE}."
+            ) from err
+    if array.ndim == 1 and array.dtype.kind == "S":
+        if array.dtype.itemsize != length:
+            raise ValueError(f"Values have to be exactly {length} bytes long.")
+        array = np.ascontiguousarray(array).view(np.uint8).reshape(-1, length)
+    elif array.dtype.kind == "S" and array.dtype.itemsize == 1:
+        array = array.view(np.uint8)
+    if array.dtype != np.uint8 or array.ndim != 2 or array.shape[1] != length:  # noqa: PLR2004
+        raise ValueError(f"Expected an array of shape (N, {length}) and type uint8.")
+    return array